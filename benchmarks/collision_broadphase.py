@@ -0,0 +1,70 @@
+"""
+Benchmark Player.update collision cost against the number of platforms.
+
+Run from the repository root:
+    python -m benchmarks.collision_broadphase
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from src.constant import GameResources
+from src.Entity.Platform import Platform
+from src.Entity.Player import Player
+from src.Map.SpatialGrid import SpatialGrid
+
+
+def build_level(game_resources, platform_count):
+    """Lay out platform_count platforms in rows, like a long custom level"""
+    game_resources.platforms.empty()
+    for i in range(platform_count):
+        x = (i % 500) * 250
+        y = 600 - (i // 500) * 150
+        game_resources.platforms.add(Platform(200, 20, x + 100, y))
+
+
+def time_updates(player, frames):
+    """Average Player.update duration in microseconds"""
+    start = time.perf_counter()
+    for _ in range(frames):
+        player.update()
+    elapsed = time.perf_counter() - start
+    pygame.event.clear()
+    return elapsed / frames * 1_000_000
+
+
+def main(frames=2000):
+    game_resources = GameResources()
+    player = Player(game_resources)
+
+    print(f"{'platforms':>10} {'linear (us)':>12} {'grid (us)':>10}")
+    for platform_count in (10, 100, 1000, 10000):
+        build_level(game_resources, platform_count)
+
+        # Stand on the first platform so both passes find real hits
+        first = game_resources.platforms.sprites()[0]
+        player.pos.x = first.rect.centerx
+        player.pos.y = first.rect.top
+        player.rect.midbottom = player.pos
+
+        game_resources.platform_index = None
+        linear = time_updates(player, frames)
+
+        game_resources.platform_index = SpatialGrid.from_sprites(
+            game_resources.platforms
+        )
+        grid = time_updates(player, frames)
+
+        print(f"{platform_count:>10} {linear:>12.1f} {grid:>10.1f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
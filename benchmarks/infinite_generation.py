@@ -0,0 +1,63 @@
+"""
+Benchmark InfiniteMapGenerator.generate_map throughput at every difficulty.
+
+Run from the repository root:
+    python -m benchmarks.infinite_generation [maps per difficulty]
+"""
+
+import sys
+import time
+
+from src.Map.Infinite.InfiniteMapGenerator import InfiniteMapGenerator
+from src.Map.Infinite.JumpEnvelope import JumpEnvelope
+
+
+def print_envelopes():
+    """Solve time, jump height and widest level gap of every movement mode"""
+    modes = {
+        "plain": {},
+        "jump boost": {"jump_boost": 1.5},
+        "speed boost": {"speed_boost": 2},
+        "dash": {"dash": True},
+    }
+    print(f"{'envelope':>12} {'solve ms':>9} {'apex':>6} {'level gap':>10}")
+    for name, options in modes.items():
+        start = time.perf_counter()
+        envelope = JumpEnvelope(**options)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name:>12} {elapsed * 1000:>9.2f} {envelope.apex:>6.0f}"
+            f" {envelope.max_gap(0):>10.0f}"
+        )
+    print()
+
+
+def main(maps=2000):
+    print_envelopes()
+
+    # The generator only builds dicts, it needs no pygame resources
+    generator = InfiniteMapGenerator(None)
+
+    print(
+        f"{'difficulty':>10} {'maps/s':>9} {'ms/map':>7}"
+        f" {'platforms':>10} {'enemies':>8} {'collectibles':>13}"
+    )
+    for difficulty in range(1, 11):
+        platforms = enemies = collectibles = 0
+        start = time.perf_counter()
+        for seed in range(maps):
+            map_data = generator.generate_map(difficulty, seed=seed)
+            platforms += len(map_data["platforms"])
+            enemies += len(map_data["enemies"])
+            collectibles += len(map_data["collectibles"])
+        elapsed = time.perf_counter() - start
+
+        print(
+            f"{difficulty:>10} {maps / elapsed:>9.0f} {elapsed / maps * 1000:>7.3f}"
+            f" {platforms / maps:>10.1f} {enemies / maps:>8.1f}"
+            f" {collectibles / maps:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,128 @@
+"""
+Measure the time to the first frame of the game and check it against a budget.
+
+Each run starts a fresh interpreter with -X importtime, builds the game
+resources like handler() does and draws the first frame of the
+InstructionsScreen. The run fails if the median time is over the budget or if
+a module that should only load on demand (moviepy, PIL...) was imported.
+
+Run from the repository root:
+    python -m benchmarks.startup [--runs N] [--budget MS]
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# Only imported when a video plays or a GIF is decoded
+LAZY_MODULES = ("moviepy", "imageio", "imageio_ffmpeg", "PIL")
+
+FIRST_FRAME = "first frame drawn"
+
+CHILD = f"""
+import sys
+
+from src.handler import initialize_game_resources
+
+resources = initialize_game_resources()
+displaysurface, instructions_screen = resources[1], resources[-1]
+instructions_screen.draw(displaysurface)
+
+import pygame
+
+pygame.display.update()
+print({FIRST_FRAME!r}, flush=True)
+print(" ".join(name for name in {LAZY_MODULES!r} if name in sys.modules), flush=True)
+"""
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| *(\S+)")
+
+
+def run_once():
+    """
+    Start the game in a new interpreter and wait for its first frame.
+
+    Returns:
+        tuple: (milliseconds to the first frame, lazy modules imported,
+            {top-level package: cumulative import microseconds})
+    """
+    with tempfile.TemporaryFile("w+") as import_log:
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "-X", "importtime", "-c", CHILD],
+            stdout=subprocess.PIPE,
+            stderr=import_log,
+            text=True,
+        )
+        elapsed = None
+        for line in process.stdout:
+            if line.strip() == FIRST_FRAME:
+                elapsed = (time.perf_counter() - start) * 1000
+                break
+        loaded = process.stdout.read().split()
+        process.wait()
+        if elapsed is None:
+            raise RuntimeError("the game exited before drawing its first frame")
+
+        import_log.seek(0)
+        imports = {}
+        for line in import_log:
+            match = IMPORT_LINE.match(line)
+            # Top-level packages, wherever they are first imported from
+            if match and "." not in match.group(3):
+                name = match.group(3)
+                imports[name] = max(imports.get(name, 0), int(match.group(2)))
+    return elapsed, loaded, imports
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="number of cold starts")
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=1000,
+        help="maximum median time to first frame in ms",
+    )
+    parser.add_argument("--top", type=int, default=8, help="slowest imports to list")
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    times = []
+    lazy_loaded = set()
+    imports = {}
+    for _ in range(args.runs):
+        elapsed, loaded, imports = run_once()
+        times.append(elapsed)
+        lazy_loaded.update(loaded)
+
+    median = statistics.median(times)
+    print(
+        f"time to first frame: median {median:.0f} ms, min {min(times):.0f} ms,"
+        f" max {max(times):.0f} ms over {args.runs} runs (budget {args.budget:.0f} ms)"
+    )
+    print("slowest packages to import in the last run:")
+    for name, micros in sorted(imports.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"{micros / 1000:>10.1f} ms  {name}")
+
+    failed = False
+    if lazy_loaded:
+        print(f"FAIL: imported at startup: {', '.join(sorted(lazy_loaded))}")
+        failed = True
+    if median > args.budget:
+        print(f"FAIL: {median:.0f} ms is over the {args.budget:.0f} ms budget")
+        failed = True
+    if failed:
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
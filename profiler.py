@@ -1,4 +1,6 @@
+import argparse
 import cProfile
+from src.FrameProfiler import frame_profiler
 from src.handler import handler
 
 
@@ -6,4 +8,21 @@ def main():
     handler()
 
 
-cProfile.run("main()", "output.prof")
+parser = argparse.ArgumentParser(description="Run the game with profiling enabled")
+parser.add_argument(
+    "--overlay", action="store_true", help="show frame time percentiles (toggle: F3)"
+)
+parser.add_argument(
+    "--frames", metavar="FILE", help="dump per-frame timings to a .csv or .json file"
+)
+parser.add_argument(
+    "--no-cprofile", action="store_true", help="skip cProfile and output.prof"
+)
+args = parser.parse_args()
+
+frame_profiler.configure(overlay=args.overlay, dump_path=args.frames)
+
+if args.no_cprofile:
+    main()
+else:
+    cProfile.run("main()", "output.prof")
@@ -0,0 +1,245 @@
+import pygame
+import threading
+from collections import OrderedDict
+
+
+class AssetCache:
+    """
+    Process-wide cache of decoded and scaled images and animation frames.
+
+    Surfaces are keyed by (path, size, alpha, flip), animations by (path, size,
+    regions), and both are evicted in least recently used order once the
+    configured memory budget is exceeded. Cached surfaces and frame tuples are
+    shared between every caller, so they must be treated as read-only: copy
+    them before drawing on them. The cache can be used from loader threads;
+    files are decoded outside the lock.
+    """
+
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_bytes (int): Memory budget for cached surfaces, in bytes
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._surfaces = OrderedDict()
+        self._lock = threading.RLock()
+
+    def configure(self, max_bytes):
+        """
+        Change the memory budget, evicting entries if the cache is now too big.
+
+        Args:
+            max_bytes (int): New memory budget, in bytes
+        """
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def get_image(self, path, size=None, alpha=True, flip=False):
+        """
+        Get an image surface, decoding and scaling it only on a cache miss.
+
+        Args:
+            path (str): Path to the image file
+            size (tuple, optional): Target (width, height), None to keep the original size
+            alpha (bool): Use convert_alpha() instead of convert()
+            flip (bool): Mirror the image horizontally
+
+        Returns:
+            pygame.Surface: The shared cached surface
+
+        Raises:
+            FileNotFoundError, pygame.error: If the image cannot be loaded
+        """
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+        key = (path, size, alpha, flip)
+
+        with self._lock:
+            surface = self._surfaces.get(key)
+            if surface is not None:
+                self._surfaces.move_to_end(key)
+                self.hits += 1
+                return surface
+            self.misses += 1
+
+        if flip:
+            # Build the flipped variant from the upright one so the file is decoded once
+            surface = pygame.transform.flip(
+                self.get_image(path, size, alpha), True, False
+            )
+        elif size is not None:
+            surface = pygame.transform.scale(self.get_image(path, None, alpha), size)
+        else:
+            surface = pygame.image.load(path)
+            surface = surface.convert_alpha() if alpha else surface.convert()
+
+        with self._lock:
+            # Another thread may have loaded the same image in the meantime
+            cached = self._surfaces.get(key)
+            if cached is not None:
+                return cached
+            self._store(key, surface)
+        return surface
+
+    def get_frames(self, path, size=None, regions=None):
+        """
+        Get the frames of an animated GIF or a sprite sheet, decoding them only on a cache miss.
+
+        Args:
+            path (str): Path to the GIF or sprite sheet file
+            size (tuple, optional): Target (width, height) of every frame, None to keep it
+            regions (tuple, optional): (x, y, width, height) of each frame in a sprite
+                sheet, None to read the frames of a GIF
+
+        Returns:
+            tuple: The shared cached frame surfaces
+
+        Raises:
+            FileNotFoundError, pygame.error: If the file cannot be loaded
+        """
+        key = self._frames_key(path, size, regions)
+        size, regions = key[1], key[2]
+
+        with self._lock:
+            frames = self._surfaces.get(key)
+            if frames is not None:
+                self._surfaces.move_to_end(key)
+                self.hits += 1
+                return frames
+            self.misses += 1
+
+        if size is not None:
+            frames = tuple(
+                pygame.transform.scale(frame, size)
+                for frame in self.get_frames(path, None, regions)
+            )
+        elif regions is not None:
+            sheet = self.get_image(path)
+            frames = tuple(sheet.subsurface(region) for region in regions)
+        else:
+            # PIL is only needed to split GIFs, import it on the first one
+            from PIL import Image, ImageSequence
+
+            with Image.open(path) as gif:
+                frames = tuple(
+                    pygame.image.fromstring(
+                        frame.convert("RGBA").tobytes(), frame.size, "RGBA"
+                    ).convert_alpha()
+                    for frame in ImageSequence.Iterator(gif)
+                )
+
+        with self._lock:
+            cached = self._surfaces.get(key)
+            if cached is not None:
+                return cached
+            self._store(key, frames)
+        return frames
+
+    def has_frames(self, path, size=None, regions=None):
+        """
+        Check if the frames of an animation are cached, without counting a hit or a miss.
+
+        Args:
+            path (str): Path to the GIF or sprite sheet file
+            size (tuple, optional): Target (width, height) of every frame
+            regions (tuple, optional): Regions of the frames in a sprite sheet
+
+        Returns:
+            bool: True if get_frames would not decode the file
+        """
+        with self._lock:
+            return self._frames_key(path, size, regions) in self._surfaces
+
+    def add_frames(self, path, frames, size=None, regions=None):
+        """
+        Cache frames decoded elsewhere, like the compiled level cache.
+
+        Args:
+            path (str): Path to the GIF or sprite sheet file
+            frames (tuple): Frame surfaces, as get_frames would return them
+            size (tuple, optional): Target (width, height) of every frame
+            regions (tuple, optional): Regions of the frames in a sprite sheet
+
+        Returns:
+            tuple: The shared cached frame surfaces
+        """
+        key = self._frames_key(path, size, regions)
+        with self._lock:
+            cached = self._surfaces.get(key)
+            if cached is not None:
+                return cached
+            frames = tuple(frames)
+            self._store(key, frames)
+        return frames
+
+    def clear(self):
+        """Drop every cached surface and reset the counters."""
+        with self._lock:
+            self._surfaces.clear()
+            self.current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        """
+        Get the cache counters.
+
+        Returns:
+            dict: Entries, memory usage, hits, misses and evictions
+        """
+        return {
+            "entries": len(self._surfaces),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    @staticmethod
+    def _frames_key(path, size, regions):
+        """Cache key of an animation, with hashable size and regions"""
+        if size is not None:
+            size = (int(size[0]), int(size[1]))
+        if regions is not None:
+            regions = tuple(tuple(region) for region in regions)
+        return (path, size, regions)
+
+    def _store(self, key, surface):
+        """Insert a surface and enforce the memory budget"""
+        self._surfaces[key] = surface
+        self.current_bytes += self._surface_bytes(surface)
+        self._evict(keep=key)
+
+    def _evict(self, keep=None):
+        """Evict least recently used surfaces until the cache fits its budget"""
+        while self.current_bytes > self.max_bytes and self._surfaces:
+            key = next(iter(self._surfaces))
+            if key == keep:
+                # Never evict the entry that was just requested
+                if len(self._surfaces) == 1:
+                    break
+                self._surfaces.move_to_end(key)
+                continue
+            surface = self._surfaces.pop(key)
+            self.current_bytes -= self._surface_bytes(surface)
+            self.evictions += 1
+
+    @staticmethod
+    def _surface_bytes(surface):
+        """Approximate memory used by a surface or a tuple of frames"""
+        if isinstance(surface, tuple):
+            return sum(frame.get_pitch() * frame.get_height() for frame in surface)
+        return surface.get_pitch() * surface.get_height()
+
+
+# Shared instance used by every entity and loader
+asset_cache = AssetCache()
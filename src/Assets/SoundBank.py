@@ -0,0 +1,166 @@
+import pygame
+
+from src import InputState
+
+# name: (path, volume, maximum number of copies playing at once)
+SOUND_EFFECTS = {
+    "jump": ("assets/sound/Jump.mp3", 1.0, 2),
+    "coin": ("assets/sound/Coin.mp3", 1.0, 4),
+    "fireball": ("assets/sound/Boule de feu.mp3", 0.4, 3),
+    "turret_shot": ("assets/sound/execuse_me.mp3", 1.0, 3),
+    "death": ("assets/sound/Death.mp3", 1.0, 1),
+    "cinematic_voice": ("assets/sound/cinematic_voice.mp3", 1.0, 1),
+}
+
+
+class SoundBank:
+    """
+    Process-wide bank of decoded sound effects played on a pool of channels.
+
+    Every effect is decoded once by preload() instead of on every play. An
+    effect only plays if fewer than its maximum number of copies are already
+    playing and if it was not played in the last min_interval milliseconds, so
+    many enemies shooting in the same frame are heard once. Without an audio
+    device every method is a silent no-op.
+    """
+
+    def __init__(self, channels=16, min_interval=16):
+        """
+        Initialize an empty bank.
+
+        Args:
+            channels (int): Number of mixer channels shared by the effects
+            min_interval (int): Milliseconds during which an effect is not replayed
+        """
+        self.channels = channels
+        self.min_interval = min_interval
+        self.sounds = {}
+        self.limits = {}
+        self.playing = {}
+        self.last_played = {}
+        self.throttled = 0
+        # None until the mixer was tried, False without audio device
+        self.available = None
+
+    def preload(self, effects=None):
+        """
+        Decode every sound effect, skipping the ones already loaded.
+
+        Args:
+            effects (dict, optional): name -> (path, volume, max_instances),
+                SOUND_EFFECTS by default
+        """
+        if not self._init_mixer():
+            return
+        for name, (path, volume, max_instances) in (effects or SOUND_EFFECTS).items():
+            if name not in self.sounds:
+                self.load(name, path, volume, max_instances)
+
+    def load(self, name, path, volume=1.0, max_instances=4):
+        """
+        Decode a sound effect and register it under a name.
+
+        Args:
+            name (str): Name used to play the effect
+            path (str): Path to the sound file
+            volume (float): Volume of the effect, from 0 to 1
+            max_instances (int): Maximum number of copies playing at once
+
+        Returns:
+            pygame.mixer.Sound: The decoded sound, None if it cannot be loaded
+        """
+        if not self._init_mixer():
+            return None
+        try:
+            sound = pygame.mixer.Sound(path)
+            sound.set_volume(volume)
+        except Exception as e:
+            print(f"Error loading sound {path}: {e}")
+            # Do not try to decode it again on every play
+            self.sounds[name] = None
+            return None
+        self.sounds[name] = sound
+        self.limits[name] = max_instances
+        self.playing[name] = []
+        return sound
+
+    def get(self, name):
+        """
+        Get a decoded sound, loading it from SOUND_EFFECTS if needed.
+
+        Args:
+            name (str): Name of the effect
+
+        Returns:
+            pygame.mixer.Sound: The sound, None if it is not available
+        """
+        if name not in self.sounds and name in SOUND_EFFECTS:
+            return self.load(name, *SOUND_EFFECTS[name])
+        return self.sounds.get(name)
+
+    def play(self, name):
+        """
+        Play a sound effect unless it is throttled.
+
+        Args:
+            name (str): Name of the effect
+
+        Returns:
+            pygame.mixer.Channel: Channel playing the effect, None if it was skipped
+        """
+        sound = self.get(name)
+        if sound is None:
+            return None
+
+        now = InputState.get_ticks()
+        last = self.last_played.get(name)
+        if last is not None and 0 <= now - last < self.min_interval:
+            self.throttled += 1
+            return None
+
+        # Forget the copies that ended or whose channel was reused
+        channels = [
+            channel
+            for channel in self.playing[name]
+            if channel.get_busy() and channel.get_sound() is sound
+        ]
+        self.playing[name] = channels
+        if len(channels) >= self.limits[name]:
+            self.throttled += 1
+            return None
+
+        channel = pygame.mixer.find_channel()
+        if channel is None:
+            # Every channel of the pool is busy, effects are short so drop this one
+            self.throttled += 1
+            return None
+        channel.play(sound)
+        channels.append(channel)
+        self.last_played[name] = now
+        return channel
+
+    def stop(self, name):
+        """Stop every playing copy of a sound effect"""
+        for channel in self.playing.get(name, []):
+            if channel.get_sound() is self.sounds.get(name):
+                channel.stop()
+        self.playing[name] = []
+
+    def _init_mixer(self):
+        """Initialize the mixer and its channel pool, False without audio device"""
+        if self.available is False:
+            return False
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            if pygame.mixer.get_num_channels() < self.channels:
+                pygame.mixer.set_num_channels(self.channels)
+            self.available = True
+        except pygame.error as e:
+            print(f"Error initializing the mixer: {e}")
+            self.available = False
+        return self.available
+
+
+# Shared instance used by the entities and screens
+sound_bank = SoundBank()
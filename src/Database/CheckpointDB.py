@@ -1,37 +1,18 @@
-import sqlite3
-import os
+from src.Database.Connection import get_connection
+from src.Database.WriteBehind import write_behind
 
 
 class CheckpointDB:
     def __init__(self, db_file="game.db"):
         """
-        Initialize database connection for checkpoint management
+        Initialize database access for checkpoint management
 
         Args:
             db_file: SQLite database file path
         """
-        # Create database directory if it doesn't exist
-        os.makedirs(
-            os.path.dirname(db_file) if os.path.dirname(db_file) else ".", exist_ok=True
-        )
-
-        self.conn = sqlite3.connect(db_file)
+        self.db_file = db_file
+        self.conn = get_connection(db_file)
         self.cursor = self.conn.cursor()
-        self._create_tables()
-
-    def _create_tables(self):
-        """Create required tables if they don't exist"""
-        self.cursor.execute(
-            """
-        CREATE TABLE IF NOT EXISTS checkpoints (
-            map_name TEXT PRIMARY KEY,
-            pos_x REAL,
-            pos_y REAL,
-            timestamp INTEGER
-        )
-        """
-        )
-        self.conn.commit()
 
     def save_checkpoint(self, map_name, pos_x, pos_y):
         """
@@ -43,11 +24,11 @@ class CheckpointDB:
             pos_y: Y coordinate
         """
         try:
-            self.cursor.execute(
+            write_behind.submit(
                 "INSERT OR REPLACE INTO checkpoints (map_name, pos_x, pos_y, timestamp) VALUES (?, ?, ?, strftime('%s'))",
                 (map_name, pos_x, pos_y + 100),
+                self.db_file,
             )
-            self.conn.commit()
         except Exception as e:
             print(f"Error saving checkpoint: {e}")
 
@@ -61,6 +42,8 @@ class CheckpointDB:
         Returns:
             Tuple (x, y) if checkpoint exists, None otherwise
         """
+        # Wait for pending writes, a checkpoint may have just been saved
+        write_behind.flush()
         self.cursor.execute(
             "SELECT pos_x, pos_y FROM checkpoints WHERE map_name = ?", (map_name,)
         )
@@ -68,17 +51,17 @@ class CheckpointDB:
         return result if result else None
 
     def close(self):
-        """Close database connection"""
-        if self.conn:
-            self.conn.close()
+        """Release the cursor, the shared connection stays open"""
+        if self.cursor:
+            self.cursor.close()
+            self.cursor = None
 
     def clear_all(self):
         """
         Clear all checkpoints from the database
         """
         try:
-            self.cursor.execute("DELETE FROM checkpoints")
-            self.conn.commit()
+            write_behind.submit("DELETE FROM checkpoints", (), self.db_file)
         except Exception as e:
             print(f"Error clearing checkpoint database: {e}")
 
@@ -90,9 +73,8 @@ class CheckpointDB:
             map_name: Map name to reset
         """
         try:
-            self.cursor.execute(
-                "DELETE FROM checkpoints WHERE map_name = ?", (map_name,)
+            write_behind.submit(
+                "DELETE FROM checkpoints WHERE map_name = ?", (map_name,), self.db_file
             )
-            self.conn.commit()
         except Exception as e:
             print(f"Error resetting checkpoint for {map_name}: {e}")
@@ -0,0 +1,175 @@
+import atexit
+import os
+import sqlite3
+
+
+# Every table used by the game, created once when the database is first opened
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS checkpoints (
+        map_name TEXT PRIMARY KEY,
+        pos_x REAL,
+        pos_y REAL,
+        timestamp INTEGER
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS unlocked_levels (
+        level_number INTEGER PRIMARY KEY,
+        unlocked INTEGER DEFAULT 0,
+        timestamp TEXT DEFAULT (strftime('%s'))
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS Leaderboard (
+        player_name TEXT,
+        score INTEGER,
+        date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        seed INTEGER
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS InfiniteMode (
+        player_name TEXT,
+        score INTEGER
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS speedrun (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        level_id TEXT NOT NULL,
+        time REAL NOT NULL,
+        collected_items INTEGER DEFAULT 0,
+        total_items INTEGER DEFAULT 0,
+        date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    # Covering indexes: the leaderboard top-N queries are index range scans
+    """
+    CREATE INDEX IF NOT EXISTS speedrun_level_time
+    ON speedrun (level_id, time, date, collected_items, total_items)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS Leaderboard_score
+    ON Leaderboard (score, date)
+    """,
+)
+
+# Columns added after the first release: (table, column, definition)
+ADDED_COLUMNS = (
+    # Seed of the infinite run the score was made in, to replay it
+    ("Leaderboard", "seed", "INTEGER"),
+)
+
+
+class ConnectionManager:
+    """
+    Shared SQLite connections, one per database file.
+
+    Connections are opened lazily in WAL mode with synchronous=NORMAL and a
+    larger prepared statement cache, and the schema is created only once per
+    file. The database classes borrow these connections instead of opening
+    their own.
+    """
+
+    def __init__(self, cached_statements=256):
+        """
+        Initialize the connection manager.
+
+        Args:
+            cached_statements (int): Size of each connection's prepared statement cache
+        """
+        self.cached_statements = cached_statements
+        self.connections = {}
+        self.opened = 0
+        atexit.register(self.close_all)
+
+    def open(self, db_file):
+        """
+        Open and configure a new connection to a database file.
+
+        Args:
+            db_file (str): SQLite database file path
+
+        Returns:
+            sqlite3.Connection: The configured connection
+        """
+        # Create database directory if it doesn't exist
+        os.makedirs(
+            os.path.dirname(db_file) if os.path.dirname(db_file) else ".", exist_ok=True
+        )
+
+        conn = sqlite3.connect(db_file, cached_statements=self.cached_statements)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        self.opened += 1
+        return conn
+
+    def get(self, db_file="game.db"):
+        """
+        Get the shared connection for a database file, opening it if needed.
+
+        Args:
+            db_file (str): SQLite database file path
+
+        Returns:
+            sqlite3.Connection: The shared connection
+        """
+        key = os.path.abspath(db_file)
+        conn = self.connections.get(key)
+        if conn is None:
+            conn = self.open(db_file)
+            self.create_tables(conn)
+            self.connections[key] = conn
+        return conn
+
+    def create_tables(self, conn):
+        """Create required tables if they don't exist, and add missing columns"""
+        with conn:
+            for statement in SCHEMA:
+                conn.execute(statement)
+            for table, column, definition in ADDED_COLUMNS:
+                columns = [
+                    row[1] for row in conn.execute(f"PRAGMA table_info({table})")
+                ]
+                if column not in columns:
+                    conn.execute(
+                        f"ALTER TABLE {table} ADD COLUMN {column} {definition}"
+                    )
+
+    def close(self, db_file="game.db"):
+        """
+        Close the shared connection for a database file.
+
+        Args:
+            db_file (str): SQLite database file path
+        """
+        conn = self.connections.pop(os.path.abspath(db_file), None)
+        if conn:
+            conn.close()
+
+    def close_all(self):
+        """Close every shared connection"""
+        for conn in self.connections.values():
+            try:
+                conn.close()
+            except Exception as e:
+                print(f"Error closing database connection: {e}")
+        self.connections.clear()
+
+
+connection_manager = ConnectionManager()
+
+
+def get_connection(db_file="game.db"):
+    """
+    Get the shared connection for a database file.
+
+    Args:
+        db_file (str): SQLite database file path
+
+    Returns:
+        sqlite3.Connection: The shared connection
+    """
+    return connection_manager.get(db_file)
@@ -1,56 +1,44 @@
 import sqlite3
-import os
+
+from src.Database.Connection import get_connection
+from src.Database.WriteBehind import write_behind
 
 
 class InfiniteModeDB:
     def __init__(self, db_file="game.db"):
         """
-        Initialize database connection for infinite game mode points management.
+        Initialize database access for infinite game mode points management.
 
         Args:
             db_file: SQLite database file path.
         """
-        os.makedirs(
-            os.path.dirname(db_file) if os.path.dirname(db_file) else ".", exist_ok=True
-        )
-        self.conn = sqlite3.connect(db_file)
+        self.db_file = db_file
+        self.conn = get_connection(db_file)
         self.cursor = self.conn.cursor()
-        self._create_tables()
-
-    def _create_tables(self):
-        """Create required tables if they don't exist."""
-        self.cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS InfiniteMode (
-            player_name TEXT,
-            score INTEGER
-            )
-            """
-        )
-        self.conn.commit()
 
     def get_all(self):
         """Get all scores from the table."""
+        write_behind.flush()
         self.cursor.execute("SELECT * FROM InfiniteMode")
         return self.cursor.fetchall()
 
     def add_score(self, player_name, score):
         """Add a new score to the InfiniteMode."""
-        self.cursor.execute(
+        write_behind.submit(
             "INSERT INTO InfiniteMode (player_name, score) VALUES (?, ?)",
             (player_name, score),
+            self.db_file,
         )
-        self.conn.commit()
 
     def clear_InfiniteModeDB(self):
         """Clear all scores from the InfiniteMode table."""
         try:
-            self.cursor.execute("DELETE FROM InfiniteMode")
-            self.conn.commit()
+            write_behind.submit("DELETE FROM InfiniteMode", (), self.db_file)
         except sqlite3.Error as e:
             print(f"Error clearing InfiniteMode table: {e}")
 
     def close(self):
-        """Close database connection."""
-        if self.conn:
-            self.conn.close()
\ No newline at end of file
+        """Release the cursor, the shared connection stays open."""
+        if self.cursor:
+            self.cursor.close()
+            self.cursor = None
@@ -1,36 +1,18 @@
-import sqlite3
-import os
+from src.Database.Connection import get_connection
+from src.Database.WriteBehind import write_behind
 
 
 class LevelDB:
     def __init__(self, db_file="game.db"):
         """
-        Initialize database connection for level progression management
+        Initialize database access for level progression management
 
         Args:
             db_file: SQLite database file path
         """
-        # Create database directory if it doesn't exist
-        os.makedirs(
-            os.path.dirname(db_file) if os.path.dirname(db_file) else ".", exist_ok=True
-        )
-
-        self.connection = sqlite3.connect(db_file)
+        self.db_file = db_file
+        self.connection = get_connection(db_file)
         self.cursor = self.connection.cursor()
-        self.create_unlocked_levels_table()
-
-    def create_unlocked_levels_table(self):
-        """Create the table to store unlocked levels if it doesn't exist"""
-        self.cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS unlocked_levels (
-                level_number INTEGER PRIMARY KEY,
-                unlocked INTEGER DEFAULT 0,
-                timestamp TEXT DEFAULT (strftime('%s'))
-            )
-        """
-        )
-        self.connection.commit()
 
     def is_level_unlocked(self, level_number):
         """
@@ -46,6 +28,7 @@ class LevelDB:
         if level_number == 1:
             return True
 
+        write_behind.flush()
         self.cursor.execute(
             "SELECT unlocked FROM unlocked_levels WHERE level_number = ?",
             (level_number,),
@@ -60,11 +43,11 @@ class LevelDB:
         Args:
             level_number: Level number to unlock
         """
-        self.cursor.execute(
+        write_behind.submit(
             "INSERT OR REPLACE INTO unlocked_levels (level_number, unlocked) VALUES (?, 1)",
             (level_number,),
+            self.db_file,
         )
-        self.connection.commit()
 
     def get_all_unlocked_levels(self):
         """
@@ -73,6 +56,7 @@ class LevelDB:
         Returns:
             list: List of unlocked level numbers
         """
+        write_behind.flush()
         self.cursor.execute(
             "SELECT level_number FROM unlocked_levels WHERE unlocked = 1"
         )
@@ -85,13 +69,13 @@ class LevelDB:
         Reset all progress, keeping only level 1 unlocked
         """
         try:
-            self.cursor.execute("DELETE FROM unlocked_levels")
-            self.connection.commit()
+            write_behind.submit("DELETE FROM unlocked_levels", (), self.db_file)
             self.unlock_level(1)  # Always unlock level 1
         except Exception as e:
             print(f"Error resetting level progress: {e}")
 
     def close(self):
-        """Close database connection"""
-        if self.connection:
-            self.connection.close()
+        """Release the cursor, the shared connection stays open"""
+        if self.cursor:
+            self.cursor.close()
+            self.cursor = None
@@ -0,0 +1,120 @@
+import atexit
+import queue
+import threading
+
+from src.Database.Connection import connection_manager
+
+
+class WriteBehindQueue:
+    """
+    Background writer for game-state persistence.
+
+    Write statements are queued from the game loop and executed by a worker
+    thread on its own connection, batched into a single transaction. Reads
+    that need to see earlier writes call flush() first.
+    """
+
+    def __init__(self, max_pending=1024, batch_size=64):
+        """
+        Initialize the write queue.
+
+        Args:
+            max_pending (int): Maximum number of queued writes before submit() waits
+            batch_size (int): Maximum number of writes committed in one transaction
+        """
+        self.queue = queue.Queue(max_pending)
+        self.batch_size = batch_size
+        self.worker = None
+        self.lock = threading.Lock()
+        self.batches = 0
+        self.writes = 0
+        # Number of writes submitted per table, used to invalidate read caches
+        self.versions = {}
+        atexit.register(self.flush)
+
+    def _ensure_worker(self):
+        """Start the worker thread if it is not running"""
+        with self.lock:
+            if self.worker is None or not self.worker.is_alive():
+                self.worker = threading.Thread(
+                    target=self._run, name="db-write-behind", daemon=True
+                )
+                self.worker.start()
+
+    def submit(self, sql, params=(), db_file="game.db", table=None):
+        """
+        Queue a write statement.
+
+        Args:
+            sql (str): SQL statement to execute
+            params (tuple): Statement parameters
+            db_file (str): SQLite database file path
+            table (str, optional): Table written, bumps its version
+        """
+        self._ensure_worker()
+        if table:
+            self.versions[table] = self.versions.get(table, 0) + 1
+        self.queue.put((db_file, sql, params))
+
+    def flush(self):
+        """Wait until every queued write has been committed"""
+        if self.worker is not None and self.worker.is_alive():
+            self.queue.join()
+
+    def version(self, table):
+        """Get the number of writes submitted to a table so far"""
+        return self.versions.get(table, 0)
+
+    def pending(self):
+        """Get the number of writes not yet committed"""
+        return self.queue.unfinished_tasks
+
+    def _run(self):
+        """Worker loop: take the queued writes and commit them in batches"""
+        connections = {}
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._write_batch(connections, batch)
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    def _write_batch(self, connections, batch):
+        """
+        Execute a batch of writes, one transaction per database file.
+
+        Args:
+            connections (dict): Worker connections by database file
+            batch (list): Queued (db_file, sql, params) writes
+        """
+        used = []
+        for db_file, sql, params in batch:
+            try:
+                conn = connections.get(db_file)
+                if conn is None:
+                    conn = connection_manager.open(db_file)
+                    connection_manager.create_tables(conn)
+                    connections[db_file] = conn
+                conn.execute(sql, params)
+                if conn not in used:
+                    used.append(conn)
+            except Exception as e:
+                print(f"Error writing to database: {e}")
+
+        for conn in used:
+            try:
+                conn.commit()
+            except Exception as e:
+                print(f"Error committing to database: {e}")
+        self.batches += 1
+        self.writes += len(batch)
+
+
+write_behind = WriteBehindQueue()
@@ -2,6 +2,7 @@ from src.Entity.Entity import Entity
 import pygame
 from pygame.math import Vector2 as vec
 from src.Database.CheckpointDB import CheckpointDB
+from src.Assets.AssetCache import asset_cache
 
 
 class Checkpoint(Entity):
@@ -28,8 +29,7 @@ class Checkpoint(Entity):
         # Load texture if provided
         if texture_path:
             try:
-                self.image = pygame.image.load(texture_path).convert_alpha()
-                self.image = pygame.transform.scale(self.image, size)
+                self.image = asset_cache.get_image(texture_path, size)
                 self.surf = self.image
             except Exception as e:
                 print(f"Error loading checkpoint texture: {e}")
@@ -54,13 +54,13 @@ class Checkpoint(Entity):
             self.activated = True
             # Load the new texture
             try:
-                self.image = pygame.image.load(
-                    "assets/map/checkpoints/checkpoint.png"
-                ).convert_alpha()
-                self.image = pygame.transform.scale(self.image, self.surf.get_size())
+                self.image = asset_cache.get_image(
+                    "assets/map/checkpoints/checkpoint.png", self.surf.get_size()
+                )
                 self.surf = self.image
             except Exception as e:
                 print(f"Error loading checkpoint texture: {e}")
+                self.surf = pygame.Surface(self.surf.get_size())
                 self.surf.fill(self.activated_color)
             # Save checkpoint to database
             self.db.save_checkpoint(self.map_name, self.pos.x, self.pos.y)
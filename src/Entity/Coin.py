@@ -2,10 +2,14 @@
 import os
 
 from src.Entity.Entity import Entity
+from src.Assets.AssetCache import asset_cache
 import pygame
+from src.Renderer import LAYER_COLLECTIBLES
 
 
 class Coin(Entity):
+    render_layer = LAYER_COLLECTIBLES
+
     def __init__(self, pos, size=(50, 50), color=(255, 215, 0), texturePath=""):
         super().__init__(pos=pos, size=size, color=color, texturePath=texturePath)
         self.collected = False
@@ -17,8 +21,7 @@ class Coin(Entity):
         if texturePath:
             try:
                 if os.path.exists(texturePath):
-                    texture = pygame.image.load(texturePath).convert_alpha()
-                    self.surf = pygame.transform.scale(texture, size)
+                    self.surf = asset_cache.get_image(texturePath, size)
                 else:
                     self.draw_fallback(color, size)
             except Exception as e:
@@ -39,4 +42,4 @@ class Coin(Entity):
         """Handle coin collision with player"""
         if not self.collected:
             self.collected = True
-            self.kill()  # This removes the coin from all sprite groups
\ No newline at end of file
+            self.kill()  # This removes the coin from all sprite groups
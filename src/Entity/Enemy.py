@@ -1,12 +1,15 @@
 import pygame
-from PIL import Image, ImageSequence
 import random
 from src.Entity.Entity import Entity
+from src.Assets.AssetCache import asset_cache
+from src.Assets.SoundBank import sound_bank
 from pygame.math import Vector2 as vec
-from src.Entity.Projectile import Projectile
+from src.Renderer import LAYER_ENEMIES
 
 
 class Enemy(Entity):
+    render_layer = LAYER_ENEMIES
+
     def __init__(self, enemy_data):
         self.size = enemy_data.get("size", [50, 50])
         super().__init__(self.size)
@@ -21,8 +24,8 @@ class Enemy(Entity):
         # Initial position
         self.pos = vec(enemy_data.get("x", 0), enemy_data.get("y", 0))
 
-        # Animation attributes
-        self.frames = []
+        # Animation attributes, the frames are shared with the other enemies
+        self.frames = ()
         self.current_frame = 0
         self.animation_speed = enemy_data.get("animation_speed", 0.1)
         self.animation_timer = 0
@@ -40,8 +43,7 @@ class Enemy(Entity):
                 self.surf.fill((255, 0, 0))
         else:
             try:
-                self.surf = pygame.image.load(sprite_path).convert_alpha()
-                self.surf = pygame.transform.scale(self.surf, self.size)
+                self.surf = asset_cache.get_image(sprite_path, self.size)
             except:
                 # Default sprite
                 self.surf = pygame.Surface(self.size)
@@ -67,20 +69,10 @@ class Enemy(Entity):
     def load_gif_frames(self, gif_path, size=(80, 80)):
         """Load frames from a GIF file"""
         try:
-            gif = Image.open(gif_path)
-            frame_count = 0
-
-            for frame in ImageSequence.Iterator(gif):
-                frame_surface = pygame.image.fromstring(
-                    frame.convert("RGBA").tobytes(), frame.size, "RGBA"
-                )
-                frame_surface = pygame.transform.scale(frame_surface, size)
-                self.frames.append(frame_surface)
-                frame_count += 1
-
+            self.frames = asset_cache.get_frames(gif_path, size)
         except Exception as e:
             print(f"Error while loading the GIF: {e}")
-            self.frames = []
+            self.frames = ()
 
     def update(self, player=None, dt=1 / 60):
         """Updates enemy's status and position"""
@@ -156,7 +148,7 @@ class Enemy(Entity):
             if self.attack_timer >= self.attack_interval:
                 self.attack_timer = 0
                 # Easter egg sound
-                pygame.mixer.Sound("assets/sound/execuse_me.mp3").play()
+                sound_bank.play("turret_shot")
                 self.attack(player)
 
     def attack(self, player):
@@ -168,7 +160,7 @@ class Enemy(Entity):
             # Calculate direction to player
             direction = vec(player.pos.x - self.pos.x, player.pos.y - self.pos.y)
 
-            projectile = Projectile(
+            player.game_resources.projectile_pool.spawn(
                 pos=vec(self.pos.x, self.pos.y),
                 direction=direction,
                 speed=self.speed,
@@ -178,14 +170,6 @@ class Enemy(Entity):
                 size=(50, 10),
             )
 
-            # Add projectile to the sprite group (to be placed in main.py)
-            pygame.event.post(
-                pygame.event.Event(
-                    pygame.USEREVENT,
-                    {"action": "create_projectile", "projectile": projectile},
-                )
-            )
-
     def take_damage(self, amount, player):
         """Deal damage to the enemy and check if it should be destroyed"""
         self.health -= amount
@@ -2,8 +2,13 @@ import pygame
 import os
 from pygame.math import Vector2 as vec
 
+from src.Assets.AssetCache import asset_cache
+from src.Renderer import LAYER_PLATFORMS
+
 
 class Entity(pygame.sprite.Sprite):
+    render_layer = LAYER_PLATFORMS
+
     def __init__(
         self, pos=(0, 0), size=(30, 30), color=(255, 255, 255), texturePath=""
     ):
@@ -20,8 +25,7 @@ class Entity(pygame.sprite.Sprite):
         self.update_rect()
         if os.path.isfile(texturePath):
             try:
-                self.surf = pygame.image.load(texturePath).convert_alpha()
-                self.surf = pygame.transform.scale(self.surf, size)
+                self.surf = asset_cache.get_image(texturePath, size)
                 self.rect = self.surf.get_rect()
             except Exception as e:
                 print(f"Error loading texture: {e}")
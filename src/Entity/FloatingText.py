@@ -1,4 +1,5 @@
 import pygame
+from src import InputState
 
 
 class FloatingText:
@@ -6,7 +7,7 @@ class FloatingText:
         self.text = text
         self.player = player
         self.game_resources = game_resources
-        self.creation_time = pygame.time.get_ticks()
+        self.creation_time = InputState.get_ticks()
         self.duration = duration
         self.font = pygame.font.SysFont("Arial", 24, bold=True)
         self.color = (255, 50, 0)
@@ -14,7 +15,7 @@ class FloatingText:
         self.alpha = 255
 
     def update(self):
-        current_time = pygame.time.get_ticks()
+        current_time = InputState.get_ticks()
         elapsed = current_time - self.creation_time
 
         # Fade out
@@ -2,6 +2,9 @@ import os
 import pygame
 import time
 from src.Entity.Entity import Entity
+from src.Assets.AssetCache import asset_cache
+from src import InputState
+from src.Renderer import LAYER_COLLECTIBLES
 
 
 class JumpBoost(Entity):
@@ -10,6 +13,8 @@ class JumpBoost(Entity):
     for 3 seconds when collected.
     """
 
+    render_layer = LAYER_COLLECTIBLES
+
     def __init__(self, pos, size=(30, 30), color=(0, 255, 0), texturePath=""):
         super().__init__(pos=pos, size=size, color=color, texturePath=texturePath)
         self.collected = False
@@ -25,9 +30,8 @@ class JumpBoost(Entity):
         if texturePath:
             try:
                 if os.path.exists(texturePath):
-                    texture = pygame.image.load(texturePath).convert_alpha()
                     textureSize = (size[0] * 1.5, size[1] * 1.5)
-                    self.surf = pygame.transform.scale(texture, textureSize)
+                    self.surf = asset_cache.get_image(texturePath, textureSize)
                 else:
                     self.draw_fallback(color, size)
             except Exception as e:
@@ -66,7 +70,7 @@ class JumpBoost(Entity):
 
     def update(self):
         """Update the jump boost animation"""
-        now = pygame.time.get_ticks()
+        now = InputState.get_ticks()
         if now - self.last_update > 200:
             self.last_update = now
             self.animation_frame = (self.animation_frame + 1) % 4
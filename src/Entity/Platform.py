@@ -1,4 +1,4 @@
-import numpy as np
+import math
 import pygame
 from src.Entity.Entity import Entity
 
@@ -74,8 +74,8 @@ class Platform(Entity):
     def move_circular(self, center, angular_speed, radius, clockwise):
         self.angle += angular_speed
         if clockwise:
-            self.rect.x = self.rect.x + radius * np.cos(self.angle)
-            self.rect.y = self.rect.y + radius * np.sin(self.angle)
+            self.rect.x = self.rect.x + radius * math.cos(self.angle)
+            self.rect.y = self.rect.y + radius * math.sin(self.angle)
         else:
-            self.rect.x = self.rect.x + radius * np.cos(self.angle)
-            self.rect.y = self.rect.y + radius * np.sin(-self.angle)
+            self.rect.x = self.rect.x + radius * math.cos(self.angle)
+            self.rect.y = self.rect.y + radius * math.sin(-self.angle)
@@ -2,14 +2,19 @@ from src.Entity.Entity import Entity
 from pygame import *
 import pygame
 import os
-from PIL import Image, ImageSequence
+import numpy as np
 from pygame.math import Vector2 as vec
 
+from src.Assets.AssetCache import asset_cache
+from src.Assets.SoundBank import sound_bank
 from src.Entity.FloatingText import FloatingText
-from src.Entity.Projectile import Projectile
+from src import InputState
+from src.Renderer import LAYER_PLAYER
 
 
 class Player(Entity):
+    render_layer = LAYER_PLAYER
+
     def __init__(self, game_resources, width=100, height=100, x=10, y=385):
         super().__init__(pos=(x, y), size=(width, height), color=(128, 255, 40))
 
@@ -38,7 +43,7 @@ class Player(Entity):
         self.dash_frames = []
         self.current_frame = 0
         self.animation_speed = 0.1
-        self.last_update = pygame.time.get_ticks()
+        self.last_update = InputState.get_ticks()
         self.static_image = None
         self.moving = False
         self.dashing = False
@@ -60,11 +65,15 @@ class Player(Entity):
 
         # Life system
         self.max_lives = 5
-        self.lives = 3
+        self.start_lives = 3
+        self.lives = self.start_lives
         self.invulnerable = False
         self.invulnerable_timer = 0
         self.invulnerable_duration = 1.5
         self.life_icon = None
+        self.life_icon_gray = None
+        self.lives_surface = None
+        self.lives_surface_key = None
 
         self.rect = self.surf.get_rect()
         self.floating_texts = []
@@ -77,6 +86,13 @@ class Player(Entity):
         # Projectiles amount
         self.projectiles = 0
 
+        # Font for the HUD counters
+        try:
+            self.hud_font = pygame.font.Font("assets/fonts/sanicfont.ttf", 20)
+        except:
+            # Fallback to default font if custom font fails to load
+            self.hud_font = pygame.font.Font(None, 20)
+
         # Override initial surface if images are loaded
         if self.static_image:
             self.surf = self.static_image
@@ -117,22 +133,7 @@ class Player(Entity):
     def load_gif_frames(self, gif_path):
         """Load frames from a GIF file"""
         try:
-            gif = Image.open(gif_path)
-
-            self.animation_frames = []
-
-            for frame in ImageSequence.Iterator(gif):
-                # Convert the frame to a format compatible with Pygame
-                frame_rgb = frame.convert("RGBA")
-                raw_str = frame_rgb.tobytes("raw", "RGBA")
-
-                pygame_surface = pygame.image.fromstring(
-                    raw_str, frame_rgb.size, "RGBA"
-                )
-
-                pygame_surface = pygame.transform.scale(pygame_surface, (125, 125))
-
-                self.animation_frames.append(pygame_surface)
+            self.animation_frames = list(asset_cache.get_frames(gif_path, (125, 125)))
 
             # Use the first frame as the static image
             if self.animation_frames:
@@ -145,63 +146,55 @@ class Player(Entity):
         """Previous method to load static image and sprite sheets"""
         # Load static image
         if os.path.isfile("assets/player/Sanic Base.png"):
-            self.static_image = pygame.image.load(
-                "assets/player/Sanic Base.png"
-            ).convert_alpha()
-            self.static_image = pygame.transform.scale(self.static_image, (100, 100))
+            self.static_image = asset_cache.get_image(
+                "assets/player/Sanic Base.png", (100, 100)
+            )
 
         # Load regular animation sprite sheet
         if os.path.isfile("assets/player/Sanic Annimate.png"):
-            sprite_sheet = pygame.image.load(
-                "assets/player/Sanic Annimate.png"
-            ).convert_alpha()
+            sprite_sheet = asset_cache.get_image("assets/player/Sanic Annimate.png")
 
             # Extract the 4 frames
             frame_height = sprite_sheet.get_height()
             frame_width = sprite_sheet.get_width() // 4
 
-            for i in range(4):
-                # Cut out a region of the sprite sheet
-                frame = sprite_sheet.subsurface(
-                    (i * 2290, 0, frame_width, frame_height)
+            self.animation_frames.extend(
+                asset_cache.get_frames(
+                    "assets/player/Sanic Annimate.png",
+                    (100, 100),
+                    [(i * 2290, 0, frame_width, frame_height) for i in range(4)],
                 )
-                # Resize the frame
-                frame = pygame.transform.scale(frame, (100, 100))
-                self.animation_frames.append(frame)
+            )
 
     def load_special_animations(self):
         """Load special animations for jump and dash"""
         # Load jump animation sprite sheet
         if os.path.isfile("assets/player/Sanic Boule.png"):
             self.jump_frames.append(
-                pygame.transform.scale(
-                    pygame.image.load("assets/player/Sanic Boule.png").convert_alpha(),
-                    (80, 80),
-                )
+                asset_cache.get_image("assets/player/Sanic Boule.png", (80, 80))
             )
 
         # Load dash animation sprite sheet
         if os.path.isfile("assets/player/Sanic Boule Annimate.png"):
-            dash_sheet = pygame.image.load(
-                "assets/player/Sanic Boule Annimate.png"
-            ).convert_alpha()
+            dash_sheet = asset_cache.get_image("assets/player/Sanic Boule Annimate.png")
 
             dash_frame_height = dash_sheet.get_height()
 
-            for i in range(4):
-                frame = dash_sheet.subsurface(
-                    (i * 2000, 0, dash_frame_height, dash_frame_height)
+            self.dash_frames.extend(
+                asset_cache.get_frames(
+                    "assets/player/Sanic Boule Annimate.png",
+                    (80, 80),
+                    [
+                        (i * 2000, 0, dash_frame_height, dash_frame_height)
+                        for i in range(4)
+                    ],
                 )
-                frame = pygame.transform.scale(frame, (80, 80))
-                self.dash_frames.append(frame)
+            )
 
         # Load life icon
         if os.path.isfile("assets/player/Sanic Head.png"):
-            self.life_icon = pygame.image.load(
-                "assets/player/Sanic Head.png"
-            ).convert_alpha()
-            self.life_icon = pygame.transform.scale(
-                self.life_icon,
+            self.life_icon = asset_cache.get_image(
+                "assets/player/Sanic Head.png",
                 (
                     self.game_resources.life_icon_width,
                     self.game_resources.life_icon_width,
@@ -217,8 +210,22 @@ class Player(Entity):
             )
             self.life_icon.fill((255, 0, 0))
 
+        # Precompute the icon used for lost lives
+        self.life_icon_gray = self.make_grayscale_icon(self.life_icon)
+
+    @staticmethod
+    def make_grayscale_icon(icon):
+        """Build a grayscale copy of an icon, keeping its transparency"""
+        grayscale_icon = icon.copy()
+        rgb = pygame.surfarray.pixels3d(grayscale_icon)
+        gray = rgb.sum(axis=2, dtype=np.uint16) // 3
+        rgb[...] = gray[..., np.newaxis]
+        # Release the pixel array lock on the surface
+        del rgb
+        return grayscale_icon
+
     def update_animation(self):
-        current_time = pygame.time.get_ticks()
+        current_time = InputState.get_ticks()
 
         current_image = None
 
@@ -262,7 +269,7 @@ class Player(Entity):
             self.surf = current_image
 
     def dash(self, acc):
-        current_time = pygame.time.get_ticks()
+        current_time = InputState.get_ticks()
 
         # Check if dash is available (3 seconds since last dash)
         if current_time - self.last_dash_time >= self.dash_cooldown:
@@ -273,7 +280,7 @@ class Player(Entity):
             self.last_dash_time = current_time
 
     def move(self):
-        current_time = pygame.time.get_ticks()
+        current_time = InputState.get_ticks()
 
         # End dash after 0.5 seconds
         if self.dashing and current_time - self.dash_start_time >= self.dash_duration:
@@ -285,7 +292,7 @@ class Player(Entity):
         self.moving = False
 
         # Keyboard controls
-        pressed_keys = pygame.key.get_pressed()
+        pressed_keys = InputState.get_pressed()
         move_left = pressed_keys[K_q]
         move_right = pressed_keys[K_d]
         jump = pressed_keys[K_SPACE]
@@ -332,11 +339,7 @@ class Player(Entity):
 
         # Jumping logic
         if jump and not self.jumping:
-            try:
-                jump_sound = pygame.mixer.Sound("assets/sound/Jump.mp3")
-                jump_sound.play()
-            except Exception as e:
-                print(f"Error playing jump sound: {e}")
+            sound_bank.play("jump")
             self.vel.y = -self.jump_power
             self.jumping = True
 
@@ -351,25 +354,32 @@ class Player(Entity):
         # Update animation frame
         self.update_animation()
 
-    def draw_dash_cooldown_bar(self, surface):
-        """Draws a cooldown bar next to the FPS display."""
-        current_time = pygame.time.get_ticks()
+    def get_dash_cooldown_fill(self, bar_width=75):
+        """Get the filled width of the dash cooldown bar, in pixels."""
+        current_time = InputState.get_ticks()
         elapsed_time = current_time - self.last_dash_time
 
         # Calculate progress (0 to 1)
         cooldown_progress = min(elapsed_time / self.dash_cooldown, 1)
+        return int(bar_width * cooldown_progress)
 
+    def render_dash_cooldown_bar(self, fill_width=None):
+        """Render the dash cooldown bar to its own surface."""
         # Bar settings
         bar_width, bar_height = 75, 8
-        x, y = 560, 330
+        if fill_width is None:
+            fill_width = self.get_dash_cooldown_fill(bar_width)
 
+        bar = pygame.Surface((bar_width, bar_height))
         # Background (empty bar)
-        pygame.draw.rect(surface, (100, 100, 100), (x, y, bar_width, bar_height))
-
+        bar.fill((100, 100, 100))
         # Filled portion (based on cooldown progress)
-        pygame.draw.rect(
-            surface, (58, 83, 200), (x, y, bar_width * cooldown_progress, bar_height)
-        )
+        bar.fill((58, 83, 200), (0, 0, fill_width, bar_height))
+        return bar
+
+    def draw_dash_cooldown_bar(self, surface):
+        """Draws a cooldown bar next to the FPS display."""
+        surface.blit(self.render_dash_cooldown_bar(), (560, 330))
 
     def update(self):
         """Update the player position and check for collisions."""
@@ -383,9 +393,18 @@ class Player(Entity):
         right_side_rect = pygame.Rect(0, 0, 10, self.rect.height * 0.7)
         right_side_rect.midright = self.rect.midright
 
+        # Only test the platforms near the player when a broadphase index exists
+        platform_index = self.game_resources.platform_index
+        if platform_index is not None:
+            nearby_platforms = platform_index.query(
+                feet_rect.union(left_side_rect).union(right_side_rect)
+            )
+        else:
+            nearby_platforms = self.game_resources.platforms.sprites()
+
         hits = []
         # Check for collisions with the top of platforms
-        for platform in self.game_resources.platforms:
+        for platform in nearby_platforms:
             platform_top_rect = pygame.Rect(
                 platform.rect.x, platform.rect.y, platform.rect.width, 5
             )
@@ -400,7 +419,7 @@ class Player(Entity):
                 self.highest_position = self.pos.y
 
         side_hits = []
-        for platform in self.game_resources.platforms:
+        for platform in nearby_platforms:
             # Check for collisions with the left and right sides of the player
             platform_left_rect = pygame.Rect(
                 platform.rect.x, platform.rect.y + 5, 5, platform.rect.height - 5
@@ -473,76 +492,79 @@ class Player(Entity):
         death_event = pygame.event.Event(pygame.USEREVENT, {"action": "player_death"})
         pygame.event.post(death_event)
 
+    def get_lives_surface(self):
+        """
+        Get the pre-rendered row of life icons.
+        The row is only rebuilt when lives or max_lives change.
+
+        Returns:
+            pygame.Surface: Active icons followed by grayscale icons for lost lives
+        """
+        key = (self.lives, self.max_lives)
+        if self.lives_surface is None or self.lives_surface_key != key:
+            spacing = 5
+            icon_step = self.game_resources.life_icon_width + spacing
+            self.lives_surface = pygame.Surface(
+                (self.max_lives * icon_step, self.life_icon.get_height()),
+                pygame.SRCALPHA,
+            )
+            for i in range(self.max_lives):
+                icon = self.life_icon if i < self.lives else self.life_icon_gray
+                self.lives_surface.blit(icon, (i * icon_step, 0))
+            self.lives_surface_key = key
+        return self.lives_surface
+
     def draw_lives(self, surface):
         """Draws the player's remaining lives as icons in the top right corner."""
-        spacing = 5
-        start_x = surface.get_width() - (
-            self.max_lives * (self.game_resources.life_icon_width + spacing)
-        )
+        lives_surface = self.get_lives_surface()
+        start_x = surface.get_width() - lives_surface.get_width()
         start_y = 10
+        surface.blit(lives_surface, (start_x, start_y))
+
+    def render_counter(self, texture_path, amount, icon_size=30):
+        """
+        Render an icon followed by an "x<amount>" counter to its own surface.
+
+        Args:
+            texture_path (str): Path to the icon texture
+            amount (int): Value displayed next to the icon
+            icon_size (int): Width and height of the icon
+
+        Returns:
+            tuple: (surface, (offset_x, offset_y)) where the offset is the position
+            of the icon inside the surface
+        """
+        icon = asset_cache.get_image(texture_path, (icon_size, icon_size))
+        text = self.hud_font.render(f"x{amount}", True, (58, 83, 200))
+
+        # Position text next to the icon with small spacing, vertically centered
+        text_x = icon_size + 5
+        text_y = (icon_size - text.get_height()) // 2
+        top = min(0, text_y)
+
+        counter = pygame.Surface(
+            (
+                text_x + text.get_width(),
+                max(icon_size, text_y + text.get_height()) - top,
+            ),
+            pygame.SRCALPHA,
+        )
+        counter.blit(icon, (0, -top))
+        counter.blit(text, (text_x, text_y - top))
+        return counter, (0, -top)
 
-        for i in range(self.max_lives):
-            if i < self.lives:
-                # Active life: display the icon
-                surface.blit(
-                    self.life_icon,
-                    (
-                        start_x + i * (self.game_resources.life_icon_width + spacing),
-                        start_y,
-                    ),
-                )
-            else:
-                # Life lost: display a grayscale version of the icon
-                grayscale_icon = self.life_icon.copy()
-                # Apply grayscale effect
-                for x in range(grayscale_icon.get_width()):
-                    for y in range(grayscale_icon.get_height()):
-                        color = grayscale_icon.get_at((x, y))
-                        gray = (color[0] + color[1] + color[2]) // 3
-                        grayscale_icon.set_at((x, y), (gray, gray, gray, color[3]))
-                surface.blit(
-                    grayscale_icon,
-                    (
-                        start_x + i * (self.game_resources.life_icon_width + spacing),
-                        start_y,
-                    ),
-                )
+    def render_coins(self):
+        """Render the coin counter with its icon"""
+        return self.render_counter("assets/map/collectibles/Sanic_Coin.png", self.coins)
 
     def draw_coins(self, surface):
         """Draws the coin counter with icon in the top left corner"""
-        # Load coin texture (do this in __init__ for better performance)
-        coin_texture = pygame.image.load(
-            "assets/map/collectibles/Sanic_Coin.png"
-        ).convert_alpha()
-        coin_size = 30
-        coin_texture = pygame.transform.scale(coin_texture, (coin_size, coin_size))
-
-        # Position for coin display
-        start_x = 200
-        start_y = 10
-
-        # Draw coin icon
-        surface.blit(coin_texture, (start_x, start_y))
-
-        # Use custom font
-        try:
-            font = pygame.font.Font("assets/fonts/sanicfont.ttf", 20)
-        except:
-            # Fallback to default font if custom font fails to load
-            font = pygame.font.Font(None, 20)
-
-        coin_text = font.render(f"x{self.coins}", True, (58, 83, 200))
-
-        # Position text next to coin icon with small spacing
-        text_x = start_x + coin_size + 5
-        text_y = start_y + (coin_size - coin_text.get_height()) // 2
-
-        surface.blit(coin_text, (text_x, text_y))
+        counter, (offset_x, offset_y) = self.render_coins()
+        surface.blit(counter, (200 - offset_x, 10 - offset_y))
 
     def collect_coin(self, surface, speedrun_timer=None):
         """Increment coin counter when collecting a coin"""
-        coin_sound = pygame.mixer.Sound("assets/sound/Coin.mp3")
-        coin_sound.play()
+        sound_bank.play("coin")
         self.coins += 1
         if self.lives < self.max_lives:
             self.lives += 1
@@ -554,8 +576,8 @@ class Player(Entity):
         """Do an attack action on the player"""
 
         self.is_attacking = False
-        current_time = pygame.time.get_ticks()
-        pressed_keys = pygame.key.get_pressed()
+        current_time = InputState.get_ticks()
+        pressed_keys = InputState.get_pressed()
 
         joystick_attack = False
         if self.has_joystick and self.joystick:
@@ -570,9 +592,7 @@ class Player(Entity):
             and current_time - self.last_attack_time >= self.attack_cooldown
             and self.projectiles > 0
         ):
-            attack_sound = pygame.mixer.Sound("assets/sound/Boule de feu.mp3")
-            attack_sound.set_volume(0.4)
-            attack_sound.play()
+            sound_bank.play("fireball")
             self.is_attacking = True
             self.attack_start_time = current_time
             self.last_attack_time = current_time
@@ -585,7 +605,7 @@ class Player(Entity):
                 direction = vec(-self.pos.x, 0)
                 position = vec(self.pos.x - 50, self.pos.y - 50)
 
-            projectile = Projectile(
+            self.game_resources.projectile_pool.spawn(
                 pos=position,
                 direction=direction,
                 speed=2,
@@ -596,14 +616,6 @@ class Player(Entity):
                 size=(50, 50),
             )
 
-            # Ajouter le projectile au groupe de sprites
-            pygame.event.post(
-                pygame.event.Event(
-                    pygame.USEREVENT,
-                    {"action": "create_projectile", "projectile": projectile},
-                )
-            )
-
             self.projectiles -= 1
 
         if (
@@ -616,7 +628,7 @@ class Player(Entity):
             self.last_attack_time = current_time
             # Calculate direction to player
             direction = vec(self.pos.x, self.pos.y)
-            projectile = Projectile(
+            self.game_resources.projectile_pool.spawn(
                 pos=vec(self.pos.x, self.pos.y),
                 direction=direction,
                 speed=2,
@@ -625,13 +637,6 @@ class Player(Entity):
                 enemy_proj=False,
                 size=(50, 50),
             )
-            # Add projectile to the sprite group (to be placed in main.py)
-            pygame.event.post(
-                pygame.event.Event(
-                    pygame.USEREVENT,
-                    {"action": "create_projectile", "projectile": projectile},
-                )
-            )
 
         if (
             pressed_keys[K_d]
@@ -643,7 +648,7 @@ class Player(Entity):
             self.last_attack_time = current_time
             # Calculate direction to player
             direction = vec(self.pos.x, self.pos.y)
-            projectile = Projectile(
+            self.game_resources.projectile_pool.spawn(
                 pos=vec(self.pos.x, self.pos.y),
                 direction=direction,
                 speed=2,
@@ -652,13 +657,6 @@ class Player(Entity):
                 enemy_proj=False,
                 size=(50, 50),
             )
-            # Add projectile to the sprite group (to be placed in main.py)
-            pygame.event.post(
-                pygame.event.Event(
-                    pygame.USEREVENT,
-                    {"action": "create_projectile", "projectile": projectile},
-                )
-            )
 
         if (
             pressed_keys[K_q]
@@ -666,15 +664,13 @@ class Player(Entity):
             and current_time - self.last_attack_time >= self.attack_cooldown
             and self.projectiles > 0
         ):
-            attack_sound = pygame.mixer.Sound("assets/sound/Boule de feu.mp3")
-            attack_sound.set_volume(0.4)
-            attack_sound.play()
+            sound_bank.play("fireball")
             self.is_attacking = True
             self.attack_start_time = current_time
             self.last_attack_time = current_time
             # Calculate direction to player
             direction = vec(-self.pos.x, 0)
-            projectile = Projectile(
+            self.game_resources.projectile_pool.spawn(
                 pos=vec(self.pos.x - 50, self.pos.y - 50),
                 direction=direction,
                 speed=2,
@@ -684,13 +680,6 @@ class Player(Entity):
                 texturePath="assets/player/Boule de feu.png",
                 size=(50, 50),
             )
-            # Add projectile to the sprite group (to be placed in main.py)
-            pygame.event.post(
-                pygame.event.Event(
-                    pygame.USEREVENT,
-                    {"action": "create_projectile", "projectile": projectile},
-                )
-            )
             self.projectiles -= 1
 
         if (
@@ -699,15 +688,13 @@ class Player(Entity):
             and current_time - self.last_attack_time >= self.attack_cooldown
             and self.projectiles > 0
         ):
-            attack_sound = pygame.mixer.Sound("assets/sound/Boule de feu.mp3")
-            attack_sound.set_volume(0.4)
-            attack_sound.play()
+            sound_bank.play("fireball")
             self.is_attacking = True
             self.attack_start_time = current_time
             self.last_attack_time = current_time
             # Calculate direction to player
             direction = vec(self.pos.x, 0)
-            projectile = Projectile(
+            self.game_resources.projectile_pool.spawn(
                 pos=vec(self.pos.x + 50, self.pos.y - 50),
                 direction=direction,
                 speed=2,
@@ -717,12 +704,6 @@ class Player(Entity):
                 texturePath="assets/player/Boule de feu.png",
                 size=(50, 50),
             )
-            pygame.event.post(
-                pygame.event.Event(
-                    pygame.USEREVENT,
-                    {"action": "create_projectile", "projectile": projectile},
-                )
-            )
             self.projectiles -= 1
 
     def add_projectiles(self):
@@ -732,38 +713,25 @@ class Player(Entity):
             FloatingText("+3 fireball", self, self.game_resources)
         )
 
+    def render_projectiles_amount(self):
+        """Render the projectiles counter with its icon"""
+        return self.render_counter("assets/player/Boule de feu.png", self.projectiles)
+
     def draw_projectiles_amount(self, surface):
         """Draws the projectiles counter with icon in the top left corner"""
-        # Load coin texture (do this in __init__ for better performance)
-        projectiles_texture = pygame.image.load(
-            "assets/player/Boule de feu.png"
-        ).convert_alpha()
-        projectile_size = 30
-        projectiles_texture = pygame.transform.scale(
-            projectiles_texture, (projectile_size, projectile_size)
-        )
-
-        # Position for coin display
-        start_x = 300
-        start_y = 10
-
-        # Draw coin icon
-        surface.blit(projectiles_texture, (start_x, start_y))
-
-        # Use custom font
-        try:
-            font = pygame.font.Font("assets/fonts/sanicfont.ttf", 20)
-        except:
-            # Fallback to default font if custom font fails to load
-            font = pygame.font.Font(None, 20)
-
-        projectiles_text = font.render(f"x{self.projectiles}", True, (58, 83, 200))
-
-        # Position text next to coin icon with small spacing
-        text_x = start_x + projectile_size + 5
-        text_y = start_y + (projectile_size - projectiles_text.get_height()) // 2
-
-        surface.blit(projectiles_text, (text_x, text_y))
+        counter, (offset_x, offset_y) = self.render_projectiles_amount()
+        surface.blit(counter, (300 - offset_x, 10 - offset_y))
+
+    def clear_boosts(self):
+        """End the active jump and speed boosts right away"""
+        if self.active_jump_boost:
+            self.jump_power = self.active_jump_boost["original_power"]
+            self.jump_boost_active = False
+            self.active_jump_boost = None
+        if self.active_speed_boost:
+            self.game_resources.ACC = self.active_speed_boost["original_ACC"]
+            self.speed_boost_active = False
+            self.active_speed_boost = None
 
     def respawn_at_checkpoint(self, x, y):
         self.pos.x = x
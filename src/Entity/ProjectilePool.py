@@ -0,0 +1,228 @@
+import numpy as np
+import pygame
+
+from src.Assets.AssetCache import asset_cache
+
+
+class ProjectilePool:
+    """
+    Every projectile of the level, stored in NumPy arrays instead of sprites.
+
+    A projectile is a slot of the arrays: its center, normalized direction,
+    speed, size, damage and owner. Slots are reused once a projectile is
+    gone and the arrays grow when every slot is in use. All projectiles move
+    in one step per frame and are tested against the player and the enemies
+    with vectorised rectangle overlaps. Images are shared between projectiles
+    of the same texture, size and color.
+    """
+
+    def __init__(self, capacity=64):
+        """
+        Initialize an empty pool.
+
+        Args:
+            capacity (int): Number of slots allocated up front
+        """
+        self.capacity = 0
+        self.pos = np.zeros((0, 2))
+        self.direction = np.zeros((0, 2))
+        self.speed = np.zeros(0)
+        self.size = np.zeros((0, 2), dtype=np.int32)
+        self.damage = np.zeros(0, dtype=np.int32)
+        self.enemy_proj = np.zeros(0, dtype=bool)
+        self.active = np.zeros(0, dtype=bool)
+        self.images = []
+        self._image_cache = {}
+        self._grow(capacity)
+
+    def __len__(self):
+        return int(np.count_nonzero(self.active))
+
+    def spawn(
+        self,
+        pos,
+        direction,
+        speed,
+        damage,
+        color=(0, 0, 255),
+        enemy_proj=False,
+        texturePath="",
+        size=(10, 10),
+    ):
+        """
+        Fire a projectile.
+
+        Args:
+            pos (Vector2): Center of the projectile
+            direction (Vector2): Direction of travel, normalized here
+            speed (float): Distance traveled per frame
+            damage (int): Damage dealt on hit
+            color (tuple): Fill color when there is no texture
+            enemy_proj (bool): True if it hurts the player, False if it hurts enemies
+            texturePath (str): Path to the projectile image
+            size (tuple): Width and height of the projectile
+
+        Returns:
+            int: Slot of the projectile
+        """
+        free = np.flatnonzero(~self.active)
+        if not len(free):
+            free = [self.capacity]
+            self._grow(self.capacity * 2 or 1)
+        slot = free[0]
+
+        length = np.hypot(direction[0], direction[1])
+        if length > 0:
+            self.direction[slot] = (direction[0] / length, direction[1] / length)
+        else:
+            self.direction[slot] = (1, 0)
+        self.pos[slot] = (pos[0], pos[1])
+        self.speed[slot] = speed
+        self.size[slot] = size
+        self.damage[slot] = damage
+        self.enemy_proj[slot] = enemy_proj
+        self.images[slot] = self._get_image(texturePath, size, color)
+        self.active[slot] = True
+        return slot
+
+    def update(self, screen_width, screen_height, player=None, camera=None, enemies=()):
+        """
+        Move every projectile once and resolve its hits.
+
+        Args:
+            screen_width (int): Width of the screen
+            screen_height (int): Height of the screen
+            player (Player, optional): Player hit by enemy projectiles
+            camera (Camera, optional): Camera used to remove projectiles off screen
+            enemies (iterable): Enemies hit by the player's projectiles
+        """
+        slots = np.flatnonzero(self.active)
+        if not len(slots):
+            return
+
+        self.pos[slots] += self.direction[slots] * self.speed[slots, None]
+
+        # Remove the projectiles that left the screen, with a safety margin
+        if camera:
+            margin = 50
+            screen_pos = self.pos[slots] + (camera.camera.x, camera.camera.y)
+            outside = (
+                (screen_pos[:, 0] < -margin)
+                | (screen_pos[:, 0] > screen_width + margin)
+                | (screen_pos[:, 1] < -margin)
+                | (screen_pos[:, 1] > screen_height + margin)
+            )
+            self.active[slots[outside]] = False
+            slots = slots[~outside]
+
+        rects = self._get_rects(slots)
+
+        if player:
+            hits = self.enemy_proj[slots] & self._overlaps(rects, player.rect)
+            for slot in slots[hits]:
+                player.take_damage(int(self.damage[slot]))
+                self.active[slot] = False
+
+        enemies = [enemy for enemy in enemies if enemy.health > 0]
+        player_shots = ~self.enemy_proj[slots] & self.active[slots]
+        if enemies and player_shots.any():
+            slots = slots[player_shots]
+            rects = rects[player_shots]
+            enemy_rects = np.array(
+                [
+                    (e.rect.left, e.rect.top, e.rect.right, e.rect.bottom)
+                    for e in enemies
+                ]
+            )
+            # hits[i, j]: projectile i overlaps enemy j
+            hits = (
+                (rects[:, None, 0] < enemy_rects[None, :, 2])
+                & (rects[:, None, 2] > enemy_rects[None, :, 0])
+                & (rects[:, None, 1] < enemy_rects[None, :, 3])
+                & (rects[:, None, 3] > enemy_rects[None, :, 1])
+            )
+            for i, j in zip(*np.nonzero(hits)):
+                enemy = enemies[j]
+                if not self.active[slots[i]] or enemy.health <= 0:
+                    continue
+                enemy.take_damage(int(self.damage[slots[i]]), player)
+                self.active[slots[i]] = False
+
+    def get_blits(self, offset=(0, 0), screen_rect=None):
+        """
+        Get the images and screen positions of the projectiles.
+
+        Args:
+            offset (tuple): Camera offset added to the positions
+            screen_rect (pygame.Rect, optional): Only keep projectiles overlapping it
+
+        Returns:
+            list: (surface, (x, y)) pairs for Renderer.add_many or Surface.blits
+        """
+        slots = np.flatnonzero(self.active)
+        if not len(slots):
+            return []
+        rects = self._get_rects(slots)
+        rects[:, [0, 2]] += offset[0]
+        rects[:, [1, 3]] += offset[1]
+        if screen_rect is not None:
+            visible = self._overlaps(rects, screen_rect)
+            slots = slots[visible]
+            rects = rects[visible]
+        images = self.images
+        return [
+            (images[slot], (left, top))
+            for slot, left, top in zip(
+                slots.tolist(), rects[:, 0].tolist(), rects[:, 1].tolist()
+            )
+        ]
+
+    def clear(self):
+        """Remove every projectile"""
+        self.active[:] = False
+
+    def _get_rects(self, slots):
+        """(left, top, right, bottom) of the projectiles, like Rect.center = pos"""
+        center = self.pos[slots].astype(np.int32)
+        size = self.size[slots]
+        topleft = center - size // 2
+        return np.hstack((topleft, topleft + size))
+
+    @staticmethod
+    def _overlaps(rects, rect):
+        """Vectorised Rect.colliderect of (left, top, right, bottom) rows against a rect"""
+        return (
+            (rects[:, 0] < rect.right)
+            & (rects[:, 2] > rect.left)
+            & (rects[:, 1] < rect.bottom)
+            & (rects[:, 3] > rect.top)
+        )
+
+    def _get_image(self, texture_path, size, color):
+        """Shared image of a projectile, its texture or a filled rectangle"""
+        key = (texture_path, tuple(size), tuple(color))
+        image = self._image_cache.get(key)
+        if image is None:
+            if texture_path:
+                try:
+                    image = asset_cache.get_image(texture_path, size)
+                except Exception as e:
+                    print(f"Error loading texture: {e}")
+            if image is None:
+                image = pygame.Surface(size)
+                image.fill(color)
+            self._image_cache[key] = image
+        return image
+
+    def _grow(self, capacity):
+        """Enlarge the arrays to capacity slots"""
+        extra = capacity - self.capacity
+        self.pos = np.vstack((self.pos, np.zeros((extra, 2))))
+        self.direction = np.vstack((self.direction, np.zeros((extra, 2))))
+        self.speed = np.concatenate((self.speed, np.zeros(extra)))
+        self.size = np.vstack((self.size, np.zeros((extra, 2), dtype=np.int32)))
+        self.damage = np.concatenate((self.damage, np.zeros(extra, dtype=np.int32)))
+        self.enemy_proj = np.concatenate((self.enemy_proj, np.zeros(extra, dtype=bool)))
+        self.active = np.concatenate((self.active, np.zeros(extra, dtype=bool)))
+        self.images.extend([None] * extra)
+        self.capacity = capacity
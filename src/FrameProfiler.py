@@ -0,0 +1,261 @@
+import atexit
+import csv
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+import pygame
+
+
+class RingBuffer:
+    """Fixed-size buffer keeping the most recent float samples"""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.samples = [0.0] * capacity
+        self.index = 0
+        self.count = 0
+
+    def append(self, value):
+        self.samples[self.index] = value
+        self.index = (self.index + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def values(self):
+        """Get the stored samples, oldest first"""
+        if self.count < self.capacity:
+            return self.samples[: self.count]
+        return self.samples[self.index :] + self.samples[: self.index]
+
+    def mean(self):
+        return sum(self.values()) / self.count if self.count else 0.0
+
+    def percentile(self, percent):
+        """Get a percentile (nearest rank) of the stored samples"""
+        if not self.count:
+            return 0.0
+        ordered = sorted(self.values())
+        rank = max(0, min(self.count - 1, round(percent / 100 * self.count) - 1))
+        return ordered[rank]
+
+
+class FrameProfiler:
+    """
+    Per-frame timing of the main loop.
+
+    The frame is split in phases (events, update, draw, flip) whose times do not
+    overlap: a phase nested in another one is subtracted from its parent. Other
+    sections (update_playing_state, draw_playing_state, load_map, ...) are timed
+    inclusively. Every timing is kept in a fixed-size ring buffer, can be shown
+    in an on-screen overlay and can be dumped per frame to CSV or JSON.
+    """
+
+    PHASES = ("events", "update", "draw", "flip")
+    SECTIONS = ("update_playing_state", "draw_playing_state", "load_map")
+
+    def __init__(self, capacity=600):
+        """
+        Initialize the profiler.
+
+        Args:
+            capacity (int): Number of frames kept in each ring buffer
+        """
+        self.capacity = capacity
+        self.overlay = False
+        self.dump_path = None
+        self.frame_count = 0
+        self.frame_times = RingBuffer(capacity)
+        self.timings = {
+            name: RingBuffer(capacity) for name in self.PHASES + self.SECTIONS
+        }
+
+        self._frame_start = None
+        self._current = {}
+        self._stack = []
+        self._dump_file = None
+        self._csv_writer = None
+        self._json_rows = None
+        self._overlay_lines = []
+        # Per-frame values such as the number of sprites drawn
+        self.counters = {}
+
+    def configure(self, overlay=None, dump_path=None):
+        """
+        Change the profiler options.
+
+        Args:
+            overlay (bool, optional): Show the on-screen overlay
+            dump_path (str, optional): File receiving one row per frame (.csv or .json)
+        """
+        if overlay is not None:
+            self.overlay = overlay
+        if dump_path is not None:
+            self.close()
+            self.dump_path = dump_path
+            # The game exits through sys.exit(), flush the dump at that point
+            atexit.register(self.close)
+            if dump_path.endswith(".json"):
+                self._json_rows = []
+            else:
+                self._dump_file = open(dump_path, "w", newline="")
+                self._csv_writer = csv.writer(self._dump_file)
+                self._csv_writer.writerow(
+                    ["frame", "frame_ms"] + list(self.PHASES + self.SECTIONS)
+                )
+
+    def begin_frame(self):
+        """Mark the start of a frame"""
+        self._frame_start = time.perf_counter()
+        self._current = {}
+        self._stack = []
+
+    def end_frame(self):
+        """Mark the end of a frame and store its timings"""
+        if self._frame_start is None:
+            return
+        frame_ms = (time.perf_counter() - self._frame_start) * 1000
+        self._frame_start = None
+        self.frame_count += 1
+        self.frame_times.append(frame_ms)
+        for name, buffer in self.timings.items():
+            buffer.append(self._current.get(name, 0.0))
+
+        if self._csv_writer:
+            self._csv_writer.writerow(
+                [self.frame_count, round(frame_ms, 3)]
+                + [
+                    round(self._current.get(name, 0.0), 3)
+                    for name in self.PHASES + self.SECTIONS
+                ]
+            )
+        elif self._json_rows is not None:
+            row = {"frame": self.frame_count, "frame_ms": round(frame_ms, 3)}
+            row.update({name: round(ms, 3) for name, ms in self._current.items()})
+            self._json_rows.append(row)
+
+    def record(self, name, ms):
+        """Add a duration, in milliseconds, to a section of the current frame"""
+        self._current[name] = self._current.get(name, 0.0) + ms
+        if name not in self.timings:
+            self.timings[name] = RingBuffer(self.capacity)
+
+    @contextmanager
+    def section(self, name):
+        """Time the enclosed block as a phase or section of the current frame"""
+        if threading.current_thread() is not threading.main_thread():
+            # Work done by loader threads is not part of the frame
+            yield
+            return
+        is_phase = name in self.PHASES
+        entry = [0.0]  # Time spent in nested phases
+        if is_phase:
+            self._stack.append(entry)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            if is_phase:
+                self._stack.pop()
+                if self._stack:
+                    self._stack[-1][0] += elapsed
+                elapsed -= entry[0]
+            self.record(name, elapsed)
+
+    def timed(self, name):
+        """Decorator timing every call of a function as a section"""
+
+        def decorator(function):
+            def wrapper(*args, **kwargs):
+                with self.section(name):
+                    return function(*args, **kwargs)
+
+            wrapper.__name__ = function.__name__
+            wrapper.__doc__ = function.__doc__
+            return wrapper
+
+        return decorator
+
+    def slowest_phase(self):
+        """
+        Get the phase with the highest average time.
+
+        Returns:
+            tuple: (phase name, average milliseconds)
+        """
+        return max(
+            ((name, self.timings[name].mean()) for name in self.PHASES),
+            key=lambda item: item[1],
+        )
+
+    def set_counter(self, name, value):
+        """
+        Set a value reported with the timings, such as a sprite count.
+
+        Args:
+            name (str): Counter name
+            value (int): Value for the current frame
+        """
+        self.counters[name] = value
+
+    def summary(self):
+        """Get frame time percentiles and the slowest phase"""
+        phase, phase_ms = self.slowest_phase()
+        return {
+            "frames": self.frame_count,
+            "p50": self.frame_times.percentile(50),
+            "p95": self.frame_times.percentile(95),
+            "p99": self.frame_times.percentile(99),
+            "slowest_phase": phase,
+            "slowest_phase_ms": phase_ms,
+            "counters": dict(self.counters),
+        }
+
+    def draw_overlay(self, surface, font):
+        """Draw the frame time statistics in the top left corner"""
+        if not self.overlay:
+            return
+
+        # Percentiles need a sort, refresh the text twice per second only
+        if self.frame_count % 30 == 0 or not self._overlay_lines:
+            stats = self.summary()
+            self._overlay_lines = [
+                font.render(text, True, (255, 255, 0))
+                for text in (
+                    f"frame p50 {stats['p50']:.1f} ms  p95 {stats['p95']:.1f} ms"
+                    f"  p99 {stats['p99']:.1f} ms",
+                    f"slowest phase: {stats['slowest_phase']}"
+                    f" ({stats['slowest_phase_ms']:.1f} ms)",
+                )
+            ]
+            if self.counters:
+                text = "  ".join(
+                    f"{name} {value}" for name, value in self.counters.items()
+                )
+                self._overlay_lines.append(font.render(text, True, (255, 255, 0)))
+
+        width = max(line.get_width() for line in self._overlay_lines) + 10
+        height = sum(line.get_height() for line in self._overlay_lines) + 10
+        background = pygame.Surface((width, height), pygame.SRCALPHA)
+        background.fill((0, 0, 0, 180))
+        surface.blit(background, (5, 50))
+        y = 55
+        for line in self._overlay_lines:
+            surface.blit(line, (10, y))
+            y += line.get_height()
+
+    def close(self):
+        """Flush and close the per-frame dump"""
+        if self._dump_file:
+            self._dump_file.close()
+            self._dump_file = None
+            self._csv_writer = None
+        if self._json_rows is not None and self.dump_path:
+            with open(self.dump_path, "w") as f:
+                json.dump(self._json_rows, f)
+            self._json_rows = None
+
+
+# Shared instance used by the main loop and the timing hooks
+frame_profiler = FrameProfiler()
@@ -0,0 +1,107 @@
+class HUD:
+    """
+    Dirty-flag compositor for the in-game HUD.
+
+    Every widget (dash cooldown, lives, coins, projectiles, speedrun timer) is
+    rendered to a cached surface that is only rebuilt when the value it shows
+    changes. Each frame only those few small surfaces are blitted to the
+    screen, never a transparent layer the size of the window.
+    """
+
+    def __init__(self, game_resources):
+        """
+        Initialize the HUD.
+
+        Args:
+            game_resources: GameResources object containing game settings and resources
+        """
+        self.game_resources = game_resources
+        # name -> (value key, rendered surface, top left position on the screen)
+        self.widgets = {}
+
+    def invalidate(self):
+        """Force every widget to be rendered again on the next draw"""
+        self.widgets = {}
+
+    def _set_widget(self, name, key, render, position):
+        """
+        Render a widget again if its value or position changed.
+
+        Args:
+            name (str): Widget name
+            key: Value shown by the widget, compared with the cached one
+            render: Callable returning (surface, (offset_x, offset_y))
+            position (tuple): Position of the widget anchor on the screen
+        """
+        cached = self.widgets.get(name)
+        if cached is not None and cached[0] == (key, position):
+            return
+
+        widget_surface, (offset_x, offset_y) = render()
+        self.widgets[name] = (
+            (key, position),
+            widget_surface,
+            (position[0] - offset_x, position[1] - offset_y),
+        )
+
+    def _remove_widget(self, name):
+        """Stop drawing a widget"""
+        self.widgets.pop(name, None)
+
+    def draw(self, surface, player, speedrun_timer=None):
+        """
+        Render the widgets whose value changed and blit every widget.
+
+        Args:
+            surface: Pygame surface to draw on
+            player: Player whose state is displayed
+            speedrun_timer: Optional SpeedrunTimer to display
+        """
+        width, height = surface.get_size()
+
+        # Dash cooldown bar
+        dash_fill = player.get_dash_cooldown_fill()
+        self._set_widget(
+            "dash",
+            dash_fill,
+            lambda: (player.render_dash_cooldown_bar(dash_fill), (0, 0)),
+            (560, 330),
+        )
+
+        # Lives in the top right corner
+        lives_surface = player.get_lives_surface()
+        self._set_widget(
+            "lives",
+            (player.lives, player.max_lives),
+            lambda: (lives_surface, (0, 0)),
+            (width - lives_surface.get_width(), 10),
+        )
+
+        # Counters in the top left corner
+        self._set_widget("coins", player.coins, player.render_coins, (200, 10))
+        self._set_widget(
+            "projectiles",
+            player.projectiles,
+            player.render_projectiles_amount,
+            (300, 10),
+        )
+
+        # Speedrun timer in the bottom left corner
+        if speedrun_timer and speedrun_timer.is_visible():
+            formatted_time = speedrun_timer.format_time(speedrun_timer.current_time)
+            self._set_widget(
+                "timer",
+                (formatted_time, speedrun_timer.color),
+                lambda: (speedrun_timer.render(formatted_time), (0, 0)),
+                (20, height - 50),
+            )
+        else:
+            self._remove_widget("timer")
+
+        surface.blits(
+            [
+                (widget_surface, position)
+                for _, widget_surface, position in self.widgets.values()
+            ],
+            False,
+        )
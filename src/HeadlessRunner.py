@@ -0,0 +1,313 @@
+import argparse
+import json
+import os
+import random
+import time
+
+import pygame
+
+from src import InputState
+
+
+class InputScript:
+    """
+    Scripted keyboard input replayed frame by frame.
+
+    A script is a list of segments such as
+    {"from": 0, "to": 120, "keys": ["d", "space"]}: the keys are held down
+    for every frame in [from, to). Frames outside every segment have no key
+    held. Key names are the ones accepted by pygame.key.key_code().
+    """
+
+    # Default script: run right, jumping regularly, with a dash from time to time
+    DEFAULT_SEGMENTS = [
+        {"from": 0, "to": 100000, "keys": ["d"]},
+        {"from": 30, "to": 100000, "keys": ["space"], "every": 45, "hold": 20},
+        {"from": 60, "to": 100000, "keys": ["a"], "every": 240, "hold": 2},
+    ]
+
+    def __init__(self, segments=None):
+        """
+        Initialize the script.
+
+        Args:
+            segments (list, optional): Script segments, the default run-and-jump script if None
+        """
+        self.segments = []
+        for segment in segments or self.DEFAULT_SEGMENTS:
+            self.segments.append(
+                (
+                    segment.get("from", 0),
+                    segment.get("to", segment.get("from", 0) + 1),
+                    segment.get("every"),
+                    segment.get("hold", 1),
+                    [pygame.key.key_code(name) for name in segment["keys"]],
+                )
+            )
+
+    @classmethod
+    def from_file(cls, path):
+        """Load a script from a JSON file containing a list of segments"""
+        with open(path, "r") as f:
+            return cls(json.load(f))
+
+    def keys_at(self, frame):
+        """Get the key codes held down at a frame"""
+        pressed = set()
+        for start, end, every, hold, keys in self.segments:
+            if start <= frame < end:
+                # Repeating segments only hold their keys at the start of each period
+                if every and (frame - start) % every >= hold:
+                    continue
+                pressed.update(keys)
+        return pressed
+
+
+class HeadlessRunner:
+    """
+    Run the playing state without a window, real time or live input.
+
+    The game is stepped at a fixed timestep: every frame advances the simulated
+    clock by 1000 / fps milliseconds and replays the scripted input, then runs
+    update_playing_state and draw_playing_state exactly like the main loop.
+    Used to benchmark and regression-test the game loop.
+
+    Boost expirations still rely on pygame timers and therefore on real time.
+    """
+
+    def __init__(
+        self, map_file=None, frames=600, script=None, seed=0, draw=True, run_seed=None
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            map_file (str, optional): Map JSON file, None to generate an infinite map
+            frames (int): Number of frames to simulate
+            script (InputScript, optional): Input to replay, the default script if None
+            seed (int): Seed of the global random generator and of the generated map
+            draw (bool): Also run draw_playing_state every frame
+            run_seed (int, optional): Seed of an infinite run to replay, its first map
+                is played instead of map_file
+        """
+        self.map_file = map_file
+        self.frames = frames
+        self.script = script
+        self.seed = seed
+        self.draw = draw
+        self.run_seed = run_seed
+
+    def run(self, infinite_difficulty=1):
+        """
+        Load the map and simulate the requested number of frames.
+
+        Args:
+            infinite_difficulty (int): Difficulty of the generated map when no map file is given
+
+        Returns:
+            dict: Frame count, wall time, frames per second and final game state
+        """
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+        # Imported here so the SDL drivers are selected before pygame starts, when
+        # the runner is used without main()
+        from src.Camera import Camera
+        from src.constant import GameResources
+        from src.FrameProfiler import frame_profiler
+        from src.game import initialize_game, start_infinite_mode
+        from src.handler import draw_playing_state, update_playing_state
+        from src.HUD import HUD
+        from src.Map.cinematic import Cinematic
+        from src.Map.Infinite.InfiniteMapGenerator import InfiniteMapGenerator
+        from src.Map.parser import MapParser
+
+        random.seed(self.seed)
+        game_resources = GameResources()
+        game_resources.hud = HUD(game_resources)
+        displaysurface = game_resources.displaysurface
+        camera = Camera(game_resources.WIDTH, game_resources.HEIGHT, game_resources)
+        script = self.script or InputScript()
+
+        # Cinematics are shown by the handler's cutscene state, skip them
+        for level_name in Cinematic.played_cinematics:
+            Cinematic.played_cinematics[level_name] = True
+
+        map_file = self.map_file
+        map_objects = None
+
+        InputState.set_simulated_ticks(0)
+        InputState.set_scripted_keys(())
+        try:
+            start = time.perf_counter()
+            if self.run_seed is not None:
+                # Same maps as the infinite run the seed was saved with
+                level = start_infinite_mode(game_resources, self.run_seed)
+                map_file = game_resources.infinite_manager.active_maps[0]
+                # The next map is generated in the background, not during the frames
+                game_resources.infinite_manager.wait_for_preload()
+            elif map_file is None:
+                map_data = InfiniteMapGenerator(game_resources).generate_map(
+                    infinite_difficulty, seed=self.seed
+                )
+                map_file = map_data["id"]
+                parser = MapParser(game_resources, detached=True)
+                map_objects = parser.load_map(map_file, map_data)
+            if self.run_seed is None:
+                level = initialize_game(game_resources, map_file, map_objects)
+            (
+                P1,
+                _,
+                platforms,
+                all_sprites,
+                background,
+                checkpoints,
+                exits,
+                collectibles,
+            ) = level
+            load_time = time.perf_counter() - start
+
+            # The exit cutscene plays in real time, only keep the exit collision
+            for exit_obj in exits or []:
+                exit_obj.active = False
+            spawn = P1.pos.copy()
+
+            projectiles = game_resources.projectile_pool
+            deaths = 0
+            completed_frame = None
+            simulated = 0
+
+            start = time.perf_counter()
+            for frame in range(self.frames):
+                simulated = frame + 1
+                frame_profiler.begin_frame()
+                InputState.set_simulated_ticks(frame * 1000 / game_resources.FPS)
+                InputState.set_scripted_keys(script.keys_at(frame))
+
+                with frame_profiler.section("events"):
+                    for event in pygame.event.get():
+                        if event.type != pygame.USEREVENT:
+                            continue
+                        if event.dict.get("action") == "player_death":
+                            deaths += 1
+                            P1.respawn_at_checkpoint(spawn.x, spawn.y)
+
+                with frame_profiler.section("update"):
+                    update_playing_state(
+                        P1,
+                        platforms,
+                        projectiles,
+                        game_resources.WIDTH,
+                        game_resources.HEIGHT,
+                        camera,
+                        all_sprites,
+                    )
+
+                result = None
+                if self.draw:
+                    with frame_profiler.section("draw"):
+                        displaysurface.fill((0, 0, 0))
+                        result = draw_playing_state(
+                            displaysurface,
+                            background,
+                            all_sprites,
+                            P1,
+                            camera,
+                            game_resources.WIDTH,
+                            game_resources.HEIGHT,
+                            game_resources.font,
+                            projectiles,
+                            checkpoints,
+                            exits,
+                            collectibles,
+                            game_resources,
+                            map_file,
+                            game_resources.FramePerSec,
+                        )
+                    with frame_profiler.section("flip"):
+                        pygame.display.update()
+                frame_profiler.end_frame()
+
+                if result:
+                    completed_frame = frame
+                    break
+
+            elapsed = time.perf_counter() - start
+        finally:
+            InputState.use_live_input()
+
+        return {
+            "map": map_file,
+            "frames": simulated,
+            "load_seconds": load_time,
+            "seconds": elapsed,
+            "fps": simulated / elapsed if elapsed else 0.0,
+            "frame_ms": frame_profiler.summary(),
+            "deaths": deaths,
+            "completed_frame": completed_frame,
+            "player_pos": [round(P1.pos.x, 3), round(P1.pos.y, 3)],
+            "coins": P1.coins,
+        }
+
+
+def main():
+    # Before pygame.init() below, which would otherwise open a real window and audio device
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    parser = argparse.ArgumentParser(
+        description="Run the game loop headless on a map and report frames/sec"
+    )
+    parser.add_argument("map", nargs="?", help="map JSON file (omit with --infinite)")
+    parser.add_argument("--frames", type=int, default=600, help="frames to simulate")
+    parser.add_argument("--script", help="JSON input script (list of segments)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument(
+        "--run-seed",
+        type=int,
+        help="replay the first map of the infinite run saved with this seed",
+    )
+    parser.add_argument(
+        "--infinite", type=int, metavar="DIFFICULTY", help="generate an infinite map"
+    )
+    parser.add_argument(
+        "--no-draw", action="store_true", help="only run update_playing_state"
+    )
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    if not args.map and args.infinite is None and args.run_seed is None:
+        parser.error("a map file, --infinite or --run-seed is required")
+    if args.run_seed is not None and (args.map or args.infinite is not None):
+        parser.error("--run-seed replays its own map, without a map file or --infinite")
+
+    # pygame.key.key_code() needs pygame to be initialised
+    pygame.init()
+    script = InputScript.from_file(args.script) if args.script else None
+    runner = HeadlessRunner(
+        args.map,
+        args.frames,
+        script,
+        seed=args.seed,
+        draw=not args.no_draw,
+        run_seed=args.run_seed,
+    )
+    report = runner.run(args.infinite or 1)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(
+            f"{report['map']}: {report['frames']} frames in {report['seconds']:.2f}s"
+            f" -> {report['fps']:.1f} frames/sec"
+            f" (load {report['load_seconds']:.2f}s, p95 {report['frame_ms']['p95']:.2f} ms,"
+            f" slowest phase {report['frame_ms']['slowest_phase']})"
+        )
+        print(
+            f"deaths: {report['deaths']}, completed at frame: {report['completed_frame']},"
+            f" player: {report['player_pos']}, coins: {report['coins']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import pygame
+
+# When set, these replace the live keyboard state and the real clock
+_scripted_keys = None
+_simulated_ticks = None
+
+
+class ScriptedKeys:
+    """Keyboard state indexable like the sequence returned by pygame.key.get_pressed()"""
+
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+def get_pressed():
+    """Get the keyboard state, scripted if a script is installed"""
+    if _scripted_keys is not None:
+        return _scripted_keys
+    return pygame.key.get_pressed()
+
+
+def get_ticks():
+    """Get the game time in milliseconds, simulated if a fixed timestep is installed"""
+    if _simulated_ticks is not None:
+        return _simulated_ticks
+    return pygame.time.get_ticks()
+
+
+def set_scripted_keys(pressed):
+    """
+    Replace the live keyboard state.
+
+    Args:
+        pressed: Iterable of pygame key codes held down
+    """
+    global _scripted_keys
+    _scripted_keys = ScriptedKeys(pressed)
+
+
+def set_simulated_ticks(ticks):
+    """
+    Replace the real clock.
+
+    Args:
+        ticks (int): Game time in milliseconds
+    """
+    global _simulated_ticks
+    _simulated_ticks = int(ticks)
+
+
+def use_live_input():
+    """Go back to the live keyboard and the real clock"""
+    global _scripted_keys, _simulated_ticks
+    _scripted_keys = None
+    _simulated_ticks = None
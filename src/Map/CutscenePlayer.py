@@ -0,0 +1,272 @@
+import os
+import queue
+import threading
+
+import numpy as np
+import pygame
+
+from src import InputState
+
+CUTSCENE_CACHE_DIR = ".cache/cutscenes"
+
+
+class CutscenePlayer:
+    """
+    Video cutscene decoded on a worker thread and shown by the main loop.
+
+    The worker decodes the audio track into a pygame Sound held in memory,
+    then decodes the video frames, scales them to the screen size and puts
+    them in a bounded queue. The main loop calls update() every frame, which
+    picks the frame matching the time elapsed since playback started, so
+    window and input events keep being processed while the video plays.
+
+    The scaled frames are also encoded into a video at screen size in the
+    cache directory, and later viewings at the same size read that video
+    instead, so they skip decoding the full-size video and scaling it. The
+    cache is only kept when the whole video was decoded: a skipped cutscene
+    stops the worker so it does not compete with the game loop.
+    """
+
+    def __init__(
+        self, video_path, size, fps=24, queue_size=24, cache_dir=CUTSCENE_CACHE_DIR
+    ):
+        """
+        Initialize the cutscene.
+
+        Args:
+            video_path (str): Path to the video file
+            size (tuple): Width and height the frames are scaled to
+            fps (int): Frames shown per second
+            queue_size (int): Maximum number of decoded frames waiting to be shown
+            cache_dir (str, optional): Directory of the pre-scaled videos, None to
+                disable the cache
+        """
+        self.video_path = video_path
+        self.size = (int(size[0]), int(size[1]))
+        self.fps = fps
+        self.cache_dir = cache_dir
+        self.frames = queue.Queue(maxsize=queue_size)
+        self.sound = None
+        self.channel = None
+        self.current_frame = None
+        self.frame_index = -1
+        self.start_ticks = None
+        self.finished = False
+        self._music_paused = False
+        self._audio_ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start decoding in the background"""
+        self._thread = threading.Thread(target=self._decode, daemon=True)
+        self._thread.start()
+
+    def update(self, surface):
+        """
+        Show the frame due at the current time.
+
+        Args:
+            surface (pygame.Surface): Surface the frame is drawn on
+
+        Returns:
+            bool: True once the cutscene is over
+        """
+        if self.finished:
+            return True
+
+        if self.start_ticks is None:
+            # Start the audio and the video together once both are decoded
+            if not self._audio_ready.is_set() or self.frames.empty():
+                surface.fill((0, 0, 0))
+                return False
+            self._start_playback()
+
+        elapsed = InputState.get_ticks() - self.start_ticks
+        due_frame = int(elapsed * self.fps / 1000)
+        while self.frame_index < due_frame:
+            try:
+                frame = self.frames.get_nowait()
+            except queue.Empty:
+                # The decoder is late, keep showing the last frame
+                break
+            if frame is None:
+                self.finished = True
+                break
+            self.current_frame = frame
+            self.frame_index += 1
+
+        # Like the video, the cutscene ends with its sound
+        if self.channel is not None and not self.channel.get_busy():
+            self.finished = True
+
+        if self.current_frame is not None:
+            frame = self.current_frame
+            if frame.get_size() != surface.get_size():
+                # The window was resized during the cutscene
+                frame = pygame.transform.scale(frame, surface.get_size())
+            surface.blit(frame, (0, 0))
+        return self.finished
+
+    def skip(self):
+        """End the cutscene at the next update"""
+        self.finished = True
+
+    def close(self):
+        """Stop the decoder and the sound and resume the music, without waiting for the decoder"""
+        self.finished = True
+        self._stop.set()
+        if self.channel is not None:
+            self.channel.stop()
+        if self._music_paused:
+            pygame.mixer.music.unpause()
+            self._music_paused = False
+
+    def cache_path(self):
+        """
+        Get the path of the pre-scaled video for the current size.
+
+        Returns:
+            str: Path of the cached video, None if the cache is disabled
+        """
+        if self.cache_dir is None:
+            return None
+        name = os.path.splitext(os.path.basename(self.video_path))[0]
+        return os.path.join(self.cache_dir, f"{name}_{self.size[0]}x{self.size[1]}.mp4")
+
+    def _start_playback(self):
+        """Pause the music and play the sound of the cutscene"""
+        if pygame.mixer.get_init():
+            pygame.mixer.music.pause()
+            self._music_paused = True
+            if self.sound is not None:
+                self.channel = self.sound.play()
+        self.start_ticks = InputState.get_ticks()
+
+    def _decode(self):
+        """Worker thread: decode the audio, then every frame into the queue"""
+        writer = None
+        try:
+            # moviepy pulls in imageio and ffmpeg, only import it when a video plays
+            from moviepy import AudioFileClip, VideoFileClip
+
+            try:
+                self.sound = self._load_sound(AudioFileClip(self.video_path))
+            except Exception as e:
+                print(f"Error decoding cutscene audio: {e}")
+            self._audio_ready.set()
+
+            cache_path = self.cache_path()
+            cached = (
+                cache_path is not None
+                and os.path.isfile(cache_path)
+                and os.path.getmtime(cache_path) >= os.path.getmtime(self.video_path)
+            )
+            # ffmpeg scales the frames while decoding them, outside of the GIL
+            clip = VideoFileClip(
+                cache_path if cached else self.video_path,
+                audio=False,
+                target_resolution=self.size,
+            )
+            if cache_path is not None and not cached:
+                writer = self._open_writer(cache_path)
+
+            complete = True
+            for frame in clip.iter_frames(fps=self.fps, dtype="uint8"):
+                # Skipped or over: stop decoding, a partial cache is discarded
+                if self._stop.is_set():
+                    complete = False
+                    break
+                surface = pygame.surfarray.make_surface(frame.swapaxes(0, 1))
+                if surface.get_size() != self.size:
+                    surface = pygame.transform.scale(surface, self.size)
+                if writer is not None:
+                    try:
+                        writer.send(pygame.image.tobytes(surface, "RGB"))
+                    except Exception as e:
+                        print(f"Error writing the cutscene cache: {e}")
+                        self._close_writer(writer, cache_path, False)
+                        writer = None
+                self._put(surface)
+            clip.close()
+
+            if writer is not None:
+                self._close_writer(writer, cache_path, complete)
+                writer = None
+        except Exception as e:
+            print(f"Error playing cutscene {self.video_path}: {e}")
+            if writer is not None:
+                self._close_writer(writer, cache_path, False)
+        finally:
+            self._audio_ready.set()
+            self._put(None)
+
+    def _load_sound(self, audio):
+        """Decode an audio clip into a Sound in the mixer format, without a file"""
+        if audio is None or not pygame.mixer.get_init():
+            return None
+        frequency, bits, channels = pygame.mixer.get_init()
+        samples = audio.to_soundarray(fps=frequency)
+        audio.close()
+
+        if samples.ndim == 1:
+            samples = samples[:, np.newaxis]
+        if samples.shape[1] != channels:
+            samples = np.repeat(samples.mean(axis=1, keepdims=True), channels, axis=1)
+        if channels == 1:
+            samples = samples[:, 0]
+
+        samples = np.clip(samples, -1, 1)
+        if bits == 32:
+            samples = samples.astype(np.float32)
+        elif abs(bits) == 16:
+            samples = (samples * 32767).astype(np.int16)
+        else:
+            print(f"Unsupported mixer format for cutscene audio: {bits} bits")
+            return None
+        return pygame.sndarray.make_sound(np.ascontiguousarray(samples))
+
+    def _open_writer(self, cache_path):
+        """Start encoding the scaled frames into the cache, None if not possible"""
+        if self.size[0] % 2 or self.size[1] % 2:
+            # H.264 needs even dimensions
+            return None
+        try:
+            import imageio_ffmpeg
+
+            os.makedirs(self.cache_dir, exist_ok=True)
+            writer = imageio_ffmpeg.write_frames(
+                cache_path + ".tmp.mp4",
+                self.size,
+                fps=self.fps,
+                codec="libx264",
+                macro_block_size=1,
+                ffmpeg_log_level="error",
+            )
+            writer.send(None)
+            return writer
+        except Exception as e:
+            print(f"Error creating the cutscene cache: {e}")
+            return None
+
+    @staticmethod
+    def _close_writer(writer, cache_path, keep):
+        """Finish the cached video, keeping it only if every frame was written"""
+        temp_path = cache_path + ".tmp.mp4"
+        try:
+            writer.close()
+            if keep:
+                os.replace(temp_path, cache_path)
+            elif os.path.exists(temp_path):
+                os.remove(temp_path)
+        except Exception as e:
+            print(f"Error closing the cutscene cache: {e}")
+
+    def _put(self, item):
+        """Add to the frame queue, giving up if the cutscene is stopped"""
+        while not self._stop.is_set():
+            try:
+                self.frames.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
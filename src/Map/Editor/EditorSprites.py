@@ -1,9 +1,14 @@
 import pygame
 
+from src.Assets.AssetCache import asset_cache
+from src.Renderer import LAYER_COLLECTIBLES, LAYER_ENEMIES, LAYER_PLATFORMS
+
 
 class EditorPlatform(pygame.sprite.Sprite):
     """Platform object for the level editor"""
 
+    render_layer = LAYER_PLATFORMS
+
     def __init__(self, width, height, x, y):
         super().__init__()
         self.rect = pygame.Rect(x, y, width, height)
@@ -27,16 +32,10 @@ class EditorPlatform(pygame.sprite.Sprite):
     def update_appearance(self):
         """Update the appearance of the platform based on its attributes"""
         try:
-            # Load the texture if it exists
-            texture = pygame.image.load(self.texture).convert()
-
-            # Resize the texture to fit the platform
-            texture = pygame.transform.scale(
-                texture, (self.rect.width, self.rect.height)
+            # Load the texture resized to fit the platform
+            self.image = asset_cache.get_image(
+                self.texture, (self.rect.width, self.rect.height), alpha=False
             )
-
-            # Apply the texture to the platform
-            self.image = texture
         except Exception as e:
             # Fallback to a default color if the texture fails to load
             self.image = pygame.Surface((self.rect.width, self.rect.height))
@@ -44,6 +43,8 @@ class EditorPlatform(pygame.sprite.Sprite):
 
 
 class EditorCheckpoint(pygame.sprite.Sprite):
+    render_layer = LAYER_PLATFORMS
+
     def __init__(self, x, y):
         super().__init__()
         self.rect = pygame.Rect(x, y, 30, 30)
@@ -52,6 +53,8 @@ class EditorCheckpoint(pygame.sprite.Sprite):
 
 
 class EditorEnemy(pygame.sprite.Sprite):
+    render_layer = LAYER_ENEMIES
+
     def __init__(self, game_resources, x, y, enemy_type="walker"):
         super().__init__()
         self.rect = pygame.Rect(x, y, 30, 30)
@@ -69,6 +72,8 @@ class EditorEnemy(pygame.sprite.Sprite):
 
 
 class EditorExit(pygame.sprite.Sprite):
+    render_layer = LAYER_PLATFORMS
+
     def __init__(self, x, y, width=50, height=50, next_level="map/levels/1.json"):
         super().__init__()
         self.rect = pygame.Rect(x, y, width, height)
@@ -79,6 +84,8 @@ class EditorExit(pygame.sprite.Sprite):
 
 
 class EditorCollectible(pygame.sprite.Sprite):
+    render_layer = LAYER_COLLECTIBLES
+
     def __init__(self, x, y, collectible_type="coin"):
         super().__init__()
         self.rect = pygame.Rect(x, y, 20, 20)
@@ -712,15 +712,15 @@ class LevelEditor:
                 surface, (60, 60, 60), (0, y), (self.game_resources.WIDTH, y)
             )
 
-        # Draw all sprites
-        for sprite in self.all_sprites:
-            screen_pos = self.world_to_screen((sprite.rect.x, sprite.rect.y))
-            temp_rect = sprite.rect.copy()
-            temp_rect.topleft = screen_pos
-            surface.blit(sprite.image, temp_rect)
+        # Draw all sprites in one batch, ordered by layer
+        offset = self.world_to_screen((0, 0))
+        renderer = self.game_resources.renderer
+        renderer.add_sprites(self.all_sprites, offset, "image")
+        renderer.flush(surface)
 
-            # Draw hitbox
-            pygame.draw.rect(surface, (255, 0, 0), temp_rect, 2)
+        # Draw hitboxes
+        for sprite in self.all_sprites:
+            pygame.draw.rect(surface, (255, 0, 0), sprite.rect.move(offset), 2)
 
         # Draw player start position
         if self.player_start:
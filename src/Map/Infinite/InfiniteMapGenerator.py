@@ -3,6 +3,11 @@ import json
 import os
 import uuid
 
+from src.Map.Infinite.JumpEnvelope import JumpEnvelope
+
+# Fraction of the jump envelope used when placing platforms, keeps jumps forgiving
+JUMP_MARGIN = 0.85
+
 
 class InfiniteMapGenerator:
     """Procedural map generator for infinite levels."""
@@ -11,6 +16,9 @@ class InfiniteMapGenerator:
         self.game_resources = game_resources
         self.width = 2400
         self.height = 800
+        # Band of the screen where platform tops are placed
+        self.min_top = 140
+        self.max_top = 390
         self.backgrounds = [
             "assets/map/background/forest_bg.jpg",
             "assets/map/background/desert_bg.jpg",
@@ -23,35 +31,69 @@ class InfiniteMapGenerator:
             "assets/map/platform/wood_texture.png",
         ]
 
-        # Create the directory for infinite maps if it doesn't exist
-        os.makedirs("map/infinite", exist_ok=True)
+        # Maps stay in memory unless exporting them is enabled
+        self.export = getattr(game_resources, "export_infinite_maps", False)
+
+        # Jumps the player can make, platforms are only placed inside it
+        self.envelope = JumpEnvelope(
+            acc=getattr(game_resources, "ACC", 0.5),
+            fric=getattr(game_resources, "FRIC", -0.12),
+        )
+
+    def generate_map(self, difficulty=1, seed=None):
+        """
+        Generate a new infinite map with the specified difficulty level.
+
+        Args:
+            difficulty (int): Difficulty of the map
+            seed (int, optional): Seed of the layout, a random one is picked if None
 
-    def generate_map(self, difficulty=1):
-        """Generate a new infinite map with the specified difficulty level."""
+        Returns:
+            dict: Map data in the level JSON format, its "id" key is the path the
+                map is exported to and identifies it for checkpoints, its "seed"
+                key regenerates the same layout
+        """
+        if seed is None:
+            seed = random.randrange(2**32)
+        # Private generator so the layout only depends on the seed
+        rng = random.Random(seed)
+
+        platforms = self._generate_platforms(rng, difficulty)
+        exit_platform = platforms[-1]
+        width = max(self.width, exit_platform["x"] + exit_platform["width"])
+
+        map_id = str(uuid.uuid4())[:8]
         map_data = {
+            "id": f"map/infinite/{map_id}.json",
+            "seed": seed,
             "name": f"Niveau Infini {difficulty}",
-            "width": self.width,
+            "width": width,
             "height": self.height,
-            "background": random.choice(self.backgrounds),
+            "background": rng.choice(self.backgrounds),
             "gravity": 1.0,
-            "platforms": self._generate_platforms(difficulty),
-            "enemies": self._generate_enemies(difficulty),
+            "platforms": platforms,
+            "enemies": self._generate_enemies(rng, difficulty, width),
             "checkpoints": [],
-            "exits": [self._generate_exit()],
-            "collectibles": self._generate_collectibles(difficulty),
+            "exits": [self._generate_exit(exit_platform)],
+            "collectibles": self._generate_collectibles(rng, difficulty, width),
             "spawn_point": {"x": 260.0, "y": 200.0},
         }
 
-        # Save the map data to a JSON file
-        map_id = str(uuid.uuid4())[:8]
-        map_path = f"map/infinite/{map_id}.json"
+        if self.export:
+            self.export_map(map_data)
 
-        with open(map_path, "w") as f:
-            json.dump(map_data, f, indent=2)
+        return map_data
 
-        return map_path
+    def export_map(self, map_data):
+        """Write a generated map to its JSON file in map/infinite"""
+        try:
+            os.makedirs("map/infinite", exist_ok=True)
+            with open(map_data["id"], "w") as f:
+                json.dump(map_data, f, indent=2)
+        except Exception as e:
+            print(f"Error exporting infinite map: {e}")
 
-    def _generate_platforms(self, difficulty):
+    def _generate_platforms(self, rng, difficulty):
         platforms = []
 
         # Starting platform
@@ -62,86 +104,120 @@ class InfiniteMapGenerator:
                 "y": 260,
                 "width": 540,
                 "height": 60,
-                "texture": random.choice(self.platform_textures),
+                "texture": rng.choice(self.platform_textures),
                 "is_moving": False,
             }
         )
 
-        # Generate additional platforms
+        # Generate additional platforms, each one reachable from the previous one
         num_platforms = 10 + difficulty * 2
-        last_x = 600
-        last_y = 260
-        max_jump_height = 120
+        last_x = platforms[0]["x"] + platforms[0]["width"]
+        last_top = platforms[0]["y"] - platforms[0]["height"] // 2
+        last_width = platforms[0]["width"]
 
         for i in range(num_platforms):
-            width = random.randint(
+            width = rng.randint(
                 max(40, 100 - difficulty * 5), max(120, 300 - difficulty * 10)
             )
-            gap = random.randint(80, 200)
+            height = rng.choice([20, 40, 60])
+            rise, gap = self._pick_jump(rng, last_top, last_width)
             x = last_x + gap
+            top = last_top - rise
+            y = top + height // 2
 
-            min_y = max(150, last_y - max_jump_height)
-            max_y = min(400, last_y + 80)
-
-            y = random.randint(min_y, max_y)
-
-            is_moving = random.random() < min(0.1 + difficulty * 0.05, 0.5)
+            is_moving = rng.random() < min(0.1 + difficulty * 0.05, 0.5)
 
             platform = {
                 "id": f"platform{i+2}",
                 "x": x,
                 "y": y,
                 "width": width,
-                "height": random.choice([20, 40, 60]),
-                "texture": random.choice(self.platform_textures),
+                "height": height,
+                "texture": rng.choice(self.platform_textures),
                 "is_moving": is_moving,
             }
 
             if is_moving:
-                move_direction = random.choice(["horizontal", "vertical"])
-                distance = random.randint(100, 200)
+                move_direction = rng.choice(["horizontal", "vertical"])
+                distance = rng.randint(100, 200)
 
                 if move_direction == "horizontal":
                     platform["movement"] = {
                         "type": "linear",
                         "points": [{"x": x, "y": y}, {"x": x + distance, "y": y}],
-                        "speed": random.randint(1, 3),
+                        "speed": rng.randint(1, 3),
                         "wait_time": 0.5,
                     }
                 else:
                     platform["movement"] = {
                         "type": "linear",
                         "points": [{"x": x, "y": y}, {"x": x, "y": y + distance}],
-                        "speed": random.randint(1, 3),
+                        "speed": rng.randint(1, 3),
                         "wait_time": 0.5,
                     }
 
             platforms.append(platform)
             last_x = x + width
-            last_y = y
+            last_top = top
+            last_width = width
+
+        # The exit stands on a last, wide platform
+        rise, gap = self._pick_jump(rng, last_top, last_width)
+        top = last_top - rise
+        platforms.append(
+            {
+                "id": "platform_exit",
+                "x": last_x + gap,
+                "y": top + 30,
+                "width": 300,
+                "height": 60,
+                "texture": rng.choice(self.platform_textures),
+                "is_moving": False,
+            }
+        )
 
         return platforms
 
-    def _generate_enemies(self, difficulty):
+    def _pick_jump(self, rng, last_top, run_up):
+        """
+        Pick the position of the next platform inside the jump envelope.
+
+        Args:
+            rng (random.Random): Generator of the map
+            last_top (int): Top of the platform the player jumps from
+            run_up (int): Width of that platform, the ground to gain speed on
+
+        Returns:
+            tuple: (rise, gap) height above the last top and horizontal distance
+        """
+        max_rise = int(min(self.envelope.apex * JUMP_MARGIN, last_top - self.min_top))
+        max_drop = min(80, self.max_top - last_top)
+        rise = rng.randint(-max_drop, max_rise)
+
+        max_gap = int(self.envelope.max_gap(rise, run_up) * JUMP_MARGIN)
+        gap = rng.randint(min(80, max_gap), min(200, max_gap))
+        return rise, gap
+
+    def _generate_enemies(self, rng, difficulty, width):
         enemies = []
         num_enemies = difficulty * 2
         enemy_types = ["walker", "flyer", "turret"]
 
         for i in range(num_enemies):
-            type = random.choice(enemy_types)
+            type = rng.choice(enemy_types)
             enemy = {
                 "id": f"enemy{i+1}",
                 "type": type,
-                "x": random.randint(600, self.width - 200),
-                "y": random.randint(100, 400),
-                "patrol_distance": random.randint(100, 300),
+                "x": rng.randint(600, width - 200),
+                "y": rng.randint(100, 400),
+                "patrol_distance": rng.randint(100, 300),
             }
             if type == "flyer":
                 enemy["sprite_sheet"] = "assets/map/enemy/flying_enemy.png"
                 enemy["health"] = 1
                 enemy["damage"] = 1
                 enemy["behavior"] = "chase"
-                enemy["detection_radius"] = random.randint(100, 500)
+                enemy["detection_radius"] = rng.randint(100, 500)
                 enemy["speed"] = 2.0
                 enemy["size"] = [50, 50]
             elif type == "walker":
@@ -160,43 +236,44 @@ class InfiniteMapGenerator:
                 enemy["health"] = 1
                 enemy["damage"] = 1
                 enemy["behavior"] = "stationary"
-                enemy["attack_interval"] = random.uniform(0.5, 3.0)
-                enemy["attack_range"] = random.randint(100, 500)
+                enemy["attack_interval"] = rng.uniform(0.5, 3.0)
+                enemy["attack_range"] = rng.randint(100, 500)
                 enemy["size"] = [50, 50]
             enemies.append(enemy)
 
         return enemies
 
-    def _generate_collectibles(self, difficulty):
+    def _generate_collectibles(self, rng, difficulty, width):
         collectibles = []
         num_collectibles = 5 + difficulty
         collectible_types = ["coin"]
 
         for i in range(num_collectibles):
-            rand = random.choice(collectible_types)
+            rand = rng.choice(collectible_types)
             if rand == "coin":
                 collectible = {
                     "id": f"collectible{i + 1}",
                     "type": "coin",
-                    "x": random.randint(400, self.width - 100),
-                    "y": random.randint(100, 400),
+                    "x": rng.randint(400, width - 100),
+                    "y": rng.randint(100, 400),
                     "sprite": "assets/map/collectibles/Sanic_Coin.png",
                 }
             else:
                 collectible = {
                     "id": f"collectible{i+1}",
-                    "type": random.choice(collectible_types),
-                    "x": random.randint(400, self.width - 100),
-                    "y": random.randint(100, 400),
+                    "type": rng.choice(collectible_types),
+                    "x": rng.randint(400, width - 100),
+                    "y": rng.randint(100, 400),
                 }
             collectibles.append(collectible)
 
         return collectibles
 
-    def _generate_exit(self):
+    def _generate_exit(self, platform):
+        # Exits are centered on their position, stand it on the exit platform
         return {
-            "x": self.width - 100,
-            "y": 200,
+            "x": platform["x"] + platform["width"] - 100,
+            "y": platform["y"] - platform["height"] // 2 - 40,
             "width": 50,
             "height": 80,
             "next_level": "NEXT_INFINITE_LEVEL",
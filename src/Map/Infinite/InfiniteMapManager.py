@@ -1,75 +1,162 @@
 import os
-import json
 import glob
+import random
+import threading
 from src.Map.Infinite.InfiniteMapGenerator import InfiniteMapGenerator
+from src.Map.parser import MapParser
 
+# Maps generated on the main thread before giving up, each one with a new seed
+LOAD_ATTEMPTS = 3
 
-class InfiniteMapManager:
-    """Handle infinite map generation and management."""
 
-    def __init__(self, game_resources):
+class InfiniteMapManager:
+    """
+    Handle infinite map generation and management.
+
+    The map after the one being played is generated and parsed into detached
+    sprite groups on a background thread, so reaching an exit only has to swap
+    the ready groups in.
+    """
+
+    def __init__(self, game_resources, seed=None):
+        """
+        Args:
+            game_resources: GameResources object
+            seed (int, optional): Seed of the run, a random one is picked if None
+        """
         self.game_resources = game_resources
         self.map_generator = InfiniteMapGenerator(game_resources)
         self.current_level = 0
         self.active_maps = []
         self.difficulty = 1
 
-    def start_infinite_mode(self):
-        """Start the infinite mode by generating the first two maps."""
-        self._clean_old_maps()
+        # Every map seed is drawn from the run seed, so a run can be replayed
+        self.run_seed = seed if seed is not None else random.randrange(2**32)
+        self.seed_sequence = random.Random(self.run_seed)
+        self.level_seeds = []
 
-        # Generate the first two maps
-        first_map = self.map_generator.generate_map(difficulty=self.difficulty)
-        second_map = self.map_generator.generate_map(difficulty=self.difficulty)
+        # Background loading of the next map
+        self.preload_thread = None
+        self.preloaded = {}
+        # (difficulty, exception) of a failed background generation
+        self.preload_failure = None
 
-        # Configure the first map to point to the second map
-        self._update_exit_target(first_map, second_map)
+    def start_infinite_mode(self):
+        """Start the infinite mode: generate the first map and preload the second."""
+        self._clean_old_maps()
+        print(f"Infinite run seed: {self.run_seed}")
 
-        self.active_maps = [first_map, second_map]
+        self.active_maps = []
+        self._load_map_now(self.difficulty)
         self.current_level = 1
 
-        return first_map
+        # Generate and parse the second map while the first one is played
+        self._start_preload(self.difficulty)
+
+        return self.active_maps[0]
 
     def advance_to_next_level(self):
         """Progress to the next level in infinite mode and delete the previous one."""
+        # The next map is generated in the background, make sure it is there
+        self.wait_for_preload()
+
         # Delete the oldest map
         if self.active_maps:
             old_map = self.active_maps.pop(0)
-            try:
-                os.remove(old_map)
-            except:
-                print(f"Error: Unable to delete {old_map}")
+            self.preloaded.pop(old_map, None)
+            if self.map_generator.export:
+                try:
+                    os.remove(old_map)
+                except:
+                    print(f"Error: Unable to delete {old_map}")
         # Up the difficulty every 3 levels
         self.current_level += 1
         if self.current_level % 3 == 0:
             self.difficulty = min(10, self.difficulty + 1)
 
-        # Generate a new map
-        new_map = self.map_generator.generate_map(difficulty=self.difficulty)
-
-        # Update the exit target of the last map to point to the new one
-        if self.active_maps:
-            self._update_exit_target(self.active_maps[0], new_map)
-
-        self.active_maps.append(new_map)
+        # Generate the map after this one in the background
+        self._start_preload(self.difficulty)
 
         return self.active_maps[0]
 
-    def _update_exit_target(self, map_path, next_map_path):
-        """Update the exit of the current map to point to the next map."""
+    def take_preloaded(self, map_path):
+        """
+        Get the sprite groups parsed in the background for a map.
+
+        Args:
+            map_path (str): Path of the map file
+
+        Returns:
+            dict: Map objects ready to be installed, None if the map is not part of the run
+        """
+        if map_path not in self.preloaded:
+            self.wait_for_preload()
+        return self.preloaded.pop(map_path, None)
+
+    def wait_for_preload(self):
+        """Block until the next map is ready, generating it here if the worker failed"""
+        if self.preload_thread is not None:
+            self.preload_thread.join()
+            self.preload_thread = None
+
+        if self.preload_failure is not None:
+            difficulty, error = self.preload_failure
+            self.preload_failure = None
+            print(f"Generating the next infinite map again after: {error}")
+            self._load_map_now(difficulty)
+
+    def _generate_map(self, difficulty):
+        """Generate the next map of the run from the run seed"""
+        seed = self.seed_sequence.randrange(2**32)
+        self.level_seeds.append(seed)
+        return self.map_generator.generate_map(difficulty=difficulty, seed=seed)
+
+    def _start_preload(self, difficulty):
+        """Start generating and parsing the next map on a worker thread"""
+        self.preload_thread = threading.Thread(
+            target=self._preload_next_map,
+            args=(difficulty,),
+            name="infinite-preload",
+            daemon=True,
+        )
+        self.preload_thread.start()
+
+    def _preload_next_map(self, difficulty):
+        """Worker: generate the next map and parse it with its assets decoded"""
         try:
-            with open(map_path, "r") as f:
-                map_data = json.load(f)
-
-            if "exits" in map_data and map_data["exits"]:
-                for exit_obj in map_data["exits"]:
-                    exit_obj["next_level"] = next_map_path
-
-            with open(map_path, "w") as f:
-                json.dump(map_data, f, indent=2)
-
+            self._load_map(difficulty)
         except Exception as e:
-            print(f"Error while updating exit: {e}")
+            print(f"Error while preloading the next infinite map: {e}")
+            # The main thread generates the map again when it needs it
+            self.preload_failure = (difficulty, e)
+
+    def _load_map_now(self, difficulty):
+        """Generate and parse a map on the calling thread, retrying with new seeds"""
+        for _ in range(LOAD_ATTEMPTS):
+            try:
+                self._load_map(difficulty)
+                return
+            except Exception as e:
+                print(f"Error while generating an infinite map: {e}")
+        raise RuntimeError(
+            f"no infinite map could be loaded in {LOAD_ATTEMPTS} attempts"
+        )
+
+    def _load_map(self, difficulty):
+        """
+        Generate the next map of the run and parse it into detached sprite groups.
+        A map is only added to the run once its sprites are ready.
+
+        Raises:
+            RuntimeError: If the parser could not load the generated map
+        """
+        new_map = self._generate_map(difficulty)
+        parser = MapParser(self.game_resources, detached=True)
+        map_objects = parser.load_map(new_map["id"], new_map)
+        if not map_objects:
+            raise RuntimeError(f"the parser could not load {new_map['id']}")
+        self.preloaded[new_map["id"]] = map_objects
+        self.active_maps.append(new_map["id"])
 
     def _clean_old_maps(self):
         """Delete all old infinite maps."""
@@ -0,0 +1,124 @@
+import numpy as np
+
+
+class JumpEnvelope:
+    """
+    Region a player can reach with a single jump, solved from the Player.move physics.
+
+    Every frame the player does acc = (±ACC, gravity) + vel * FRIC, vel += acc and
+    pos += vel + 0.5 * acc, a jump sets vel.y to -jump_power and a dash sets
+    vel.x to 75 * ACC. The vertical motion does not depend on the horizontal one,
+    so a single jump arc is simulated and the horizontal travel is simulated for
+    a range of take-off speeds at once.
+    """
+
+    def __init__(
+        self,
+        acc=0.5,
+        fric=-0.12,
+        jump_power=30,
+        gravity=1.0,
+        feet_width=80,
+        jump_boost=1.0,
+        speed_boost=1.0,
+        dash=False,
+        frames=240,
+        speed_steps=64,
+    ):
+        """
+        Solve the envelope.
+
+        Args:
+            acc (float): Horizontal acceleration (GameResources.ACC)
+            fric (float): Friction factor (GameResources.FRIC)
+            jump_power (float): Initial upward speed of a jump (Player.jump_power)
+            gravity (float): Downward acceleration per frame
+            feet_width (float): Width of the player's feet hitbox, the player can take
+                off and land with only part of it over the platform
+            jump_boost (float): Multiplier of jump_power, 1.5 with a JumpBoost
+            speed_boost (float): Multiplier of acc, 2 with a SpeedBoost
+            dash (bool): Dash at take-off
+            frames (int): Number of simulated frames of the jump
+            speed_steps (int): Number of simulated take-off speeds
+        """
+        acc = acc * speed_boost
+        self.feet_width = feet_width
+        # Speed reached when running long enough, where ACC and friction cancel out
+        self.max_speed = acc / -fric
+
+        # Vertical arc, y grows downwards like the screen
+        vel_y = -jump_power * jump_boost
+        y = np.empty(frames)
+        vel_ys = np.empty(frames)
+        for frame in range(frames):
+            acc_y = gravity + vel_y * fric
+            vel_y += acc_y
+            y[frame] = (y[frame - 1] if frame else 0.0) + vel_y + 0.5 * acc_y
+            vel_ys[frame] = vel_y
+        self.apex = -y.min()
+
+        # Horizontal travel while holding the direction, for every take-off speed
+        self.speeds = np.linspace(0.0, self.max_speed, speed_steps)
+        vel_x = self.speeds.copy()
+        if dash:
+            vel_x[:] = 75 * acc
+        x = np.empty((speed_steps, frames))
+        position = np.zeros(speed_steps)
+        for frame in range(frames):
+            acc_x = acc + vel_x * fric
+            vel_x += acc_x
+            position += vel_x + 0.5 * acc_x
+            x[:, frame] = position
+
+        # Landing happens on the way down, the first falling frame at or below a top
+        falling = vel_ys > 0
+        self.drops = np.arange(np.floor(-self.apex) + 1, y[falling].max())
+        fall_y = np.maximum.accumulate(np.where(falling, y, -np.inf))
+        landing_frames = np.searchsorted(fall_y, self.drops)
+        self.reach = x[:, landing_frames] + feet_width
+
+        # Distance needed on the ground to reach every take-off speed
+        run_vel = np.zeros(1)
+        run_up = [0.0]
+        while run_vel[0] < self.speeds[-1] * 0.999 and len(run_up) < frames:
+            acc_x = acc + run_vel * fric
+            run_vel += acc_x
+            run_up.append(run_up[-1] + run_vel[0] + 0.5 * acc_x[0])
+        run_speeds = self.max_speed * (1 - (1 + fric) ** np.arange(len(run_up)))
+        self.run_up = np.interp(self.speeds, run_speeds, run_up)
+
+    def max_gap(self, rise, run_up=None):
+        """
+        Widest horizontal gap that can be jumped across.
+
+        Args:
+            rise (float): Height of the landing top above the take-off top,
+                negative when landing lower
+            run_up (float, optional): Ground available to gain speed before jumping,
+                unlimited if None
+
+        Returns:
+            float: Widest gap in pixels, 0 when the top cannot be reached
+        """
+        if rise > self.apex or -rise > self.drops[-1]:
+            return 0.0
+        speed_index = len(self.speeds) - 1
+        if run_up is not None:
+            speed_index = max(0, np.searchsorted(self.run_up, run_up, "right") - 1)
+        drop_index = int(np.searchsorted(self.drops, -rise))
+        return float(self.reach[speed_index, drop_index])
+
+    def can_reach(self, gap, rise, run_up=None, margin=1.0):
+        """
+        Check if a top gap pixels away and rise pixels higher can be reached.
+
+        Args:
+            gap (float): Horizontal distance between the two platforms
+            rise (float): Height of the landing top above the take-off top
+            run_up (float, optional): Ground available to gain speed
+            margin (float): Fraction of the envelope considered safe
+
+        Returns:
+            bool: True if a jump lands on the top
+        """
+        return rise <= self.apex * margin and gap <= self.max_gap(rise, run_up) * margin
@@ -0,0 +1,385 @@
+import argparse
+import glob
+import hashlib
+import json
+import os
+import pickle
+import time
+
+import pygame
+
+from src.Assets.AssetCache import asset_cache
+
+CACHE_DIR = "map/.cache"
+# Bump when the compiled format changes, older files are then recompiled
+CACHE_VERSION = 1
+
+# Fields a record must have, the parser would fail on the whole map without them
+REQUIRED_FIELDS = {
+    "platforms": ("x", "y", "width", "height"),
+    "enemies": (),
+    "collectibles": ("type", "x", "y"),
+    "checkpoints": ("x", "y", "width", "height", "sprite"),
+    "exits": ("x", "y", "width", "height", "next_level"),
+    "parallax_layers": ("image",),
+}
+COLLECTIBLE_TYPES = ("coin", "jump", "speed")
+MOVEMENT_FIELDS = {
+    "linear": ("points", "speed"),
+    "circular": ("center", "radius", "speed"),
+}
+
+
+class LevelCache:
+    """
+    Compiled levels stored on disk, so a level is not parsed and checked again on every load.
+
+    A compiled level holds the validated map records, with defaults filled in
+    and texture paths resolved, and the list of GIF animations its enemies use.
+    The decoded frames of those animations are stored next to it and handed to
+    the asset cache when it does not have them yet, which skips decoding the
+    GIFs with PIL on a cold start. A compiled level is named after the source
+    path and is recompiled as soon as the content hash of the JSON changes; the
+    file modification time and size are only used to skip hashing.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir (str): Directory of the compiled levels
+        """
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.compiles = 0
+
+    def load(self, map_file):
+        """
+        Get the map data of a level, compiling it when the cache is missing or stale.
+
+        Args:
+            map_file (str): Path to the level JSON file
+
+        Returns:
+            dict: Validated map data, in the same format as the JSON file
+        """
+        stat = os.stat(map_file)
+        cache_path = self.cache_path(map_file)
+        level = self._read(cache_path)
+
+        if level is not None and (level["mtime_ns"], level["size"]) == (
+            stat.st_mtime_ns,
+            stat.st_size,
+        ):
+            self.hits += 1
+        else:
+            with open(map_file, "rb") as file:
+                source = file.read()
+            digest = hashlib.sha1(source).hexdigest()
+            if level is not None and level["hash"] == digest:
+                # Touched but not changed, only refresh the stamp
+                self.hits += 1
+                level["mtime_ns"], level["size"] = stat.st_mtime_ns, stat.st_size
+                self._write(cache_path, level)
+            else:
+                level = self.compile(map_file, source)
+
+        self.install_frames(level, cache_path)
+        return level["map_data"]
+
+    def compile(self, map_file, source=None):
+        """
+        Compile a level and write it to the cache.
+
+        Args:
+            map_file (str): Path to the level JSON file
+            source (bytes, optional): Content of the file, read if None
+
+        Returns:
+            dict: The compiled level
+        """
+        stat = os.stat(map_file)
+        if source is None:
+            with open(map_file, "rb") as file:
+                source = file.read()
+
+        map_data = self.validate(json.loads(source), map_file)
+        animations = self._get_animations(map_data)
+        level = {
+            "version": CACHE_VERSION,
+            "source": map_file,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "hash": hashlib.sha1(source).hexdigest(),
+            "map_data": map_data,
+            "animations": animations,
+        }
+
+        cache_path = self.cache_path(map_file)
+        self._write(cache_path + ".frames", self._encode_frames(animations))
+        self._write(cache_path, level)
+        self.compiles += 1
+        return level
+
+    @staticmethod
+    def validate(map_data, map_file=""):
+        """
+        Check the records of a map and fill in their defaults.
+
+        A record missing a required field is dropped with a message instead of
+        making the whole load fail, and missing texture files are resolved once
+        here instead of on every load.
+
+        Args:
+            map_data (dict): Map loaded from JSON
+            map_file (str): Path of the map, for the messages
+
+        Returns:
+            dict: Validated copy of the map
+        """
+        level = {
+            key: value for key, value in map_data.items() if key not in REQUIRED_FIELDS
+        }
+
+        for kind, required in REQUIRED_FIELDS.items():
+            if kind not in map_data:
+                continue
+            records = []
+            for index, record in enumerate(map_data[kind]):
+                missing = [field for field in required if field not in record]
+                if missing:
+                    print(
+                        f"Error in {map_file}: {kind}[{index}] has no"
+                        f" {', '.join(missing)}, skipped"
+                    )
+                    continue
+                records.append(dict(record))
+            level[kind] = records
+
+        for platform in level.get("platforms", []):
+            if not os.path.isfile(platform.get("texture", "")):
+                platform["texture"] = ""
+            movement = platform.get("movement", {})
+            fields = MOVEMENT_FIELDS.get(movement.get("type"))
+            if platform.get("is_moving", False) and (
+                fields is None or any(field not in movement for field in fields)
+            ):
+                print(
+                    f"Error in {map_file}: platform {platform.get('id', '')}"
+                    " has an invalid movement, made static"
+                )
+                platform["is_moving"] = False
+
+        if "collectibles" in level:
+            collectibles = []
+            for collectible in level["collectibles"]:
+                if collectible["type"] in COLLECTIBLE_TYPES:
+                    collectibles.append(collectible)
+                else:
+                    print(
+                        f"Error in {map_file}: unknown collectible type"
+                        f" {collectible['type']}, skipped"
+                    )
+            level["collectibles"] = collectibles
+
+        if "background" in level and not os.path.isfile(level["background"]):
+            print(f"Background image not found: {level['background']}")
+            del level["background"]
+
+        if "parallax_layers" in level:
+            layers = []
+            for layer in level["parallax_layers"]:
+                if os.path.isfile(layer["image"]):
+                    layers.append(layer)
+                else:
+                    print(f"Parallax layer image not found: {layer['image']}")
+            level["parallax_layers"] = layers
+
+        level.setdefault("spawn_point", {"x": 50, "y": 700})
+        return level
+
+    def install_frames(self, level, cache_path=None):
+        """
+        Hand the decoded animations of a compiled level to the asset cache.
+
+        The frames file is only read when an animation is missing from the
+        asset cache, and an animation is skipped if its GIF changed since the
+        level was compiled.
+
+        Args:
+            level (dict): Compiled level
+            cache_path (str, optional): Path of the compiled level
+        """
+        missing = [
+            (path, size)
+            for path, size in level["animations"]
+            if not asset_cache.has_frames(path, size)
+        ]
+        if not missing:
+            return
+
+        frames_file = self._read(
+            (cache_path or self.cache_path(level["source"])) + ".frames"
+        )
+        if not frames_file:
+            return
+        try:
+            for path, size in missing:
+                animation = frames_file.get((path, size))
+                if animation is None:
+                    continue
+                mtime_ns, frame_size, pixels = animation
+                if os.stat(path).st_mtime_ns != mtime_ns:
+                    continue
+                asset_cache.add_frames(
+                    path,
+                    [
+                        pygame.image.frombytes(data, frame_size, "RGBA").convert_alpha()
+                        for data in pixels
+                    ],
+                    size,
+                )
+        except (OSError, pygame.error) as e:
+            print(f"Error installing cached animations: {e}")
+
+    def cache_path(self, map_file):
+        """
+        Get the path of the compiled version of a level.
+
+        Args:
+            map_file (str): Path to the level JSON file
+
+        Returns:
+            str: Path of the compiled level
+        """
+        name = os.path.normpath(map_file).replace(os.sep, "_")
+        return os.path.join(self.cache_dir, name + ".pickle")
+
+    def clear(self):
+        """Delete every compiled level"""
+        for path in glob.glob(os.path.join(self.cache_dir, "*.pickle*")):
+            try:
+                os.remove(path)
+            except OSError as e:
+                print(f"Error deleting {path}: {e}")
+
+    @staticmethod
+    def _get_animations(map_data):
+        """(path, size) of the GIF animations of the enemies, like Enemy loads them"""
+        animations = []
+        for enemy in map_data.get("enemies", []):
+            path = enemy.get("sprite_sheet", "")
+            size = enemy.get("size", [50, 50])
+            key = (path, (int(size[0]), int(size[1])))
+            if (
+                path.lower().endswith(".gif")
+                and os.path.isfile(path)
+                and key not in animations
+            ):
+                animations.append(key)
+        return animations
+
+    @staticmethod
+    def _encode_frames(animations):
+        """Raw RGBA pixels of the animations, decoded through the asset cache"""
+        frames = {}
+        for path, size in animations:
+            try:
+                animation = asset_cache.get_frames(path, size)
+            except Exception as e:
+                print(f"Error decoding {path}: {e}")
+                continue
+            if animation:
+                frames[(path, size)] = (
+                    os.stat(path).st_mtime_ns,
+                    animation[0].get_size(),
+                    [pygame.image.tobytes(frame, "RGBA") for frame in animation],
+                )
+        return frames
+
+    @staticmethod
+    def _read(path):
+        """Unpickle a cache file, None if it is missing, unreadable or outdated"""
+        try:
+            with open(path, "rb") as file:
+                data = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Error reading compiled level {path}: {e}")
+            return None
+        if (
+            isinstance(data, dict)
+            and data.get("version", CACHE_VERSION) != CACHE_VERSION
+        ):
+            return None
+        return data
+
+    def _write(self, path, data):
+        """Pickle data to a cache file, replacing it atomically"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as file:
+                pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"Error writing compiled level {path}: {e}")
+
+
+# Shared instance used by the map parser
+level_cache = LevelCache()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compile levels into the level cache and report their load times"
+    )
+    parser.add_argument(
+        "levels", nargs="*", help="level JSON files (default: map/levels/*.json)"
+    )
+    parser.add_argument(
+        "--clear", action="store_true", help="delete the compiled levels first"
+    )
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    # Imported here so the SDL drivers are selected before pygame starts
+    from src.constant import GameResources
+    from src.Map.parser import MapParser
+
+    game_resources = GameResources()
+    if args.clear:
+        level_cache.clear()
+    levels = args.levels or sorted(glob.glob("map/levels/*.json"))
+
+    def timed_load(map_file, from_json):
+        """Cold load of a level in milliseconds, with an empty asset cache"""
+        asset_cache.clear()
+        start = time.perf_counter()
+        map_data = None
+        if from_json:
+            # How levels were loaded before the cache
+            with open(map_file, "r") as file:
+                map_data = json.load(file)
+        MapParser(game_resources, detached=True).load_map(map_file, map_data)
+        return (time.perf_counter() - start) * 1000
+
+    print(
+        f"{'level':>24} {'compile ms':>11} {'JSON load ms':>13} {'compiled load ms':>17}"
+    )
+    for map_file in levels:
+        start = time.perf_counter()
+        level_cache.compile(map_file)
+        compile_ms = (time.perf_counter() - start) * 1000
+
+        before = timed_load(map_file, True)
+        after = timed_load(map_file, False)
+        print(f"{map_file:>24} {compile_ms:>11.1f} {before:>13.1f} {after:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import pygame
+
+
+class LevelSnapshot:
+    """
+    Mutable state of a level, captured in memory when a checkpoint is activated.
+
+    Every sprite of the level keeps its attributes (position, rect, health,
+    alive and collected flags, platform angle and direction, checkpoint
+    activation...) and every sprite group keeps its members, so enemies killed
+    and coins collected after the checkpoint come back on restore. Restoring
+    puts the saved values back on the same sprites: nothing is read from disk
+    and no sprite or texture is created.
+    """
+
+    def __init__(
+        self, map_name, player, all_sprites, checkpoints, collectibles, background
+    ):
+        """
+        Capture the state of the level.
+
+        Args:
+            map_name (str): Map file of the level
+            player (Player): Player of the level
+            all_sprites (pygame.sprite.Group): Every sprite of the level
+            checkpoints (pygame.sprite.Group): Checkpoints of the level
+            collectibles (pygame.sprite.Group): Coins and boosts of the level
+            background (ParallaxBackground): Background of the level
+        """
+        self.map_name = map_name
+        self.player = player
+        self.all_sprites = all_sprites
+        self.checkpoints = checkpoints
+        self.collectibles = collectibles
+        self.background = background
+        self.player_coins = player.coins
+        self.player_projectiles = player.projectiles
+
+        sprites = set(all_sprites)
+        sprites.update(checkpoints or ())
+        sprites.update(collectibles or ())
+
+        # Members of every group of the level, in order, so killed sprites rejoin them
+        groups = set()
+        for sprite in sprites:
+            groups.update(sprite.groups())
+        self.groups = [(group, group.sprites()) for group in groups]
+
+        # The player is respawned, not restored
+        sprites.discard(player)
+        self.states = [
+            (sprite, self._copy_state(sprite.__dict__)) for sprite in sprites
+        ]
+
+    def restore(self, checkpoint_pos=None):
+        """
+        Put the level back in the captured state and respawn the player.
+
+        Args:
+            checkpoint_pos (tuple, optional): (x, y) where the player respawns
+        """
+        for sprite, state in self.states:
+            sprite.__dict__.update(self._copy_state(state))
+
+        for group, members in self.groups:
+            group.empty()
+            group.add(members)
+
+        game_resources = self.player.game_resources
+        game_resources.projectile_pool.clear()
+        if game_resources.platform_index is not None:
+            for platform in game_resources.platforms:
+                if platform.is_moving:
+                    game_resources.platform_index.update(platform)
+        if game_resources.sprite_culler is not None:
+            game_resources.sprite_culler.sync()
+
+        # Same stats as a player reloaded with the level, with the coins and
+        # fireballs collected before the checkpoint
+        player = self.player
+        player.clear_boosts()
+        player.lives = player.start_lives
+        player.coins = self.player_coins
+        player.projectiles = self.player_projectiles
+        player.floating_texts = []
+        player.dashing = False
+        if checkpoint_pos:
+            player.respawn_at_checkpoint(checkpoint_pos[0], checkpoint_pos[1])
+
+    @staticmethod
+    def _copy_state(attributes):
+        """Copy the attributes of a sprite, except its groups, with its own rects and vectors"""
+        return {
+            name: (
+                value.copy()
+                if isinstance(value, (pygame.Rect, pygame.math.Vector2))
+                else value
+            )
+            for name, value in attributes.items()
+            if not name.startswith("_Sprite__")
+        }
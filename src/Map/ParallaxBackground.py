@@ -0,0 +1,164 @@
+import pygame
+
+
+class ParallaxLayer:
+    """One background image scrolling at its own fraction of the camera speed"""
+
+    def __init__(self, image, factor=0.3, scale=1.5):
+        """
+        Initialize a parallax layer.
+
+        Args:
+            image (pygame.Surface): Source image of the layer
+            factor (float): Fraction of the camera movement applied to the layer
+            scale (float): Size of one tile relative to the screen
+        """
+        self.image = image
+        self.factor = factor
+        self.scale = scale
+        self.surface = None
+        self.size = None
+
+    def get_surface(self, WIDTH, HEIGHT):
+        """
+        Get the layer tile scaled for a resolution, scaling only when it changes.
+
+        Args:
+            WIDTH (int): Screen width
+            HEIGHT (int): Screen height
+
+        Returns:
+            pygame.Surface: The scaled tile in the display pixel format
+        """
+        size = (int(WIDTH * self.scale), int(HEIGHT * self.scale))
+        if self.size != size:
+            tile = self.image
+            if tile.get_size() != size:
+                tile = pygame.transform.scale(tile, size)
+            if pygame.display.get_surface() is not None:
+                tile = tile.convert() if self.is_opaque(tile) else tile.convert_alpha()
+            self.surface = tile
+            self.size = size
+        return self.surface
+
+    @staticmethod
+    def is_opaque(image):
+        """Check if an image has no transparent pixel"""
+        if not image.get_flags() & pygame.SRCALPHA:
+            return True
+        width, height = image.get_size()
+        return pygame.mask.from_surface(image, 254).count() == width * height
+
+    def get_tiles(self, camera, WIDTH, HEIGHT):
+        """
+        Get the tile positions covering the screen for the camera position.
+
+        Args:
+            camera (Camera): Game camera
+            WIDTH (int): Screen width
+            HEIGHT (int): Screen height
+
+        Returns:
+            list: (tile, position) pairs of the visible tiles
+        """
+        tile = self.get_surface(WIDTH, HEIGHT)
+        tile_width, tile_height = self.size
+
+        start_x = (camera.camera.x * self.factor) % tile_width
+        start_y = (camera.camera.y * self.factor) % tile_height
+        if start_x > 0:
+            start_x -= tile_width
+        if start_y > 0:
+            start_y -= tile_height
+
+        tiles = []
+        y = start_y
+        while y < HEIGHT:
+            x = start_x
+            while x < WIDTH:
+                tiles.append((tile, (x, y)))
+                x += tile_width
+            y += tile_height
+        return tiles
+
+
+class ParallaxBackground:
+    """
+    Tiled background made of parallax layers.
+
+    Each layer is scaled once per resolution and only the tiles overlapping
+    the screen are drawn, back to front.
+    """
+
+    def __init__(self, image=None, factor=0.3, scale=1.5):
+        """
+        Initialize the background.
+
+        Args:
+            image (pygame.Surface, optional): Image of the base layer
+            factor (float): Parallax factor of the base layer
+            scale (float): Tile size of the base layer relative to the screen
+        """
+        self.layers = []
+        if image is not None:
+            self.add_layer(image, factor, scale)
+
+    # (image, background) built by wrap() for the last plain image
+    _wrapped = None
+
+    @classmethod
+    def wrap(cls, image):
+        """
+        Get the background drawing a plain image, built once for the same image.
+
+        Args:
+            image (pygame.Surface or ParallaxBackground): Background of the level
+
+        Returns:
+            ParallaxBackground: The image itself if it already is a background
+        """
+        if isinstance(image, cls):
+            return image
+        if cls._wrapped is None or cls._wrapped[0] is not image:
+            cls._wrapped = (image, cls(image))
+        return cls._wrapped[1]
+
+    def add_layer(self, image, factor, scale=1.5):
+        """
+        Add a layer in front of the existing ones.
+
+        Args:
+            image (pygame.Surface): Source image of the layer
+            factor (float): Fraction of the camera movement applied to the layer
+            scale (float): Size of one tile relative to the screen
+        """
+        self.layers.append(ParallaxLayer(image, factor, scale))
+
+    def get_blits(self, camera, WIDTH, HEIGHT):
+        """
+        Get the visible tiles of every layer, back to front.
+
+        Args:
+            camera (Camera): Game camera
+            WIDTH (int): Screen width
+            HEIGHT (int): Screen height
+
+        Returns:
+            list: (tile, position) pairs
+        """
+        tiles = []
+        for layer in self.layers:
+            tiles.extend(layer.get_tiles(camera, WIDTH, HEIGHT))
+        return tiles
+
+    def draw(self, surface, camera, WIDTH, HEIGHT):
+        """
+        Draw every layer for the current camera position.
+
+        Args:
+            surface (pygame.Surface): Surface to draw on
+            camera (Camera): Game camera
+            WIDTH (int): Screen width
+            HEIGHT (int): Screen height
+        """
+        surface.blits(self.get_blits(camera, WIDTH, HEIGHT), doreturn=False)
@@ -0,0 +1,151 @@
+class SpatialGrid:
+    """
+    Uniform grid broadphase index for sprites.
+
+    Each sprite is registered in every cell its rect overlaps, so a query only
+    has to look at the handful of cells around the requested area instead of
+    every sprite of the level. Query results keep the insertion order of the
+    sprites so collision resolution stays identical to iterating the group.
+    """
+
+    def __init__(self, cell_size=256):
+        """
+        Initialize an empty grid.
+
+        Args:
+            cell_size (int): Width and height of a grid cell, in pixels
+        """
+        self.cell_size = cell_size
+        self._cells = {}
+        self._sprite_cells = {}
+        self._order = {}
+        self._counter = 0
+
+    def __len__(self):
+        return len(self._sprite_cells)
+
+    def __contains__(self, sprite):
+        return sprite in self._sprite_cells
+
+    def __iter__(self):
+        return iter(list(self._sprite_cells))
+
+    def _cell_range(self, rect):
+        """Get the (min_x, min_y, max_x, max_y) cell coordinates covered by a rect"""
+        size = self.cell_size
+        return (
+            rect.left // size,
+            rect.top // size,
+            (rect.right - 1) // size if rect.width > 0 else rect.left // size,
+            (rect.bottom - 1) // size if rect.height > 0 else rect.top // size,
+        )
+
+    def _add_to_cells(self, sprite, cell_range):
+        min_x, min_y, max_x, max_y = cell_range
+        for cx in range(min_x, max_x + 1):
+            for cy in range(min_y, max_y + 1):
+                self._cells.setdefault((cx, cy), set()).add(sprite)
+
+    def _remove_from_cells(self, sprite, cell_range):
+        min_x, min_y, max_x, max_y = cell_range
+        for cx in range(min_x, max_x + 1):
+            for cy in range(min_y, max_y + 1):
+                cell = self._cells.get((cx, cy))
+                if cell is not None:
+                    cell.discard(sprite)
+                    if not cell:
+                        del self._cells[(cx, cy)]
+
+    def insert(self, sprite):
+        """
+        Register a sprite at its current rect position.
+
+        Args:
+            sprite: Sprite with a rect attribute
+        """
+        if sprite in self._sprite_cells:
+            self.update(sprite)
+            return
+        cell_range = self._cell_range(sprite.rect)
+        self._sprite_cells[sprite] = cell_range
+        self._order[sprite] = self._counter
+        self._counter += 1
+        self._add_to_cells(sprite, cell_range)
+
+    def remove(self, sprite):
+        """
+        Unregister a sprite.
+
+        Args:
+            sprite: Sprite previously inserted
+        """
+        cell_range = self._sprite_cells.pop(sprite, None)
+        if cell_range is not None:
+            self._remove_from_cells(sprite, cell_range)
+            del self._order[sprite]
+
+    def update(self, sprite):
+        """
+        Move a sprite to the cells matching its current rect.
+        Cheap when the sprite stays within the same cells.
+
+        Args:
+            sprite: Sprite previously inserted
+        """
+        old_range = self._sprite_cells.get(sprite)
+        if old_range is None:
+            self.insert(sprite)
+            return
+        new_range = self._cell_range(sprite.rect)
+        if new_range != old_range:
+            self._remove_from_cells(sprite, old_range)
+            self._add_to_cells(sprite, new_range)
+            self._sprite_cells[sprite] = new_range
+
+    def query(self, rect):
+        """
+        Get the sprites whose cells overlap an area.
+        This is a broadphase: callers still have to test the exact rects.
+
+        Args:
+            rect (pygame.Rect): Area to search
+
+        Returns:
+            list: Candidate sprites, in insertion order
+        """
+        min_x, min_y, max_x, max_y = self._cell_range(rect)
+        cells = self._cells
+        if min_x == max_x and min_y == max_y:
+            found = cells.get((min_x, min_y), ())
+        else:
+            found = set()
+            for cx in range(min_x, max_x + 1):
+                for cy in range(min_y, max_y + 1):
+                    cell = cells.get((cx, cy))
+                    if cell:
+                        found.update(cell)
+        return sorted(found, key=self._order.__getitem__)
+
+    def clear(self):
+        """Remove every sprite from the grid"""
+        self._cells.clear()
+        self._sprite_cells.clear()
+        self._order.clear()
+        self._counter = 0
+
+    @classmethod
+    def from_sprites(cls, sprites, cell_size=256):
+        """
+        Build a grid containing the given sprites.
+
+        Args:
+            sprites: Iterable of sprites with a rect attribute
+            cell_size (int): Width and height of a grid cell, in pixels
+
+        Returns:
+            SpatialGrid: The populated grid
+        """
+        grid = cls(cell_size)
+        for sprite in sprites:
+            grid.insert(sprite)
+        return grid
@@ -3,6 +3,9 @@ import time
 import sqlite3
 from datetime import timedelta
 
+from src.Database.Connection import get_connection
+from src.Database.WriteBehind import write_behind
+
 
 class SpeedrunTimer:
     def __init__(self, level_id, db_path="game.db"):
@@ -11,6 +14,7 @@ class SpeedrunTimer:
         self.start_time = None
         self.current_time = 0
         self.is_running = False
+        self.paused_at = None
         self.best_time = self._get_best_time()
         self.color = (0, 255, 0)  # Green by default
         self.font = pygame.font.Font(None, 36)
@@ -22,6 +26,17 @@ class SpeedrunTimer:
         self.start_time = time.time()
         self.is_running = True
 
+    def pause(self):
+        """Stop counting time, like while a cutscene is shown"""
+        if self.is_running and self.paused_at is None:
+            self.paused_at = time.time()
+
+    def resume(self):
+        """Count time again, without the time spent paused"""
+        if self.paused_at is not None:
+            self.start_time += time.time() - self.paused_at
+            self.paused_at = None
+
     def stop(self):
         """Stop the timer and return the final time"""
         if self.is_running:
@@ -43,47 +58,27 @@ class SpeedrunTimer:
     def save_time(self, collected_items=0, total_items=0):
         """Save the current time in the database"""
         if not self.is_running and self.current_time > 0:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # Create the table if it doesn't exist
-            cursor.execute(
-                """
-            CREATE TABLE IF NOT EXISTS speedrun (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                level_id TEXT NOT NULL,
-                time REAL NOT NULL,
-                collected_items INTEGER DEFAULT 0,
-                total_items INTEGER DEFAULT 0,
-                date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            """
-            )
-
-            # Insert the new time
-            cursor.execute(
+            # Insert the new time in the background
+            write_behind.submit(
                 "INSERT INTO speedrun (level_id, time, collected_items, total_items) VALUES (?, ?, ?, ?)",
                 (self.level_id, self.current_time, collected_items, total_items),
+                self.db_path,
+                "speedrun",
             )
 
-            conn.commit()
-            conn.close()
-
-            # Update the best time
-            self.best_time = self._get_best_time()
+            # Update the best time without reading the database back
+            if self.best_time is None or self.current_time < self.best_time:
+                self.best_time = self.current_time
 
     def _get_best_time(self):
         """Get the best time for this level from the database"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute(
+            write_behind.flush()
+            cursor = get_connection(self.db_path).execute(
                 "SELECT MIN(time) FROM speedrun WHERE level_id = ?", (self.level_id,)
             )
 
             best_time = cursor.fetchone()[0]
-            conn.close()
 
             return best_time
         except (sqlite3.Error, TypeError):
@@ -99,11 +94,19 @@ class SpeedrunTimer:
         milliseconds = td.microseconds // 1000
         return f"{minutes:02}:{seconds:02}.{milliseconds:03}"
 
+    def is_visible(self):
+        """Check if the timer should be displayed"""
+        return self.level_id != "NEXT_INFINITE_LEVEL"  # No timer for infinite mode
+
+    def render(self, formatted_time=None):
+        """Render the timer text to its own surface"""
+        if formatted_time is None:
+            formatted_time = self.format_time(self.current_time)
+        return self.font.render(formatted_time, True, self.color)
+
     def draw(self, surface):
         """Display the timer on the screen"""
-        if self.level_id == "NEXT_INFINITE_LEVEL":
-            return  # No timer for infinite mode
+        if not self.is_visible():
+            return
 
-        formatted_time = self.format_time(self.current_time)
-        text = self.font.render(formatted_time, True, self.color)
-        surface.blit(text, (20, surface.get_height() - 50))
+        surface.blit(self.render(), (20, surface.get_height() - 50))
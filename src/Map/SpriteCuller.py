@@ -0,0 +1,99 @@
+import pygame
+
+from src.Entity.Enemy import Enemy
+from src.Entity.Player import Player
+from src.Map.SpatialGrid import SpatialGrid
+
+
+class SpriteCuller:
+    """
+    Find the sprites overlapping the camera view without scanning the level.
+
+    All the sprites of the level are kept in a spatial grid. Sprites that can
+    move (player, enemies, moving platforms) are re-indexed every frame, the
+    static ones only when the group changes size (a coin is collected, an
+    enemy dies...).
+    """
+
+    def __init__(self, sprites, margin=64, cell_size=256):
+        """
+        Initialize the culler.
+
+        Args:
+            sprites (pygame.sprite.Group): Sprites to draw
+            margin (int): Extra pixels around the view kept visible
+            cell_size (int): Width and height of a grid cell, in pixels
+        """
+        self.sprites = sprites
+        self.margin = margin
+        self.grid = SpatialGrid(cell_size)
+        self.dynamic = []
+        self.known_count = 0
+        self.drawn = 0
+        self.culled = 0
+        self.sync()
+
+    @staticmethod
+    def is_dynamic(sprite):
+        """
+        Check if a sprite can move away from where it was indexed.
+        The few pixels the boosts bob up and down are covered by the margin.
+        """
+        return isinstance(sprite, (Player, Enemy)) or getattr(
+            sprite, "is_moving", False
+        )
+
+    def sync(self):
+        """Index the sprites added to the group and drop the removed ones"""
+        for sprite in self.grid:
+            if not self.sprites.has(sprite):
+                self.grid.remove(sprite)
+        for sprite in self.sprites:
+            if sprite not in self.grid:
+                self.grid.insert(sprite)
+        self.dynamic = [sprite for sprite in self.sprites if self.is_dynamic(sprite)]
+        self.known_count = len(self.sprites)
+
+    def get_view_rect(self, camera, WIDTH, HEIGHT):
+        """
+        Get the world area seen by the camera, margin included.
+
+        Args:
+            camera (Camera): Game camera
+            WIDTH (int): Screen width
+            HEIGHT (int): Screen height
+
+        Returns:
+            pygame.Rect: Visible area in world coordinates
+        """
+        return pygame.Rect(
+            -camera.camera.x - self.margin,
+            -camera.camera.y - self.margin,
+            WIDTH + 2 * self.margin,
+            HEIGHT + 2 * self.margin,
+        )
+
+    def get_visible(self, camera, WIDTH, HEIGHT):
+        """
+        Get the sprites overlapping the camera view, in group order.
+
+        Args:
+            camera (Camera): Game camera
+            WIDTH (int): Screen width
+            HEIGHT (int): Screen height
+
+        Returns:
+            list: Visible sprites
+        """
+        if len(self.sprites) != self.known_count:
+            self.sync()
+        for sprite in self.dynamic:
+            self.grid.update(sprite)
+
+        view = self.get_view_rect(camera, WIDTH, HEIGHT)
+        visible = [
+            sprite for sprite in self.grid.query(view) if view.colliderect(sprite.rect)
+        ]
+        self.drawn = len(visible)
+        self.culled = self.known_count - self.drawn
+        return visible
@@ -1,136 +1,203 @@
+import numpy as np
 import pygame
-from PIL import Image, ImageSequence
+
+from src import InputState
+from src.Assets.AssetCache import asset_cache
+from src.Assets.SoundBank import sound_bank
+
+# Milliseconds each line stays on screen before the next one
+LINE_DURATION = 2000
+# The boss animation plays before its line is written
+BOSS_FRAME_COUNT = 46
+BOSS_FRAME_DURATION = 100
 
 
 class Cinematic:
-    """Class to handle cinematics in the game"""
+    """
+    Class to handle cinematics in the game
+
+    A cinematic is a cutscene shown by the main loop: play_cinematic() hands
+    it to the game resources and the handler calls update() every frame, which
+    draws the lines and characters due at the current time instead of waiting
+    between them.
+    """
 
     # Class variable to track if cinematics have been played (shared across all instances)
     played_cinematics = {"Level 1": False, "Level 2": False, "Level 3": False}
 
+    LORE_TEXT = {
+        "Level 1": [
+            "Once upon a time in a land far away...",
+            "A brave hero named Sanic...",
+            "And a beautiful princess named Zeldo...",
+            "Has been captured by the evil boss...",
+            "Wheatly !!!",
+            "Sanic must rescue Zeldo...",
+        ],
+        "Level 2": [
+            "When Sanic arrives at Zeldo's position...",
+            "He realizes that it's a trap...",
+            "Zeldo is actually a fake...",
+            "And the real Zeldo is in another castle...",
+        ],
+        "Level 3": [
+            "Sanic must face the evil boss Wheatley...",
+            "To rescue the real princess Zeldo...",
+            "Will Sanic succeed?",
+        ],
+    }
+
+    # Gradient backgrounds by (size, start color, end color)
+    _gradients = {}
+
     def __init__(self):
         """Initialize cinematic resources"""
         # Load resources
-        self.player_image = pygame.image.load(
-            "assets/player/Sanic Base.png"
-        ).convert_alpha()
-        self.princess_image = pygame.image.load(
-            "assets/map/exit/Zeldo.png"
-        ).convert_alpha()
-
-        # Prepare the boss GIF
-        self.boss_gif = Image.open("assets/map/enemy/boss.gif")
-        self.boss_frames = [
-            frame.copy() for frame in ImageSequence.Iterator(self.boss_gif)
-        ]
-        self.boss_frame_index = 0
-
-        self.player_image = pygame.transform.scale(self.player_image, (200, 200))
-        self.princess_image = pygame.transform.scale(self.princess_image, (200, 200))
-
+        self.player_image = asset_cache.get_image(
+            "assets/player/Sanic Base.png", (200, 200)
+        )
+        self.princess_image = asset_cache.get_image(
+            "assets/map/exit/Zeldo.png", (200, 200)
+        )
+
+        # The boss GIF is decoded when a cinematic shows it
+        self.boss_frames = ()
+
+        self.level_name = None
+        self.lines = []
+        self.start_ticks = None
+        self.line_index = -1
+        self.finished = True
+
+    @classmethod
     def _create_gradient_background(
-        self, screen, start_color=(0, 0, 128), end_color=(0, 0, 0)
+        cls, size, start_color=(0, 0, 128), end_color=(0, 0, 0)
     ):
-        """Create a gradient background for the cinematic"""
-        width, height = screen.get_size()
-        background = pygame.Surface((width, height))
-
-        for y in range(height):
-            ratio = y / height
-
-            r = int(start_color[0] * (1 - ratio) + end_color[0] * ratio)
-            g = int(start_color[1] * (1 - ratio) + end_color[1] * ratio)
-            b = int(start_color[2] * (1 - ratio) + end_color[2] * ratio)
-
-            pygame.draw.line(background, (r, g, b), (0, y), (width, y))
-
+        """Create a gradient background for the cinematic, once per size"""
+        key = (size, start_color, end_color)
+        background = cls._gradients.get(key)
+        if background is None:
+            width, height = size
+            ratio = (np.arange(height) / height)[:, np.newaxis]
+            rows = (
+                np.array(start_color) * (1 - ratio) + np.array(end_color) * ratio
+            ).astype(np.uint8)
+
+            background = pygame.Surface(size)
+            pygame.surfarray.blit_array(
+                background, np.broadcast_to(rows, (width, height, 3))
+            )
+            cls._gradients[key] = background
         return background
 
-    def _display_cinematic_text(self, screen, lore_text, level_name):
-        """Helper function to display cinematic text with animations"""
-        font = pygame.font.Font(None, 36)
-        pygame.mixer.init()
-        cinematic_voice = pygame.mixer.Sound("assets/sound/cinematic_voice.mp3")
-
-        gradient_bg = self._create_gradient_background(screen)
-        screen.blit(gradient_bg, (0, 0))
+    def play_cinematic(self, game_resources, level_name):
+        """
+        Start the cinematic of a level, shown by the handler's cutscene state.
 
-        for i, line in enumerate(lore_text):
-            for event in pygame.event.get():
-                if event.type == pygame.KEYDOWN:
-                    return False  # Skip the cinematic if any key is pressed
+        Args:
+            game_resources (GameResources): Game resources
+            level_name (str): Name of the level
 
-            # Play the voice audio
-            cinematic_voice.play()
+        Returns:
+            bool: True if a cinematic was started
+        """
+        # Check if this cinematic has already been played
+        if Cinematic.played_cinematics.get(level_name, False):
+            return False
+        # An exit video is still to be shown, the cinematic plays with the next load
+        if game_resources.cutscene is not None:
+            return False
+        lore_text = self.LORE_TEXT.get(level_name)
+        if not lore_text:
+            return False
 
-            # Display character images based on text content
-            if "Sanic" in line:
-                screen.blit(self.player_image, (100, 400))
-            if "Zeldo" in line:
-                screen.blit(self.princess_image, (700, 400))
-            if "Wheatly" in line or "Wheatley" in line:
-                for _ in range(46):
-                    for event in pygame.event.get():
-                        if event.type == pygame.KEYDOWN:
-                            return False  # Skip the cinematic if any key is pressed
-
-                    boss_frame = self.boss_frames[self.boss_frame_index]
-                    boss_frame = boss_frame.convert("RGBA")
-                    boss_frame = pygame.image.fromstring(
-                        boss_frame.tobytes(), boss_frame.size, boss_frame.mode
-                    )
-                    boss_frame = pygame.transform.scale(boss_frame, (200, 200))
-                    screen.blit(boss_frame, (400, 400))
-                    pygame.display.flip()
-                    pygame.time.wait(100)
-                    self.boss_frame_index = (self.boss_frame_index + 1) % len(
-                        self.boss_frames
-                    )
-
-            text_surface = font.render(line, True, (255, 255, 255))
-            screen.blit(text_surface, (50, 50 + i * 40))
-            pygame.display.flip()
-            pygame.time.wait(2000)
-            cinematic_voice.stop()
-
-        # Mark this cinematic as played
-        Cinematic.played_cinematics[level_name] = True
+        font = pygame.font.Font(None, 36)
+        self.level_name = level_name
+        self.lines = []
+        for line in lore_text:
+            boss = "Wheatly" in line or "Wheatley" in line
+            if boss and not self.boss_frames:
+                self.boss_frames = asset_cache.get_frames(
+                    "assets/map/enemy/boss.gif", (200, 200)
+                )
+            boss_duration = (
+                BOSS_FRAME_COUNT * BOSS_FRAME_DURATION
+                if self.boss_frames and boss
+                else 0
+            )
+            self.lines.append(
+                {
+                    "text": font.render(line, True, (255, 255, 255)),
+                    "sanic": "Sanic" in line,
+                    "zeldo": "Zeldo" in line,
+                    "boss_duration": boss_duration,
+                    "duration": boss_duration + LINE_DURATION,
+                }
+            )
+
+        self.start_ticks = None
+        self.line_index = -1
+        self.finished = False
+        game_resources.cutscene = self
         return True
 
-    def play_cinematic(self, game_resources, level_name):
-        """Play the cinematic for levels"""
-        # Check if this cinematic has already been played
-        if Cinematic.played_cinematics.get(level_name, False):
-            return
-
-        screen = game_resources.displaysurface
-
-        if level_name == "Level 1":
-            lore_text = [
-                "Once upon a time in a land far away...",
-                "A brave hero named Sanic...",
-                "And a beautiful princess named Zeldo...",
-                "Has been captured by the evil boss...",
-                "Wheatly !!!",
-                "Sanic must rescue Zeldo...",
-            ]
-            self._display_cinematic_text(screen, lore_text, level_name)
-
-        elif level_name == "Level 2":
-            lore_text = [
-                "When Sanic arrives at Zeldo's position...",
-                "He realizes that it's a trap...",
-                "Zeldo is actually a fake...",
-                "And the real Zeldo is in another castle...",
-            ]
-            self._display_cinematic_text(screen, lore_text, level_name)
-
-        elif level_name == "Level 3":
-            lore_text = [
-                "Sanic must face the evil boss Wheatley...",
-                "To rescue the real princess Zeldo...",
-                "Will Sanic succeed?",
-            ]
-            self._display_cinematic_text(screen, lore_text, level_name)
-        else:
-            pass
+    def update(self, surface):
+        """
+        Draw the cinematic as it is at the current time.
+
+        Args:
+            surface (pygame.Surface): Surface the cinematic is drawn on
+
+        Returns:
+            bool: True once the cinematic is over
+        """
+        if self.finished:
+            return True
+        if self.start_ticks is None:
+            self.start_ticks = InputState.get_ticks()
+        elapsed = InputState.get_ticks() - self.start_ticks
+
+        # Find the line being shown and the time spent on it
+        index = 0
+        while index < len(self.lines) and elapsed >= self.lines[index]["duration"]:
+            elapsed -= self.lines[index]["duration"]
+            index += 1
+        if index >= len(self.lines):
+            # Mark this cinematic as played
+            Cinematic.played_cinematics[self.level_name] = True
+            self.close()
+            return True
+
+        if index != self.line_index:
+            # Each line is read by the voice
+            sound_bank.stop("cinematic_voice")
+            sound_bank.play("cinematic_voice")
+            self.line_index = index
+
+        surface.blit(self._create_gradient_background(surface.get_size()), (0, 0))
+        for i, line in enumerate(self.lines[: index + 1]):
+            # Display character images based on text content
+            if line["sanic"]:
+                surface.blit(self.player_image, (100, 400))
+            if line["zeldo"]:
+                surface.blit(self.princess_image, (700, 400))
+            if line["boss_duration"]:
+                # The animation stops on its last frame once the line is written
+                frame = BOSS_FRAME_COUNT - 1
+                if i == index and elapsed < line["boss_duration"]:
+                    frame = int(elapsed) // BOSS_FRAME_DURATION
+                surface.blit(
+                    self.boss_frames[frame % len(self.boss_frames)], (400, 400)
+                )
+            if i < index or elapsed >= line["boss_duration"]:
+                surface.blit(line["text"], (50, 50 + i * 40))
+        return False
+
+    def skip(self):
+        """End the cinematic at the next update, it plays again with the level"""
+        self.finished = True
+
+    def close(self):
+        """Stop the voice"""
+        self.finished = True
+        sound_bank.stop("cinematic_voice")
@@ -1,7 +1,5 @@
-import json
 import pygame
 import os
-from PIL import Image, ImageSequence
 from src.Entity.Platform import Platform
 from src.Entity.Player import Player
 from src.Entity.Enemy import Enemy
@@ -11,40 +9,60 @@ from src.Entity.Coin import Coin
 from src.Entity.JumpBoost import JumpBoost
 from src.Entity.SpeedBoost import SpeedBoost
 from src.Map.cinematic import Cinematic
+from src.Map.SpatialGrid import SpatialGrid
+from src.Map.LevelCache import level_cache
+from src.Assets.AssetCache import asset_cache
+from src.FrameProfiler import frame_profiler
 
 
 class MapParser:
-    def __init__(self, game_resources):
+    def __init__(self, game_resources, detached=False):
+        """
+        Initialize the map parser.
+
+        Args:
+            game_resources: GameResources object
+            detached (bool): Build the map into new sprite groups instead of the
+                shared ones of game_resources, to load a level in the background
+        """
         self.game_resources = game_resources
-        self.all_sprites = self.game_resources.all_sprites
-        self.platforms = self.game_resources.platforms
-        self.exits = self.game_resources.exits
+        self.detached = detached
+        if detached:
+            self.all_sprites = pygame.sprite.Group()
+            self.platforms = pygame.sprite.Group()
+            self.exits = pygame.sprite.Group()
+        else:
+            self.all_sprites = self.game_resources.all_sprites
+            self.platforms = self.game_resources.platforms
+            self.exits = self.game_resources.exits
+        self.platform_index = None
         self.enemies = pygame.sprite.Group()
         self.collectibles = pygame.sprite.Group()
         self.checkpoints = pygame.sprite.Group()
         self.player = None
 
-        self.boss_gif = Image.open("assets/map/enemy/boss.gif")
-        self.boss_frames = [
-            frame.copy() for frame in ImageSequence.Iterator(self.boss_gif)
-        ]
-        self.boss_frame_index = 0
-        self.player_image = pygame.image.load(
-            "assets/player/Sanic Base.png"
-        ).convert_alpha()
-        self.princess_image = pygame.image.load(
-            "assets/map/exit/Zeldo.png"
-        ).convert_alpha()
         self.cinematic = Cinematic()
 
-    def load_map(self, map_file):
-        """Load and parse a map from JSON file"""
+    @frame_profiler.timed("load_map")
+    def load_map(self, map_file, map_data=None):
+        """
+        Load and parse a map from JSON file
+
+        Args:
+            map_file (str): Path of the map, also the key of its checkpoints
+            map_data (dict, optional): Map already in memory, skips reading map_file
+                and the level cache
+
+        Returns:
+            dict: Game objects of the map, None on error
+        """
         try:
-            with open(map_file, "r") as file:
-                map_data = json.load(file)
+            if map_data is None:
+                # Validated records from the compiled level, recompiled if the JSON changed
+                map_data = level_cache.load(map_file)
 
-            # If it's level 1, play the cinematic
-            if map_data.get("name"):
+            # Start the cinematic of the level, the handler shows it once loaded
+            if map_data.get("name") and not self.detached:
                 self.cinematic.play_cinematic(self.game_resources, map_data.get("name"))
 
             # Create all game objects from map data
@@ -64,6 +82,8 @@ class MapParser:
                 "checkpoints": self.checkpoints,
                 "exits": self.exits,
                 "background": getattr(self, "background", None),
+                "parallax_layers": self.parallax_layers,
+                "platform_index": self.platform_index,
             }
         except Exception as e:
             print(f"Error loading map: {e}")
@@ -123,6 +143,11 @@ class MapParser:
                 self.platforms.add(platform)
                 self.all_sprites.add(platform)
 
+        # Index the platforms once so collisions only test nearby ones
+        self.platform_index = SpatialGrid.from_sprites(self.platforms)
+        if not self.detached:
+            self.game_resources.platform_index = self.platform_index
+
         # Create collectibles
         if "collectibles" in map_data:
             for collectible_data in map_data["collectibles"]:
@@ -159,14 +184,28 @@ class MapParser:
             map_height = map_data.get("height", self.game_resources.HEIGHT)
 
             if os.path.isfile(map_data["background"]):
-                background = pygame.image.load(map_data["background"]).convert_alpha()
-                background = pygame.transform.scale(background, (map_width, map_height))
-                self.background = background
+                self.background = asset_cache.get_image(
+                    map_data["background"], (map_width, map_height)
+                )
             else:
                 print(f"Background image not found: {map_data['background']}")
         else:
             self.background = None
 
+        # Optional extra parallax layers drawn in front of the background
+        self.parallax_layers = []
+        for layer_data in map_data.get("parallax_layers", []):
+            if os.path.isfile(layer_data["image"]):
+                self.parallax_layers.append(
+                    {
+                        "image": asset_cache.get_image(layer_data["image"]),
+                        "factor": layer_data.get("factor", 0.3),
+                        "scale": layer_data.get("scale", 1.5),
+                    }
+                )
+            else:
+                print(f"Parallax layer image not found: {layer_data['image']}")
+
         if "checkpoints" in map_data:
             for checkpoint_data in map_data["checkpoints"]:
                 pos = (checkpoint_data["x"], checkpoint_data["y"])
@@ -2,6 +2,8 @@ import pygame
 import random
 import math
 
+from src.Assets.AssetCache import asset_cache
+
 
 class BackgroundManager:
     def __init__(self, width, height):
@@ -19,27 +21,39 @@ class BackgroundManager:
 
         try:
             # Load the background image
-            self.background = pygame.image.load(self.background_path).convert()
             bg_width = width * 3
             bg_height = height * 3
-            self.background = pygame.transform.scale(
-                self.background, (bg_width, bg_height)
+            self.background = asset_cache.get_image(
+                self.background_path, (bg_width, bg_height), alpha=False
             )
         except Exception as e:
             print(f"Erreur lors du chargement du fond d'écran: {e}")
             self.background = None
 
-    def draw(self, surface):
-        if self.background:
-            parallax_factor = 0.4
-            time_factor = pygame.time.get_ticks() / 1000
+        # Offset of the last draw, the screen only changes when it moves
+        self.drawn_offset = None
+
+    def get_offset(self, surface):
+        """Get the pixel position of the background for the current time"""
+        if not self.background:
+            return (0, 0)
+        parallax_factor = 0.4
+        time_factor = pygame.time.get_ticks() / 1000
 
-            center_x = (self.background.get_width() - surface.get_width()) / 2
-            center_y = (self.background.get_height() - surface.get_height()) / 2
+        center_x = (self.background.get_width() - surface.get_width()) / 2
+        center_y = (self.background.get_height() - surface.get_height()) / 2
 
-            bg_x = -center_x + math.sin(time_factor) * 50 * parallax_factor
-            bg_y = -center_y + math.cos(time_factor) * 30 * parallax_factor
+        bg_x = -center_x + math.sin(time_factor) * 50 * parallax_factor
+        bg_y = -center_y + math.cos(time_factor) * 30 * parallax_factor
+        return (int(bg_x), int(bg_y))
 
-            surface.blit(self.background, (bg_x, bg_y))
+    def has_changed(self, surface):
+        """Check if the background moved by at least one pixel since the last draw"""
+        return self.get_offset(surface) != self.drawn_offset
+
+    def draw(self, surface):
+        self.drawn_offset = self.get_offset(surface)
+        if self.background:
+            surface.blit(self.background, self.drawn_offset)
         else:
             surface.fill((0, 0, 0))
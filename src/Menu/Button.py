@@ -13,8 +13,19 @@ class Button:
         self.hover = False
         self.locked = locked
         self.rect = pygame.Rect(x, y, width, height)
+        # Look of the button when it was last drawn
+        self.drawn_state = None
+
+    def get_state(self):
+        return (self.text, self.hover, self.locked)
+
+    def has_changed(self):
+        """Check if the button looks different from its last draw"""
+        return self.get_state() != self.drawn_state
 
     def draw(self, surface, font):
+        self.drawn_state = self.get_state()
+
         # Button colors
         if self.locked:
             bg_color = (100, 100, 100)
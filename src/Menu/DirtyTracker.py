@@ -0,0 +1,59 @@
+class DirtyTracker:
+    """
+    Track which parts of a static screen changed since it was last drawn.
+
+    A screen is fully redrawn when it is shown again or when its animated
+    background moved. Otherwise only the buttons whose look changed (hover,
+    lock) and the extra rects given by the screen are redrawn, and nothing at
+    all when nothing changed.
+    """
+
+    def __init__(self):
+        self.full_redraw = True
+
+    def invalidate(self):
+        """Force a full redraw on the next frame"""
+        self.full_redraw = True
+
+    def get_dirty_rects(self, surface, bg_manager=None, buttons=(), extra_rects=()):
+        """
+        Get the screen areas that need to be redrawn.
+
+        Args:
+            surface (pygame.Surface): Screen surface
+            bg_manager (BackgroundManager, optional): Animated background of the screen
+            buttons (iterable): Buttons of the screen
+            extra_rects (iterable): Other areas known to have changed
+
+        Returns:
+            list: Rects to redraw, empty when nothing changed
+        """
+        if self.full_redraw or (
+            bg_manager is not None and bg_manager.has_changed(surface)
+        ):
+            return [surface.get_rect()]
+        rects = [button.rect for button in buttons if button.has_changed()]
+        rects.extend(extra_rects)
+        return rects
+
+    def redraw(self, surface, rects, draw_function):
+        """
+        Redraw the given areas only, by clipping a full draw of the screen.
+
+        Args:
+            surface (pygame.Surface): Screen surface
+            rects (list): Areas to redraw
+            draw_function (callable): Function drawing the whole screen on a surface
+
+        Returns:
+            list: The redrawn rects, to pass to pygame.display.update()
+        """
+        if not rects:
+            return []
+        surface.set_clip(rects[0].unionall(rects[1:]))
+        try:
+            draw_function(surface)
+        finally:
+            surface.set_clip(None)
+        self.full_redraw = False
+        return rects
@@ -1,52 +1,27 @@
 import pygame
 import math
 from src.Menu.BackgroundManager import BackgroundManager
+from src.Menu.DirtyTracker import DirtyTracker
 
 
 class InstructionsScreen:
     def __init__(self, game_resources):
         self.game_resources = game_resources
         self.bg_manager = BackgroundManager(game_resources.WIDTH, game_resources.HEIGHT)
+        self.dirty = DirtyTracker()
 
         self.title_font = pygame.font.SysFont("Arial", 72)
         self.text_font = pygame.font.SysFont("Arial", 32)
 
         self.blink_timer = 0
         self.blink_speed = 0.5
+        self.alpha = 0
+        self.drawn_alpha = None
 
-    def draw(self, surface):
-        self.bg_manager.draw(surface)
-
-        def render_text_with_outline(text, font, text_color, outline_color):
-            text_surface = font.render(text, True, text_color)
-            outline_surface = font.render(text, True, outline_color)
-
-            w, h = text_surface.get_size()
-            outline_surf = pygame.Surface((w + 2, h + 2), pygame.SRCALPHA)
-
-            # Dessiner le contour en décalant le texte
-            offsets = [
-                (1, 1),
-                (1, -1),
-                (-1, 1),
-                (-1, -1),
-                (1, 0),
-                (-1, 0),
-                (0, 1),
-                (0, -1),
-            ]
-            for dx, dy in offsets:
-                outline_surf.blit(outline_surface, (dx + 1, dy + 1))
-
-            # Dessiner le texte principal au centre
-            outline_surf.blit(text_surface, (1, 1))
-            return outline_surf
-
-        title_surf = render_text_with_outline(
+        # The texts never change, render them once
+        self.title_surf = self.render_text_with_outline(
             "Game control", self.title_font, (255, 255, 255), (0, 0, 0)
         )
-        title_rect = title_surf.get_rect(center=(self.game_resources.WIDTH // 2, 100))
-        surface.blit(title_surf, title_rect)
 
         instructions = [
             "Q : Move left",
@@ -61,31 +36,83 @@ class InstructionsScreen:
             "X: Attack",
             "Y: Pause / Menu",
         ]
+        self.instruction_surfs = [
+            self.render_text_with_outline(
+                line, self.text_font, (255, 255, 255), (0, 0, 0)
+            )
+            for line in instructions
+        ]
+
+        self.skip_text = self.render_text_with_outline(
+            "Press any key to continue", self.text_font, (255, 220, 0), (0, 0, 0)
+        )
+        self.skip_rect = self.skip_text.get_rect(
+            center=(self.game_resources.WIDTH // 2, self.game_resources.HEIGHT - 100)
+        )
+
+    @staticmethod
+    def render_text_with_outline(text, font, text_color, outline_color):
+        text_surface = font.render(text, True, text_color)
+        outline_surface = font.render(text, True, outline_color)
+
+        w, h = text_surface.get_size()
+        outline_surf = pygame.Surface((w + 2, h + 2), pygame.SRCALPHA)
+
+        # Dessiner le contour en décalant le texte
+        offsets = [
+            (1, 1),
+            (1, -1),
+            (-1, 1),
+            (-1, -1),
+            (1, 0),
+            (-1, 0),
+            (0, 1),
+            (0, -1),
+        ]
+        for dx, dy in offsets:
+            outline_surf.blit(outline_surface, (dx + 1, dy + 1))
+
+        # Dessiner le texte principal au centre
+        outline_surf.blit(text_surface, (1, 1))
+        return outline_surf
+
+    def invalidate(self):
+        """Redraw the whole screen on the next frame"""
+        self.dirty.invalidate()
+
+    def draw(self, surface):
+        """Draw the parts of the screen that changed and return their rects"""
+        self.blink_timer += 0.01
+        self.alpha = int(abs(math.sin(self.blink_timer * self.blink_speed)) * 255)
+
+        # Only the blinking text changes between two background moves
+        blink_rects = [self.skip_rect] if self.alpha != self.drawn_alpha else []
+        rects = self.dirty.get_dirty_rects(
+            surface, self.bg_manager, extra_rects=blink_rects
+        )
+        return self.dirty.redraw(surface, rects, self.draw_all)
+
+    def draw_all(self, surface):
+        self.bg_manager.draw(surface)
+
+        title_rect = self.title_surf.get_rect(
+            center=(self.game_resources.WIDTH // 2, 100)
+        )
+        surface.blit(self.title_surf, title_rect)
 
         y_offset = 180
         line_spacing = 40
 
-        for line in instructions:
-            text_surf = render_text_with_outline(
-                line, self.text_font, (255, 255, 255), (0, 0, 0)
-            )
+        for text_surf in self.instruction_surfs:
             text_rect = text_surf.get_rect(
                 center=(self.game_resources.WIDTH // 2, y_offset)
             )
             surface.blit(text_surf, text_rect)
             y_offset += line_spacing
 
-        self.blink_timer += 0.01
-        alpha = abs(math.sin(self.blink_timer * self.blink_speed)) * 255
-
-        skip_text = render_text_with_outline(
-            "Press any key to continue", self.text_font, (255, 220, 0), (0, 0, 0)
-        )
-        skip_text.set_alpha(int(alpha))
-        skip_rect = skip_text.get_rect(
-            center=(self.game_resources.WIDTH // 2, self.game_resources.HEIGHT - 100)
-        )
-        surface.blit(skip_text, skip_rect)
+        self.skip_text.set_alpha(self.alpha)
+        self.drawn_alpha = self.alpha
+        surface.blit(self.skip_text, self.skip_rect)
 
     def handle_event(self, event):
         if (
@@ -1,11 +1,13 @@
 import pygame
 import sqlite3
-import os
 from datetime import datetime
 
 from src.Menu.BackgroundManager import BackgroundManager
 from src.Menu.Button import Button
+from src.Menu.DirtyTracker import DirtyTracker
+from src.Database.Connection import get_connection
 from src.Database.LevelDB import LevelDB
+from src.Database.WriteBehind import write_behind
 
 
 class Leaderboard:
@@ -17,11 +19,18 @@ class Leaderboard:
         self.font = font
         self.db_path = db_path
         self.leaderboard_db = leaderboard_db
+        # Table versions the cached scores were loaded at
+        self.scores_version = None
+        self.scores = {}
 
         self.levels = self.get_available_levels()
         self.level_tabs = [f"Level {level}" for level in self.levels]
 
         self.bg_manager = BackgroundManager(WIDTH, HEIGHT)
+        self.dirty = DirtyTracker()
+
+        self.title_font = pygame.font.SysFont("Arial", 48, bold=True)
+        self.small_font = pygame.font.SysFont("Arial", 20)
 
         # Define the tabs (levels + infinite mode)
         self.tabs = self.level_tabs + ["Infinite mode"]
@@ -51,9 +60,26 @@ class Leaderboard:
         except:
             return [1]
 
+    def invalidate(self):
+        """Redraw the whole leaderboard on the next frame."""
+        self.dirty.invalidate()
+
     def load_scores(self):
-        """Load scores from the database for each level."""
+        """
+        Load scores from the database for each level.
+
+        The scores are kept in memory and only reloaded when a speedrun time or
+        an infinite mode score has been written since the last load.
+        """
+        version = (
+            write_behind.version("speedrun"),
+            write_behind.version("Leaderboard"),
+        )
+        if version == self.scores_version:
+            return
+        self.scores_version = version
         self.scores = {}
+        self.dirty.invalidate()
 
         # Load scores for each level
         for i, level in enumerate(self.levels):
@@ -80,10 +106,8 @@ class Leaderboard:
     def get_level_scores(self, level_id):
         """Get the top 10 scores for a specific level from the database."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute(
+            write_behind.flush()
+            cursor = get_connection(self.db_path).execute(
                 """
                 SELECT time, date, collected_items, total_items 
                 FROM speedrun 
@@ -95,7 +119,6 @@ class Leaderboard:
             )
 
             results = cursor.fetchall()
-            conn.close()
 
             # Format results
             formatted_results = []
@@ -119,10 +142,17 @@ class Leaderboard:
         return f"{minutes:02}:{seconds:02}.{milliseconds:03}"
 
     def draw(self, surface):
-        """Draw the leaderboard on the given surface."""
-        # Refresh scores to ensure the latest data is displayed
+        """Draw the parts of the leaderboard that changed and return their rects."""
+        # Refresh scores if new ones were saved since the last load
         self.load_scores()
 
+        rects = self.dirty.get_dirty_rects(
+            surface, self.bg_manager, self.tab_buttons + [self.back_button]
+        )
+        return self.dirty.redraw(surface, rects, self.draw_all)
+
+    def draw_all(self, surface):
+        """Draw the leaderboard on the given surface."""
         self.bg_manager.draw(surface)
 
         # Draw a semi-transparent panel
@@ -133,16 +163,15 @@ class Leaderboard:
         panel_surface.fill((10, 10, 40, 180))
         surface.blit(panel_surface, panel_rect)
 
-        title_font = pygame.font.SysFont("Arial", 48, bold=True)
-        title = title_font.render("Leaderboard", True, (255, 255, 255))
-        title_shadow = title_font.render("Leaderboard", True, (0, 0, 0))
+        title = self.title_font.render("Leaderboard", True, (255, 255, 255))
+        title_shadow = self.title_font.render("Leaderboard", True, (0, 0, 0))
 
         title_rect = title.get_rect(center=(self.WIDTH // 2, 40))
         shadow_rect = title_shadow.get_rect(center=(self.WIDTH // 2 + 2, 42))
         surface.blit(title_shadow, shadow_rect)
         surface.blit(title, title_rect)
 
-        font = pygame.font.SysFont("Arial", 20)
+        font = self.small_font
 
         # Draw tabs
         for i, button in enumerate(self.tab_buttons):
@@ -246,26 +275,9 @@ class Leaderboard:
             action = button.handle_event(event)
             if action and action.startswith("tab_"):
                 self.current_tab = int(action.split("_")[1])
+                self.dirty.invalidate()
         return None
 
-    def refresh_scores(self, previous_level=""):
-        """Refresh scores from the database."""
-        if previous_level != "LEADERBOARD":
-            self.scores = {}
-
-            # Get the list of levels from the directory
-            level_dir = "map/levels/"
-            try:
-                levels = [
-                    f.replace(".json", "")
-                    for f in os.listdir(level_dir)
-                    if f.endswith(".json")
-                ]
-
-                # Get the scores for each level
-                for level in levels:
-                    scores = self.get_level_scores(level)
-                    if scores:
-                        self.scores[int(level) - 1] = scores
-            except Exception as e:
-                print(f"Error while refreshing the score: {e}")
+    def refresh_scores(self):
+        """Refresh scores from the database if new ones were saved since the last load."""
+        self.load_scores()
@@ -4,6 +4,7 @@ import re
 
 from src.Menu.BackgroundManager import BackgroundManager
 from src.Menu.Button import Button
+from src.Menu.DirtyTracker import DirtyTracker
 
 
 class LevelEditorSelectionMenu:
@@ -23,6 +24,10 @@ class LevelEditorSelectionMenu:
         self.levels = []
 
         self.bg_manager = BackgroundManager(game_resources.WIDTH, game_resources.HEIGHT)
+        self.dirty = DirtyTracker()
+        self.title = pygame.font.SysFont("Arial", 48).render(
+            "Level Editor", True, (0, 191, 255)
+        )
 
         # Button dimensions
         self.button_width = 250
@@ -127,7 +132,26 @@ class LevelEditorSelectionMenu:
             )
         )
 
+    def invalidate(self):
+        """
+        Redraw the whole menu on the next frame.
+        """
+        self.dirty.invalidate()
+
     def draw(self, surface):
+        """
+        Draw the parts of the menu that changed since the last frame.
+
+        Args:
+            surface: Pygame surface to draw on
+
+        Returns:
+            list: Rects of the screen that were redrawn
+        """
+        rects = self.dirty.get_dirty_rects(surface, self.bg_manager, self.buttons)
+        return self.dirty.redraw(surface, rects, self.draw_all)
+
+    def draw_all(self, surface):
         """
         Draw the level selection menu.
 
@@ -136,13 +160,10 @@ class LevelEditorSelectionMenu:
         """
         self.bg_manager.draw(surface)
         # Draw title
-        title = pygame.font.SysFont("Arial", 48).render(
-            "Level Editor", True, (0, 191, 255)
-        )
-        title_rect = title.get_rect(
+        title_rect = self.title.get_rect(
             center=(self.game_resources.WIDTH // 2, self.game_resources.HEIGHT // 6)
         )
-        surface.blit(title, title_rect)
+        surface.blit(self.title, title_rect)
 
         # Draw buttons
         for button in self.buttons:
@@ -5,6 +5,7 @@ import re
 from src.Database.LevelDB import LevelDB
 from src.Menu.BackgroundManager import BackgroundManager
 from src.Menu.Button import Button
+from src.Menu.DirtyTracker import DirtyTracker
 from src.game import clear_checkpoint_database, clear_level_progress
 
 
@@ -26,6 +27,10 @@ class LevelSelectMenu:
         self.levels = []
 
         self.bg_manager = BackgroundManager(game_resources.WIDTH, game_resources.HEIGHT)
+        self.dirty = DirtyTracker()
+        self.title = pygame.font.SysFont("Arial", 48).render(
+            "Select Level", True, (0, 191, 255)
+        )
 
         # Button dimensions
         self.button_width = 250
@@ -34,7 +39,6 @@ class LevelSelectMenu:
 
         # Initialize database and get unlocked levels
         self.db = LevelDB()
-        self.db.create_unlocked_levels_table()
         self.unlocked_levels = self.db.get_all_unlocked_levels()
 
         # Scan for level files
@@ -164,7 +168,26 @@ class LevelSelectMenu:
             )
         )
 
+    def invalidate(self):
+        """
+        Redraw the whole menu on the next frame.
+        """
+        self.dirty.invalidate()
+
     def draw(self, surface):
+        """
+        Draw the parts of the menu that changed since the last frame.
+
+        Args:
+            surface: Pygame surface to draw on
+
+        Returns:
+            list: Rects of the screen that were redrawn
+        """
+        rects = self.dirty.get_dirty_rects(surface, self.bg_manager, self.buttons)
+        return self.dirty.redraw(surface, rects, self.draw_all)
+
+    def draw_all(self, surface):
         """
         Draw the level selection menu.
 
@@ -173,13 +196,10 @@ class LevelSelectMenu:
         """
         self.bg_manager.draw(surface)
         # Draw title
-        title = pygame.font.SysFont("Arial", 48).render(
-            "Select Level", True, (0, 191, 255)
-        )
-        title_rect = title.get_rect(
+        title_rect = self.title.get_rect(
             center=(self.game_resources.WIDTH // 2, self.game_resources.HEIGHT // 6)
         )
-        surface.blit(title, title_rect)
+        surface.blit(self.title, title_rect)
 
         # Draw buttons
         for button in self.buttons:
@@ -217,6 +237,7 @@ class LevelSelectMenu:
                     self.buttons = []
                     self._create_buttons()
                     self._add_navigation_buttons()
+                    self.invalidate()
                     return None
                 return action
         return None
@@ -4,6 +4,7 @@ import math
 
 from src.Menu.BackgroundManager import BackgroundManager
 from src.Menu.Button import Button
+from src.Menu.DirtyTracker import DirtyTracker
 
 
 class Menu:
@@ -16,6 +17,10 @@ class Menu:
         start_y = self.game_resources.HEIGHT // 2 - 100
 
         self.bg_manager = BackgroundManager(game_resources.WIDTH, game_resources.HEIGHT)
+        self.dirty = DirtyTracker()
+        self.title = pygame.font.SysFont("Arial", 72).render(
+            "Sanic and the princess Zeldo", True, (0, 191, 255)
+        )
 
         # Create buttons centered horizontally
         self.buttons.append(
@@ -65,17 +70,23 @@ class Menu:
             )
         )
 
+    def invalidate(self):
+        """Redraw the whole menu on the next frame"""
+        self.dirty.invalidate()
+
     def draw(self, surface):
+        """Draw the parts of the menu that changed and return their rects"""
+        rects = self.dirty.get_dirty_rects(surface, self.bg_manager, self.buttons)
+        return self.dirty.redraw(surface, rects, self.draw_all)
+
+    def draw_all(self, surface):
         self.bg_manager.draw(surface)
 
         # Draw title
-        title = pygame.font.SysFont("Arial", 72).render(
-            "Sanic and the princess Zeldo", True, (0, 191, 255)
-        )
-        title_rect = title.get_rect(
+        title_rect = self.title.get_rect(
             center=(self.game_resources.WIDTH // 2, self.game_resources.HEIGHT // 4)
         )
-        surface.blit(title, title_rect)
+        surface.blit(self.title, title_rect)
 
         # Draw buttons
         for button in self.buttons:
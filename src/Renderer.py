@@ -0,0 +1,79 @@
+from operator import itemgetter
+
+
+# Draw order of the playing state, back to front
+LAYER_BACKGROUND = 0
+LAYER_PLATFORMS = 1
+LAYER_COLLECTIBLES = 2
+LAYER_ENEMIES = 3
+LAYER_PLAYER = 4
+LAYER_PROJECTILES = 5
+LAYER_HUD = 6
+
+
+class Renderer:
+    """
+    Batch the blits of a frame into a single Surface.blits() call.
+
+    Blits are queued with a layer and submitted back to front when the frame
+    is flushed; blits of the same layer keep the order they were queued in.
+    Sprites choose their layer with a render_layer class attribute.
+    """
+
+    def __init__(self):
+        self.queue = []
+        self.blit_count = 0
+
+    def add(self, surface, position, layer=LAYER_PLATFORMS):
+        """
+        Queue one blit.
+
+        Args:
+            surface (pygame.Surface): Image to draw
+            position (tuple): Screen position of the top left corner
+            layer (int): Draw layer
+        """
+        self.queue.append((layer, surface, position))
+
+    def add_many(self, blits, layer):
+        """
+        Queue (surface, position) pairs on the same layer.
+
+        Args:
+            blits (iterable): (surface, position) pairs
+            layer (int): Draw layer
+        """
+        self.queue.extend((layer, surface, position) for surface, position in blits)
+
+    def add_sprites(self, sprites, offset=(0, 0), image_attr="surf"):
+        """
+        Queue sprites at their rect position moved by an offset.
+
+        Args:
+            sprites (iterable): Sprites with a rect and an image attribute
+            offset (tuple): Camera offset added to the sprite positions
+            image_attr (str): Name of the sprite attribute holding its image
+        """
+        offset_x, offset_y = offset
+        self.queue.extend(
+            (
+                getattr(sprite, "render_layer", LAYER_PLATFORMS),
+                getattr(sprite, image_attr),
+                (sprite.rect.x + offset_x, sprite.rect.y + offset_y),
+            )
+            for sprite in sprites
+        )
+
+    def flush(self, target):
+        """
+        Draw every queued blit on a surface and empty the queue.
+
+        Args:
+            target (pygame.Surface): Surface to draw on
+        """
+        self.queue.sort(key=itemgetter(0))
+        target.blits(
+            [(surface, position) for _, surface, position in self.queue], doreturn=False
+        )
+        self.blit_count = len(self.queue)
+        self.queue.clear()
@@ -1,5 +1,11 @@
 import pygame
 
+from src.Assets.AssetCache import asset_cache
+from src.Assets.SoundBank import sound_bank
+from src.Entity.ProjectilePool import ProjectilePool
+from src.Database.Connection import get_connection
+from src.Renderer import Renderer
+
 
 class GameResources:
     def __init__(self):
@@ -16,6 +22,20 @@ class GameResources:
         self.life_icon_width = 50
         self.fullscreen = False
 
+        # Memory budget of the shared texture cache (LRU eviction above it)
+        self.asset_cache_budget = 256 * 1024 * 1024
+        asset_cache.configure(self.asset_cache_budget)
+
+        # Open the shared database connection and create the schema once
+        self.db_file = "game.db"
+        try:
+            get_connection(self.db_file)
+        except Exception as e:
+            print(f"Error opening database: {e}")
+
+        # Decode every sound effect once, entities only play them
+        sound_bank.preload()
+
         try:
             icon = pygame.image.load("assets/player/Sanic Head.png")
             pygame.display.set_icon(icon)
@@ -26,6 +46,19 @@ class GameResources:
         self.platforms = pygame.sprite.Group()
         self.all_sprites = pygame.sprite.Group()
         self.exits = pygame.sprite.Group()
+        # Broadphase index of the platforms, built by the map parser
+        self.platform_index = None
+        # Viewport culling of all_sprites and its drawn/culled counts of the last frame
+        self.sprite_culler = None
+        self.render_stats = {"drawn": 0, "culled": 0}
+        # Batches the blits of the playing state by layer
+        self.renderer = Renderer()
+        # Projectiles of the level, fired by the player and the enemies
+        self.projectile_pool = ProjectilePool()
+        # State of the level at the last checkpoint, restored on respawn
+        self.level_snapshot = None
+        # Exit video started by the level, shown by the cutscene state
+        self.cutscene = None
         self.vec = pygame.math.Vector2
         self.displaysurface = pygame.display.set_mode(
             (self.WIDTH, self.HEIGHT), pygame.RESIZABLE, vsync=1
@@ -33,8 +66,11 @@ class GameResources:
         pygame.display.set_caption("Project Sanic")
         self.FramePerSec = pygame.time.Clock()
 
+        self.hud = None
         self.infinite_manager = None
         self.infinite_mode = False
+        # Write generated infinite maps to map/infinite/ (debugging and export only)
+        self.export_infinite_maps = False
 
         # Font
         try:
@@ -3,7 +3,6 @@ import json
 import pygame
 import sys
 
-from moviepy.decorators import preprocess_args
 from pygame.locals import *
 
 from src.Database.InfiniteModeDB import InfiniteModeDB
@@ -12,17 +11,20 @@ from src.Database.LevelDB import LevelDB
 from src.Entity.Platform import Platform
 from src.Entity.Player import Player
 from src.Map.parser import MapParser
+from src.Map.ParallaxBackground import ParallaxBackground
+from src.Map.SpriteCuller import SpriteCuller
 from src.Database.CheckpointDB import CheckpointDB
 from src.Map.Infinite.InfiniteMapManager import InfiniteMapManager
 
 
-def initialize_game(game_resources, map_file="map/levels/1.json"):
+def initialize_game(game_resources, map_file="map/levels/1.json", map_objects=None):
     """
     Initialize game with map from JSON file
 
     Args:
         game_resources: GameResources object containing pygame resources
         map_file (str): Name of the map JSON file to load
+        map_objects (dict, optional): Map already parsed in the background, skips loading
 
     Returns:
         tuple: (player, platform, platforms_group, all_sprites, background, checkpoints, exits)
@@ -30,13 +32,21 @@ def initialize_game(game_resources, map_file="map/levels/1.json"):
     checkpointDB = CheckpointDB()
     checkpointDB.reset_level(map_file)
     checkpointDB.close()
-    parser = MapParser(game_resources)
-    map_objects = parser.load_map(map_file)
+    # Projectiles do not carry over to another level or a restart
+    game_resources.projectile_pool.clear()
+    game_resources.level_snapshot = None
+    if map_objects is None:
+        parser = MapParser(game_resources)
+        map_objects = parser.load_map(map_file)
+    else:
+        install_map_objects(game_resources, map_objects)
 
     if not map_objects:
         # Fallback to default setup if map loading fails
         game_resources.platforms.empty()
         game_resources.all_sprites.empty()
+        game_resources.platform_index = None
+        game_resources.sprite_culler = None
 
         PT1 = Platform(1200, 20, 600, 400)
         P1 = Player(game_resources)
@@ -69,14 +79,20 @@ def initialize_game(game_resources, map_file="map/levels/1.json"):
                     exit_obj.set_boss(enemy)
                 break
 
+    # Index every sprite so drawing only visits the ones in view
+    game_resources.sprite_culler = SpriteCuller(map_objects["all_sprites"])
+
     background = map_objects.get("background", None)
 
     # If no background is found, use a default black background
     if background is None:
         background = pygame.Surface((game_resources.WIDTH, game_resources.HEIGHT))
         background.fill((0, 0, 0))
-    else:
-        pass
+
+    # Scaled once per resolution, then only the visible tiles are drawn
+    background = ParallaxBackground(background)
+    for layer in map_objects.get("parallax_layers", []):
+        background.add_layer(layer["image"], layer["factor"], layer["scale"])
 
     return (
         map_objects["player"],
@@ -90,6 +106,24 @@ def initialize_game(game_resources, map_file="map/levels/1.json"):
     )
 
 
+def install_map_objects(game_resources, map_objects):
+    """
+    Move a map parsed into detached sprite groups into the shared groups
+
+    Args:
+        game_resources: GameResources object
+        map_objects (dict): Result of MapParser.load_map with detached=True
+    """
+    for name in ("all_sprites", "platforms", "exits"):
+        shared = getattr(game_resources, name)
+        loaded = map_objects[name]
+        shared.empty()
+        shared.add(loaded.sprites())
+        loaded.empty()
+        map_objects[name] = shared
+    game_resources.platform_index = map_objects["platform_index"]
+
+
 def reset_game_with_checkpoint(map_name, game_resources):
     """
     Reset the game and respawn player at checkpoint if available
@@ -102,6 +136,19 @@ def reset_game_with_checkpoint(map_name, game_resources):
     db = CheckpointDB()
     checkpoint_pos = db.get_checkpoint(map_name)
 
+    # Put the level back as it was at the checkpoint instead of reloading it
+    snapshot = game_resources.level_snapshot
+    if checkpoint_pos and snapshot is not None and snapshot.map_name == map_name:
+        snapshot.restore(checkpoint_pos)
+        return (
+            snapshot.player,
+            game_resources.platforms,
+            snapshot.all_sprites,
+            snapshot.background,
+            snapshot.checkpoints,
+            snapshot.collectibles,
+        )
+
     # Initialize game
     player, _, platforms, all_sprites, background, checkpoints, exits, collectibles = (
         initialize_game(game_resources, map_name)
@@ -140,10 +187,16 @@ def clear_level_progress():
         print(f"Error clearing level progress: {e}")
 
 
-def start_infinite_mode(game_resources):
-    """Start the infinite mode of the game"""
+def start_infinite_mode(game_resources, seed=None):
+    """
+    Start the infinite mode of the game
+
+    Args:
+        game_resources: GameResources object
+        seed (int, optional): Seed of the run, to replay the same sequence of maps
+    """
     # Create a new InfiniteMapManager
-    infinite_manager = InfiniteMapManager(game_resources)
+    infinite_manager = InfiniteMapManager(game_resources, seed)
     game_resources.infinite_manager = infinite_manager
     game_resources.infinite_mode = True
 
@@ -154,17 +207,20 @@ def start_infinite_mode(game_resources):
     first_level = infinite_manager.start_infinite_mode()
 
     # Initialize the game with the generated level
-    return initialize_game(game_resources, first_level)
+    map_objects = infinite_manager.take_preloaded(first_level)
+    return initialize_game(game_resources, first_level, map_objects)
 
 
 def handle_exit_collision(exit_obj, game_resources, level_file):
     """Handle exit collision and transition to next level, including infinite mode"""
     next_level = exit_obj.next_level
 
-    # Mod infinite: if the next level is "NEXT_INFINITE_LEVEL", generate a new level
+    # Mod infinite: every exit leads to the next map, already loaded in the background
     if hasattr(game_resources, "infinite_mode") and game_resources.infinite_mode:
-        if next_level == "NEXT_INFINITE_LEVEL":
-            next_level = game_resources.infinite_manager.advance_to_next_level()
+        infinite_manager = game_resources.infinite_manager
+        next_level = infinite_manager.advance_to_next_level()
+        map_objects = infinite_manager.take_preloaded(next_level)
+        return initialize_game(game_resources, next_level, map_objects)
 
     return initialize_game(game_resources, next_level)
 
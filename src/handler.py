@@ -2,7 +2,7 @@ import re
 import pygame
 import sys
 from pygame.locals import *
-import numpy as np
+import math
 
 from src.Database.LeaderboardDB import LeaderboardDB
 from src.Database.LevelDB import LevelDB
@@ -19,11 +19,18 @@ from src.constant import GameResources
 from src.Menu.Menu import Menu
 from src.Menu.Leaderboard import Leaderboard
 from src.Camera import Camera
+from src.HUD import HUD
 from src.Database.CheckpointDB import CheckpointDB
 from src.Map.Editor.LevelEditor import LevelEditor
 from src.Menu.LevelEditorSelectionMenu import LevelEditorSelectionMenu
 from src.Map.Speedrun.SpeedrunTimer import SpeedrunTimer
+from src.Map.ParallaxBackground import ParallaxBackground
+from src.Map.LevelSnapshot import LevelSnapshot
+from src.Renderer import LAYER_BACKGROUND, LAYER_PROJECTILES
 from src.Menu.InstructionsScreen import InstructionsScreen
+from src.Assets.AssetCache import asset_cache
+from src.Assets.SoundBank import sound_bank
+from src.FrameProfiler import frame_profiler
 
 
 def initialize_game_resources():
@@ -31,22 +38,24 @@ def initialize_game_resources():
     game_resources = GameResources()
     displaysurface = game_resources.displaysurface
     camera = Camera(game_resources.WIDTH, game_resources.HEIGHT, game_resources)
+    game_resources.hud = HUD(game_resources)
 
     # Initialize death screen resources
     death_timer = 0
     death_display_time = 2
     try:
-        death_image = pygame.image.load("assets/player/dead.jpg")
+        death_image = asset_cache.get_image(
+            "assets/player/dead.jpg",
+            (game_resources.WIDTH, game_resources.HEIGHT),
+            alpha=False,
+        )
     except Exception as e:
         print(f"Error loading image: {e}")
         death_image = None
 
-    try:
-        death_sound = pygame.mixer.Sound("assets/sound/Death.mp3")
+    death_sound = sound_bank.get("death")
+    if death_sound:
         death_display_time = death_sound.get_length()
-    except Exception as e:
-        print(f"Error loading Death.mp3 sound: {e}")
-        death_sound = None
 
     # Initialize joysticks
     pygame.joystick.quit()
@@ -61,7 +70,7 @@ def initialize_game_resources():
         print("Error while initializing joysticks")
 
     clear_checkpoint_database()
-    projectiles = pygame.sprite.Group()
+    projectiles = game_resources.projectile_pool
 
     # Game states initialization
     current_state = 5  # INSTRUCTIONS
@@ -114,11 +123,16 @@ def handle_system_events(
         sys.exit()
     elif event.type == KEYDOWN:
         if event.key == K_ESCAPE:
-            if current_state in [1, 2]:  # PLAYING, INFINITE
+            if current_state == 6:  # CUTSCENE, skipped by the cutscene state
+                pass
+            elif current_state in [1, 2]:  # PLAYING, INFINITE
                 current_state = 0  # MENU
             else:
                 pygame.quit()
                 sys.exit()
+        elif event.key == K_F3:
+            # Toggle the frame time overlay
+            frame_profiler.overlay = not frame_profiler.overlay
         elif event.key == K_F11:
             fullscreen = not fullscreen
             if fullscreen:
@@ -140,7 +154,9 @@ def handle_system_events(
     elif event.type == pygame.JOYBUTTONDOWN:
         try:
             if event.button == 4:  # Triangle sur la plupart des manettes
-                if current_state in [1, 2]:  # PLAYING, INFINITE
+                if current_state == 6:  # CUTSCENE, skipped by the cutscene state
+                    pass
+                elif current_state in [1, 2]:  # PLAYING, INFINITE
                     current_state = 0  # MENU
                 else:
                     pygame.quit()
@@ -158,9 +174,8 @@ def handle_game_events(
     death_sound,
     level_file,
     game_resources,
-    projectiles,
 ):
-    """Handle game-specific events like player death and projectile creation"""
+    """Handle game-specific events like player death"""
     checkpoint_data = None
 
     if event.type == USEREVENT:
@@ -168,7 +183,7 @@ def handle_game_events(
             current_state = 4  # DEATH_SCREEN
             death_timer = 0
             if death_sound:
-                death_sound.play()
+                sound_bank.play("death")
 
             is_infinite_mode = (
                 hasattr(game_resources, "infinite_mode")
@@ -181,11 +196,7 @@ def handle_game_events(
             else:
                 checkpoint_data = None
 
-        if event.dict.get("action") == "create_projectile":
-            projectile = event.dict.get("projectile")
-            projectiles.add(projectile)
-
-    return current_state, death_timer, checkpoint_data, projectiles
+    return current_state, death_timer, checkpoint_data
 
 
 def handle_menu_events(
@@ -221,6 +232,8 @@ def handle_menu_events(
             current_menu = "main"
         elif isinstance(action, dict) and action.get("action") == "select_level":
             level_file = action.get("level_file")
+            # A level picked from the menu is never part of an infinite run
+            game_resources.infinite_mode = False
             (
                 P1,
                 PT1,
@@ -245,7 +258,7 @@ def handle_menu_events(
             )
             speedrun_timer.collected_items = 0
 
-            projectiles = pygame.sprite.Group()
+            projectiles = game_resources.projectile_pool
             current_state = 1  # PLAYING
             return (
                 current_state,
@@ -333,6 +346,7 @@ def handle_editor_events(
     return current_state, current_menu, level_editor
 
 
+@frame_profiler.timed("update_playing_state")
 def update_playing_state(
     P1, platforms, projectiles, WIDTH, HEIGHT, camera, all_sprites
 ):
@@ -341,12 +355,12 @@ def update_playing_state(
     P1.move()
     P1.update()
     P1.attack()
-    projectiles.update(WIDTH, HEIGHT, P1, camera)
 
     # Update camera to follow player
     camera.update(P1)
 
     # Handle moving platforms
+    platform_index = P1.game_resources.platform_index
     for platform in platforms:
         if platform.is_moving and platform.movement_type == "linear":
             if platform.movement_points[0]["x"] - platform.movement_points[1]["x"] == 0:
@@ -370,16 +384,16 @@ def update_playing_state(
                 and P1.pos.y == platform.rect.y
                 and platform.clockwise
             ):
-                P1.pos.x = P1.pos.x + platform.radius * np.cos(platform.angle)
-                P1.pos.y = P1.pos.y + platform.radius * np.sin(platform.angle)
+                P1.pos.x = P1.pos.x + platform.radius * math.cos(platform.angle)
+                P1.pos.y = P1.pos.y + platform.radius * math.sin(platform.angle)
 
             if (
                 P1.rect.colliderect(platform.rect)
                 and P1.pos.y == platform.rect.y
                 and not platform.clockwise
             ):
-                P1.pos.x = P1.pos.x + platform.radius * np.cos(platform.angle)
-                P1.pos.y = P1.pos.y + platform.radius * np.sin(-platform.angle)
+                P1.pos.x = P1.pos.x + platform.radius * math.cos(platform.angle)
+                P1.pos.y = P1.pos.y + platform.radius * math.sin(-platform.angle)
 
             platform.move_circular(
                 platform.center,
@@ -388,58 +402,34 @@ def update_playing_state(
                 platform.clockwise,
             )
 
+        # Keep the broadphase index in sync with moving platforms
+        if platform.is_moving and platform_index is not None:
+            platform_index.update(platform)
+
     # Update all sprites
+    enemies = []
     for sprite in all_sprites:
         if isinstance(sprite, Enemy):
             sprite.update(P1)
-            projectiles.update(WIDTH, HEIGHT, P1, camera, sprite)
+            enemies.append(sprite)
         else:
             sprite.update()
 
+    # Move every projectile once and test it against the player and the enemies
+    projectiles.update(WIDTH, HEIGHT, P1, camera, enemies)
 
-def draw_background(displaysurface, background, camera, WIDTH, HEIGHT):
-    """Draw background with parallax effect"""
-    bg_width = WIDTH * 1.5
-    bg_height = HEIGHT * 1.5
-
-    # Resize if necessary
-    if background.get_width() != bg_width or background.get_height() != bg_height:
-        background = pygame.transform.scale(background, (bg_width, bg_height))
-
-    # Parallax effect
-    parallax_factor = 0.3
 
-    bg_x = (camera.camera.x * parallax_factor) % bg_width
-    bg_y = (camera.camera.y * parallax_factor) % bg_height
-
-    if bg_x > 0:
-        bg_x -= bg_width
-    if bg_y > 0:
-        bg_y -= bg_height
-
-    # Draw background in all directions to create seamless effect
-    displaysurface.blit(background, (bg_x, bg_y))
-
-    if bg_x > 0:
-        displaysurface.blit(background, (bg_x - bg_width, bg_y))
-    if bg_x + bg_width < WIDTH:
-        displaysurface.blit(background, (bg_x + bg_width, bg_y))
-
-    if bg_y > 0:
-        displaysurface.blit(background, (bg_x, bg_y - bg_height))
-        if bg_x > 0:
-            displaysurface.blit(background, (bg_x - bg_width, bg_y - bg_height))
-        if bg_x + bg_width < WIDTH:
-            displaysurface.blit(background, (bg_x + bg_width, bg_y - bg_height))
-
-    if bg_y + bg_height < HEIGHT:
-        displaysurface.blit(background, (bg_x, bg_y + bg_height))
-        if bg_x > 0:
-            displaysurface.blit(background, (bg_x - bg_width, bg_y + bg_height))
-        if bg_x + bg_width < WIDTH:
-            displaysurface.blit(background, (bg_x + bg_width, bg_y + bg_height))
+def draw_background(displaysurface, background, camera, WIDTH, HEIGHT, renderer=None):
+    """Draw background with parallax effect, or queue it on the renderer"""
+    # A plain image is wrapped once, so it is not scaled again every frame
+    background = ParallaxBackground.wrap(background)
+    if renderer is not None:
+        renderer.add_many(background.get_blits(camera, WIDTH, HEIGHT), LAYER_BACKGROUND)
+    else:
+        background.draw(displaysurface, camera, WIDTH, HEIGHT)
 
 
+@frame_profiler.timed("draw_playing_state")
 def draw_playing_state(
     displaysurface,
     background,
@@ -459,29 +449,45 @@ def draw_playing_state(
     speedrun_timer=None,
 ):
     """Draw game state while playing"""
+    # All the world blits of the frame go out in one batch, ordered by layer
+    renderer = game_resources.renderer
+
     # Draw background
     if background:
-        draw_background(displaysurface, background, camera, WIDTH, HEIGHT)
-
-    # Draw all sprites with camera offset
-    for entity in all_sprites:
-        camera_adjusted_rect = entity.rect.copy()
-        camera_adjusted_rect.x += camera.camera.x
-        camera_adjusted_rect.y += camera.camera.y
-        displaysurface.blit(entity.surf, camera_adjusted_rect)
-
-    # Draw projectiles with camera offset
-    for projectile in projectiles:
-        camera_adjusted_rect = projectile.rect.copy()
-        camera_adjusted_rect.x += camera.camera.x
-        camera_adjusted_rect.y += camera.camera.y
-        displaysurface.blit(projectile.surf, camera_adjusted_rect)
+        draw_background(displaysurface, background, camera, WIDTH, HEIGHT, renderer)
+
+    # Draw the sprites overlapping the camera view with camera offset
+    sprite_culler = game_resources.sprite_culler
+    if sprite_culler is not None and sprite_culler.sprites is all_sprites:
+        visible_sprites = sprite_culler.get_visible(camera, WIDTH, HEIGHT)
+    else:
+        visible_sprites = all_sprites
+    offset = camera.camera.topleft
+    renderer.add_sprites(visible_sprites, offset)
+
+    # Draw projectiles with camera offset, skipping the ones off screen
+    renderer.add_many(
+        projectiles.get_blits(offset, displaysurface.get_rect()), LAYER_PROJECTILES
+    )
+    renderer.flush(displaysurface)
+
+    if sprite_culler is not None:
+        game_resources.render_stats = {
+            "drawn": sprite_culler.drawn,
+            "culled": sprite_culler.culled,
+        }
+        frame_profiler.set_counter("drawn", sprite_culler.drawn)
+        frame_profiler.set_counter("culled", sprite_culler.culled)
 
     # Handle checkpoints
     if checkpoints is not None:
         checkpoints_hit = pygame.sprite.spritecollide(P1, checkpoints, False)
         for checkpoint in checkpoints_hit:
-            checkpoint.activate()
+            if checkpoint.activate():
+                # A respawn restores this state instead of reloading the level
+                game_resources.level_snapshot = LevelSnapshot(
+                    level_file, P1, all_sprites, checkpoints, collectibles, background
+                )
 
     # Handle exit collisions
     result = handle_exits(P1, exits, game_resources, level_file, speedrun_timer)
@@ -509,7 +515,9 @@ def draw_playing_state(
         text.draw(displaysurface)
 
     # Draw UI elements
-    draw_ui_elements(displaysurface, P1, FramePerSec, font, speedrun_timer)
+    draw_ui_elements(
+        displaysurface, P1, FramePerSec, font, speedrun_timer, game_resources.hud
+    )
 
     return result
 
@@ -558,7 +566,9 @@ def handle_exits(P1, exits, game_resources, level_file, speedrun_timer=None):
     return None
 
 
-def draw_ui_elements(displaysurface, P1, FramePerSec, font, speedrun_timer=None):
+def draw_ui_elements(
+    displaysurface, P1, FramePerSec, font, speedrun_timer=None, hud=None
+):
     """Draw UI elements like FPS, player position, health, etc."""
     # FPS counter
     # fps = int(FramePerSec.get_fps())
@@ -571,7 +581,11 @@ def draw_ui_elements(displaysurface, P1, FramePerSec, font, speedrun_timer=None)
     # )
     # displaysurface.blit(pos_text, (10, 40))
 
-    # Player UI elements
+    # Player UI elements, composited by the HUD when available
+    if hud:
+        hud.draw(displaysurface, P1, speedrun_timer)
+        return
+
     P1.draw_dash_cooldown_bar(displaysurface)
     P1.draw_lives(displaysurface)
     P1.draw_coins(displaysurface)
@@ -601,9 +615,8 @@ def handle_death_screen(
 
     # Display death image
     if death_image:
-        scaled_image = pygame.transform.scale(death_image, (WIDTH, HEIGHT))
-        image_rect = scaled_image.get_rect(center=(WIDTH // 2, HEIGHT // 2))
-        displaysurface.blit(scaled_image, image_rect)
+        image_rect = death_image.get_rect(center=(WIDTH // 2, HEIGHT // 2))
+        displaysurface.blit(death_image, image_rect)
 
     # Update death timer
     death_timer += dt
@@ -615,7 +628,7 @@ def handle_death_screen(
             P1, platforms, all_sprites, background, checkpoints, collectibles = (
                 reset_game_with_checkpoint(level_file, game_resources)
             )
-            projectiles = pygame.sprite.Group()
+            projectiles = game_resources.projectile_pool
             return {
                 "action": "restart_level",
                 "death_timer": 0,
@@ -629,7 +642,19 @@ def handle_death_screen(
                 "projectiles": projectiles,
             }
         else:
-            if hasattr(game_resources, "infinite_mode_db"):
+            if (
+                hasattr(game_resources, "infinite_mode")
+                and game_resources.infinite_mode
+                and hasattr(game_resources, "infinite_mode_db")
+            ):
+                run_seed = None
+                infinite_manager = game_resources.infinite_manager
+                if infinite_manager:
+                    run_seed = infinite_manager.run_seed
+                    print(
+                        f"Infinite run ended at level {infinite_manager.current_level}"
+                        f" (seed {run_seed})"
+                    )
                 # Save score to database
                 game_resources.infinite_mode_db.add_score("player", P1.coins * 10)
                 # Get all scores from the database
@@ -641,7 +666,8 @@ def handle_death_screen(
                     total = 0
                     for i in range(len(all_scores)):
                         total += all_scores[i][1]
-                    leaderboard_db.add_score("player", total)
+                    # The seed is saved with the score, so the run can be replayed
+                    leaderboard_db.add_score("player", total, run_seed)
 
             # Return to menu
             if hasattr(game_resources, "infinite_mode"):
@@ -659,6 +685,7 @@ def handler():
     """Main function that handles the game flow"""
     # Game state constants
     MENU, PLAYING, INFINITE, LEADERBOARD, DEATH_SCREEN, INSTRUCTIONS = 0, 1, 2, 3, 4, 5
+    CUTSCENE = 6
     previous_state = None
 
     # Initialize game resources and states
@@ -687,212 +714,72 @@ def handler():
     level_editor = None
     speedrun_timer = None
 
+    # State shown once the current cutscene is over
+    state_after_cutscene = MENU
+
+    # Static screen drawn on the previous frame, for dirty-rect updates
+    last_static_screen = None
+    last_displaysurface = None
+    dirty_rects = None
+
     # Main game loop
     running = True
     while running:
         try:
+            frame_profiler.begin_frame()
+
             # Get delta time
             dt = game_resources.FramePerSec.get_time() / 1000.0
 
-            # Get events
-            try:
-                events = pygame.event.get()
-            except Exception as e:
-                print(f"Error while getting events: {e}")
-                pygame.joystick.quit()
-                pygame.joystick.init()
-                events = []
-                continue
-
-            # Process events
-            for event in events:
-                # Process system events (quit, resolution changes, etc.)
-                (
-                    current_state,
-                    game_resources.fullscreen,
-                    displaysurface,
-                    game_resources.ORIGINAL_WIDTH,
-                    game_resources.ORIGINAL_HEIGHT,
-                ) = handle_system_events(
-                    event,
-                    current_state,
-                    game_resources.fullscreen,
-                    displaysurface,
-                    game_resources.ORIGINAL_WIDTH,
-                    game_resources.ORIGINAL_HEIGHT,
-                )
-
-                # Process game events based on current state
-                if current_state == MENU:
-                    # Handle menu interactions
-                    result = handle_menu_events(
-                        event,
+            with frame_profiler.section("events"):
+                # Get events
+                try:
+                    events = pygame.event.get()
+                except Exception as e:
+                    print(f"Error while getting events: {e}")
+                    pygame.joystick.quit()
+                    pygame.joystick.init()
+                    events = []
+                    continue
+
+                # Process events
+                for event in events:
+                    # Process system events (quit, resolution changes, etc.)
+                    (
                         current_state,
-                        current_menu,
-                        main_menu,
-                        level_select_menu,
-                        game_resources,
-                        level_file,
-                    )
-
-                    current_state, current_menu, level_select_menu, level_file = result[
-                        :4
-                    ]
-                    if result[4]:  # If level has been selected
-                        (
-                            P1,
-                            PT1,
-                            platforms,
-                            all_sprites,
-                            background,
-                            checkpoints,
-                            exits,
-                            collectibles,
-                        ) = result[4:12]
-                        projectiles = result[12]
-                        editor_select_menu = result[13]
-                        speedrun_timer = result[14]
-
-                elif current_state == LEADERBOARD:
-                    current_state = handle_leaderboard_events(
-                        event, current_state, leaderboard
-                    )
-
-                elif current_state == "editor_select":
-                    # Create editor_select_menu if it doesn't exist
-                    if editor_select_menu is None:
-                        editor_select_menu = LevelEditorSelectionMenu(game_resources)
-
-                    current_state, current_menu, level_editor = handle_editor_events(
+                        game_resources.fullscreen,
+                        displaysurface,
+                        game_resources.ORIGINAL_WIDTH,
+                        game_resources.ORIGINAL_HEIGHT,
+                    ) = handle_system_events(
                         event,
                         current_state,
-                        editor_select_menu,
-                        current_menu,
-                        game_resources,
+                        game_resources.fullscreen,
+                        displaysurface,
+                        game_resources.ORIGINAL_WIDTH,
+                        game_resources.ORIGINAL_HEIGHT,
                     )
 
-                elif current_state == "level_editor":
-                    if level_editor is not None:
-                        result = level_editor.handle_event(event)
-                        if result == "back_to_levels":
-                            current_state = "editor_select"
-                            if editor_select_menu is None:
-                                editor_select_menu = LevelEditorSelectionMenu(
-                                    game_resources
-                                )
-
-                elif current_state == INSTRUCTIONS:
-                    for event in events:
-                        result = instructions_screen.handle_event(event)
-                        if result == "menu":
-                            current_state = MENU
-                    instructions_screen.draw(displaysurface)
-
-                # Process general game events (player death, projectiles, etc.)
-                if event.type == USEREVENT:
-                    current_state, death_timer, checkpoint_data, projectiles = (
-                        handle_game_events(
+                    # Process game events based on current state
+                    if current_state == MENU:
+                        # Handle menu interactions
+                        result = handle_menu_events(
                             event,
                             current_state,
-                            death_timer,
-                            death_sound,
-                            level_file,
+                            current_menu,
+                            main_menu,
+                            level_select_menu,
                             game_resources,
-                            projectiles,
+                            level_file,
                         )
-                    )
-
-                elif event.type == pygame.USEREVENT + 2:
-                    if hasattr(P1, "active_jump_boost") and P1.active_jump_boost:
-                        P1.jump_power = P1.active_jump_boost["original_power"]
-                        P1.jump_boost_active = False
-                        P1.active_jump_boost = None
-
-                elif event.type == pygame.USEREVENT + 3:  # Speed boost expiration
-                    if hasattr(P1, "active_speed_boost") and P1.active_speed_boost:
-                        # Restore original movement speed
-                        game_resources.ACC = P1.active_speed_boost["original_ACC"]
-                        # Remove visual feedback
-                        P1.speed_boost_active = False
-                        # Clear boost data
-                        P1.active_speed_boost = None
-
-            # Clear screen
-            displaysurface.fill((0, 0, 0))
-
-            # Update and render based on current state
-            if current_state == MENU:
-                if current_menu == "main":
-                    main_menu.draw(displaysurface)
-                elif current_menu == "level_select":
-                    if level_select_menu is None:
-                        level_select_menu = LevelSelectMenu(game_resources)
-                    level_select_menu.draw(displaysurface)
-
-            elif current_state == "editor_select":
-                if editor_select_menu is None:
-                    editor_select_menu = LevelEditorSelectionMenu(game_resources)
-                editor_select_menu.draw(displaysurface)
-
-            elif current_state == "level_editor":
-                if level_editor is not None:
-                    level_editor.draw(displaysurface)
-
-            elif current_state == LEADERBOARD:
-                if previous_state != "LEADERBOARD":
-                    leaderboard.refresh_scores(previous_state)
-                    previous_state = "LEADERBOARD"
-                leaderboard.draw(displaysurface)
-
-            elif current_state == PLAYING:
-                previous_state = "PLAYING"
-                # Update game state
-                update_playing_state(
-                    P1,
-                    platforms,
-                    projectiles,
-                    game_resources.WIDTH,
-                    game_resources.HEIGHT,
-                    camera,
-                    all_sprites,
-                )
-
-                if speedrun_timer:
-                    speedrun_timer.update()
-
-                # Draw game state and process exit collisions
-                exit_result = draw_playing_state(
-                    displaysurface,
-                    background,
-                    all_sprites,
-                    P1,
-                    camera,
-                    game_resources.WIDTH,
-                    game_resources.HEIGHT,
-                    game_resources.font,
-                    projectiles,
-                    checkpoints,
-                    exits,
-                    collectibles,
-                    game_resources,
-                    level_file,
-                    game_resources.FramePerSec,
-                    speedrun_timer,
-                )
 
-                # Handle level exit result
-                if exit_result:
-                    if exit_result.get("action") == "return_to_level_select":
-                        current_state = exit_result["current_state"]
-                        current_menu = exit_result["current_menu"]
-                        level_select_menu = LevelSelectMenu(game_resources)
-                    elif exit_result.get("action") == "continue_infinite":
-                        # Récupérer le résultat du handle_exit_collision
-                        infinite_result = exit_result["result"]
-                        # Utiliser le résultat pour continuer en mode infini
-                        if infinite_result:
-                            # Utiliser les valeurs retournées par handle_exit_collision
-                            # Adapter selon la structure du tuple retourné
+                        (
+                            current_state,
+                            current_menu,
+                            level_select_menu,
+                            level_file,
+                        ) = result[:4]
+                        if result[4]:  # If level has been selected
                             (
                                 P1,
                                 PT1,
@@ -902,64 +789,269 @@ def handler():
                                 checkpoints,
                                 exits,
                                 collectibles,
-                            ) = infinite_result
-
-            elif current_state == INFINITE:
-                previous_state = "INFINITE"
-                # Start infinite mode and switch to playing
-                (
-                    P1,
-                    PT1,
-                    platforms,
-                    all_sprites,
-                    background,
-                    checkpoints,
-                    exits,
-                    collectibles,
-                ) = start_infinite_mode(game_resources)
-                current_state = PLAYING
-
-            elif current_state == DEATH_SCREEN:
-                # Handle death screen
-                death_result = handle_death_screen(
-                    P1,
-                    displaysurface,
-                    death_timer,
-                    dt,
-                    death_image,
-                    death_display_time,
-                    checkpoint_data,
-                    level_file,
-                    game_resources,
-                    game_resources.WIDTH,
-                    game_resources.HEIGHT,
-                    leaderboard_db,
-                )
+                            ) = result[4:12]
+                            projectiles = result[12]
+                            editor_select_menu = result[13]
+                            speedrun_timer = result[14]
+
+                    elif current_state == LEADERBOARD:
+                        current_state = handle_leaderboard_events(
+                            event, current_state, leaderboard
+                        )
 
-                death_timer = death_result["death_timer"]
+                    elif current_state == "editor_select":
+                        # Create editor_select_menu if it doesn't exist
+                        if editor_select_menu is None:
+                            editor_select_menu = LevelEditorSelectionMenu(
+                                game_resources
+                            )
+
+                        current_state, current_menu, level_editor = (
+                            handle_editor_events(
+                                event,
+                                current_state,
+                                editor_select_menu,
+                                current_menu,
+                                game_resources,
+                            )
+                        )
 
-                if death_result["action"] == "restart_level":
-                    current_state = death_result["current_state"]
-                    P1 = death_result["P1"]
-                    platforms = death_result["platforms"]
-                    all_sprites = death_result["all_sprites"]
-                    background = death_result["background"]
-                    checkpoints = death_result["checkpoints"]
-                    collectibles = death_result["collectibles"]
-                    projectiles = death_result["projectiles"]
+                    elif current_state == "level_editor":
+                        if level_editor is not None:
+                            result = level_editor.handle_event(event)
+                            if result == "back_to_levels":
+                                current_state = "editor_select"
+                                if editor_select_menu is None:
+                                    editor_select_menu = LevelEditorSelectionMenu(
+                                        game_resources
+                                    )
+
+                    elif current_state == INSTRUCTIONS:
+                        for event in events:
+                            result = instructions_screen.handle_event(event)
+                            if result == "menu":
+                                current_state = MENU
+
+                    elif current_state == CUTSCENE:
+                        # Any key but F3 and F11, or a joystick button, skips the
+                        # video or the cinematic
+                        if (
+                            event.type == KEYDOWN and event.key not in (K_F3, K_F11)
+                        ) or event.type == pygame.JOYBUTTONDOWN:
+                            game_resources.cutscene.skip()
+
+                    # Process general game events (player death, etc.)
+                    if event.type == USEREVENT:
+                        current_state, death_timer, checkpoint_data = (
+                            handle_game_events(
+                                event,
+                                current_state,
+                                death_timer,
+                                death_sound,
+                                level_file,
+                                game_resources,
+                            )
+                        )
 
-                elif death_result["action"] == "return_to_menu":
-                    current_state = death_result["current_state"]
+                    elif event.type == pygame.USEREVENT + 2:
+                        if hasattr(P1, "active_jump_boost") and P1.active_jump_boost:
+                            P1.jump_power = P1.active_jump_boost["original_power"]
+                            P1.jump_boost_active = False
+                            P1.active_jump_boost = None
+
+                    elif event.type == pygame.USEREVENT + 3:  # Speed boost expiration
+                        if hasattr(P1, "active_speed_boost") and P1.active_speed_boost:
+                            # Restore original movement speed
+                            game_resources.ACC = P1.active_speed_boost["original_ACC"]
+                            # Remove visual feedback
+                            P1.speed_boost_active = False
+                            # Clear boost data
+                            P1.active_speed_boost = None
+
+            # An exit video or a level cinematic was started, show it before the next screen
+            if game_resources.cutscene is not None and current_state != CUTSCENE:
+                state_after_cutscene = current_state
+                current_state = CUTSCENE
+                # Time spent watching does not count in the speedrun
+                if speedrun_timer:
+                    speedrun_timer.pause()
 
-            elif current_state == INSTRUCTIONS:
-                for event in events:
-                    result = instructions_screen.handle_event(event)
-                    if result == "menu":
-                        current_state = MENU
-                instructions_screen.draw(displaysurface)
+            with frame_profiler.section("draw"):
+                # Menus and other static screens only redraw what changed
+                static_screen = None
+                if current_state == MENU:
+                    if current_menu == "main":
+                        static_screen = main_menu
+                    elif current_menu == "level_select":
+                        if level_select_menu is None:
+                            level_select_menu = LevelSelectMenu(game_resources)
+                        static_screen = level_select_menu
+
+                elif current_state == "editor_select":
+                    if editor_select_menu is None:
+                        editor_select_menu = LevelEditorSelectionMenu(game_resources)
+                    static_screen = editor_select_menu
+
+                elif current_state == LEADERBOARD:
+                    if previous_state != "LEADERBOARD":
+                        leaderboard.refresh_scores()
+                        previous_state = "LEADERBOARD"
+                    static_screen = leaderboard
+
+                elif current_state == INSTRUCTIONS:
+                    for event in events:
+                        result = instructions_screen.handle_event(event)
+                        if result == "menu":
+                            current_state = MENU
+                    static_screen = instructions_screen
+
+                if static_screen is not None:
+                    # A screen shown again, a new window or the F3 overlay need a full redraw
+                    if (
+                        static_screen is not last_static_screen
+                        or displaysurface is not last_displaysurface
+                        or frame_profiler.overlay
+                    ):
+                        static_screen.invalidate()
+                    dirty_rects = static_screen.draw(displaysurface)
+                else:
+                    # Clear screen, the whole window is updated
+                    dirty_rects = None
+                    displaysurface.fill((0, 0, 0))
+                last_static_screen = static_screen
+                last_displaysurface = displaysurface
+
+                # Update and render based on current state
+                if current_state == "level_editor":
+                    if level_editor is not None:
+                        level_editor.draw(displaysurface)
+
+                elif current_state == PLAYING:
+                    previous_state = "PLAYING"
+                    # Update game state
+                    with frame_profiler.section("update"):
+                        update_playing_state(
+                            P1,
+                            platforms,
+                            projectiles,
+                            game_resources.WIDTH,
+                            game_resources.HEIGHT,
+                            camera,
+                            all_sprites,
+                        )
+
+                        if speedrun_timer:
+                            speedrun_timer.update()
+
+                    # Draw game state and process exit collisions
+                    exit_result = draw_playing_state(
+                        displaysurface,
+                        background,
+                        all_sprites,
+                        P1,
+                        camera,
+                        game_resources.WIDTH,
+                        game_resources.HEIGHT,
+                        game_resources.font,
+                        projectiles,
+                        checkpoints,
+                        exits,
+                        collectibles,
+                        game_resources,
+                        level_file,
+                        game_resources.FramePerSec,
+                        speedrun_timer,
+                    )
+
+                    # Handle level exit result
+                    if exit_result:
+                        if exit_result.get("action") == "return_to_level_select":
+                            current_state = exit_result["current_state"]
+                            current_menu = exit_result["current_menu"]
+                            level_select_menu = LevelSelectMenu(game_resources)
+                        elif exit_result.get("action") == "continue_infinite":
+                            # Récupérer le résultat du handle_exit_collision
+                            infinite_result = exit_result["result"]
+                            # Utiliser le résultat pour continuer en mode infini
+                            if infinite_result:
+                                # Utiliser les valeurs retournées par handle_exit_collision
+                                # Adapter selon la structure du tuple retourné
+                                (
+                                    P1,
+                                    PT1,
+                                    platforms,
+                                    all_sprites,
+                                    background,
+                                    checkpoints,
+                                    exits,
+                                    collectibles,
+                                ) = infinite_result
+
+                elif current_state == CUTSCENE:
+                    if game_resources.cutscene.update(displaysurface):
+                        game_resources.cutscene.close()
+                        game_resources.cutscene = None
+                        current_state = state_after_cutscene
+                        if speedrun_timer:
+                            speedrun_timer.resume()
+
+                elif current_state == INFINITE:
+                    previous_state = "INFINITE"
+                    # Start infinite mode and switch to playing
+                    (
+                        P1,
+                        PT1,
+                        platforms,
+                        all_sprites,
+                        background,
+                        checkpoints,
+                        exits,
+                        collectibles,
+                    ) = start_infinite_mode(game_resources)
+                    current_state = PLAYING
+
+                elif current_state == DEATH_SCREEN:
+                    # Handle death screen
+                    death_result = handle_death_screen(
+                        P1,
+                        displaysurface,
+                        death_timer,
+                        dt,
+                        death_image,
+                        death_display_time,
+                        checkpoint_data,
+                        level_file,
+                        game_resources,
+                        game_resources.WIDTH,
+                        game_resources.HEIGHT,
+                        leaderboard_db,
+                    )
 
-            # Update display
-            pygame.display.update()
+                    death_timer = death_result["death_timer"]
+
+                    if death_result["action"] == "restart_level":
+                        current_state = death_result["current_state"]
+                        P1 = death_result["P1"]
+                        platforms = death_result["platforms"]
+                        all_sprites = death_result["all_sprites"]
+                        background = death_result["background"]
+                        checkpoints = death_result["checkpoints"]
+                        collectibles = death_result["collectibles"]
+                        projectiles = death_result["projectiles"]
+
+                    elif death_result["action"] == "return_to_menu":
+                        current_state = death_result["current_state"]
+
+            # Frame time overlay (F3)
+            frame_profiler.draw_overlay(displaysurface, game_resources.font)
+
+            # Update display, only the changed areas of static screens
+            with frame_profiler.section("flip"):
+                if dirty_rects is None:
+                    pygame.display.update()
+                elif dirty_rects:
+                    pygame.display.update(dirty_rects)
+            frame_profiler.end_frame()
             game_resources.FramePerSec.tick(game_resources.FPS)
 
         except Exception as e: